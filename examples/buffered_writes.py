@@ -1,30 +1,27 @@
 """Buffered writes example - for high-throughput ingestion."""
 
-import random
 import time
 
+import numpy as np
+
 from arc_client import ArcClient
 
+HOSTS = np.array(["web-01", "web-02", "web-03", "db-01", "db-02"])
+
 
-def generate_metrics(count: int):
-    """Generate simulated metrics."""
+def generate_metrics(count: int) -> dict[str, np.ndarray]:
+    """Generate simulated metrics as NumPy columns in one vectorized pass."""
+    rng = np.random.default_rng()
     base_time = int(time.time() * 1_000_000)  # microseconds
-    hosts = ["web-01", "web-02", "web-03", "db-01", "db-02"]
-
-    for i in range(count):
-        yield {
-            "measurement": "system_metrics",
-            "tags": {
-                "host": random.choice(hosts),
-                "datacenter": "us-east-1",
-            },
-            "fields": {
-                "cpu_usage": random.uniform(10, 90),
-                "memory_usage": random.uniform(30, 80),
-                "disk_io": random.uniform(0, 100),
-            },
-            "timestamp": base_time + (i * 1000),  # 1ms apart
-        }
+
+    return {
+        "time": base_time + np.arange(count, dtype=np.int64) * 1000,  # 1ms apart
+        "host": HOSTS[rng.integers(0, len(HOSTS), count)],
+        "datacenter": np.full(count, "us-east-1"),
+        "cpu_usage": rng.uniform(10, 90, count),
+        "memory_usage": rng.uniform(30, 80, count),
+        "disk_io": rng.uniform(0, 100, count),
+    }
 
 
 def main():
@@ -33,21 +30,17 @@ def main():
         # Use buffered writer for automatic batching
         # - batch_size: flush after N records
         # - flush_interval: flush after N seconds (even if batch not full)
-        with client.write.buffered(batch_size=5000, flush_interval=2.0) as buffer:
+        # - max_pending_flushes: send up to N batches from background threads
+        with client.write.buffered(
+            batch_size=5000, flush_interval=2.0, max_pending_flushes=4
+        ) as buffer:
             start = time.time()
-            count = 0
-
-            for metric in generate_metrics(50_000):
-                buffer.write(
-                    measurement=metric["measurement"],
-                    tags=metric["tags"],
-                    fields=metric["fields"],
-                    timestamp=metric["timestamp"],
-                )
-                count += 1
-
-                if count % 10_000 == 0:
-                    print(f"Queued {count} records...")
+
+            metrics = generate_metrics(50_000)
+            count = len(metrics["time"])
+
+            # The whole chunk goes through the columnar path in a single call
+            buffer.write_columns("system_metrics", metrics)
 
             # Buffer auto-flushes on exit
 
@@ -5,16 +5,20 @@ from arc_client import ArcClient
 
 def pandas_example(client: ArcClient):
     """Demonstrate pandas integration."""
+    import numpy as np
     import pandas as pd
 
-    # Create a DataFrame
+    # Create a DataFrame from NumPy arrays rather than Python lists; numpy-backed
+    # columns convert to Arrow without copying
+    # (https://arrow.apache.org/docs/python/pandas.html#zero-copy-series-conversions)
+    n = 100
     df = pd.DataFrame(
         {
-            "time": pd.date_range("2024-01-01", periods=100, freq="1min"),
-            "host": ["server-01"] * 50 + ["server-02"] * 50,
-            "region": ["us-east"] * 100,
-            "cpu_usage": [50 + i * 0.1 for i in range(100)],
-            "memory_mb": [1024 + i for i in range(100)],
+            "time": pd.date_range("2024-01-01", periods=n, freq="1min"),
+            "host": np.repeat(np.array(["server-01", "server-02"]), n // 2),
+            "region": np.full(n, "us-east"),
+            "cpu_usage": 50 + 0.1 * np.arange(n),
+            "memory_mb": 1024 + np.arange(n),
         }
     )
 
@@ -46,6 +50,10 @@ def polars_example(client: ArcClient):
     print("\nPolars aggregation result:")
     print(df)
 
+    # Stream Arrow batches straight into polars, with no pandas round-trip
+    df = client.query.query_polars_stream("SELECT * FROM default.server_metrics")
+    print(f"\nStreamed into polars: {df.shape}")
+
 
 def arrow_example(client: ArcClient):
     """Demonstrate PyArrow integration."""
@@ -59,6 +67,12 @@ def arrow_example(client: ArcClient):
     df = table.to_pandas()
     print(f"\nConverted to pandas: {df.shape}")
 
+    # Stream record batches as they arrive instead of buffering the result
+    rows = 0
+    for batch in client.query.query_arrow_stream("SELECT * FROM default.server_metrics"):
+        rows += batch.num_rows
+    print(f"\nStreamed {rows} rows batch by batch")
+
 
 def main():
     with ArcClient(host="localhost", token="your-token") as client:
@@ -1,5 +1,7 @@
 """Quick start example for arc-client."""
 
+import numpy as np
+
 from arc_client import ArcClient
 
 # Connect to Arc
@@ -12,7 +14,8 @@ with ArcClient(host="localhost", port=8000, token="your-token") as client:
     client.write.write_columnar(
         measurement="cpu",
         columns={
-            "time": [1704067200000000, 1704067260000000, 1704067320000000],
+            # int64 arrays are serialized in one C-level pass, not per element
+            "time": np.array([1704067200000000, 1704067260000000, 1704067320000000], dtype="int64"),
             "host": ["server01", "server01", "server01"],
             "region": ["us-east", "us-east", "us-east"],
             "usage_idle": [95.2, 94.8, 93.1],
@@ -2,11 +2,44 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import importlib
+from functools import cache
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
+from arc_client.batch import AsyncBatch
 from arc_client.config import ClientConfig
-from arc_client.http.async_http import AsyncHTTPClient
-from arc_client.models.common import HealthResponse
+from arc_client.exceptions import ArcServerError
+
+if TYPE_CHECKING:
+    from arc_client.http.async_http import AsyncHTTPClient
+    from arc_client.models.common import HealthResponse
+
+# Upper bound on ready() probes; a readiness check should fail fast
+_READY_TIMEOUT = 2.0
+
+# Sub-client property name -> (module, class), imported on first access
+_SUBCLIENTS: dict[str, tuple[str, str]] = {
+    "write": ("arc_client.ingestion.async_writer", "AsyncWriteClient"),
+    "query": ("arc_client.query.async_executor", "AsyncQueryClient"),
+    "auth": ("arc_client.auth.async_manager", "AsyncAuthClient"),
+    "retention": ("arc_client.management.async_retention", "AsyncRetentionClient"),
+    "continuous_queries": (
+        "arc_client.management.async_continuous_query",
+        "AsyncContinuousQueryClient",
+    ),
+    "delete": ("arc_client.management.async_delete", "AsyncDeleteClient"),
+}
+
+
+@cache
+def _resolve(name: str) -> Any:
+    """Import and return the sub-client class registered under name.
+
+    Cached at module level, so each module is imported once per process
+    rather than once per client instance.
+    """
+    module_name, class_name = _SUBCLIENTS[name]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 class AsyncArcClient:
@@ -39,6 +72,14 @@ class AsyncArcClient:
         compression: bool = True,
         ssl: bool = False,
         verify_ssl: bool = True,
+        compression_codec: Literal["gzip", "zstd"] = "gzip",
+        compression_level: int = 1,
+        compression_min_bytes: int = 1400,
+        http2: Optional[bool] = None,
+        pool_max_connections: int = 100,
+        pool_max_keepalive: int = 32,
+        pool_keepalive_expiry: float = 60.0,
+        point_batch_size: int = 0,
     ) -> None:
         """Initialize the async Arc client.
 
@@ -51,6 +92,19 @@ class AsyncArcClient:
             compression: Enable gzip compression for writes.
             ssl: Use HTTPS.
             verify_ssl: Verify SSL certificates.
+            compression_codec: Codec for compressed writes, "gzip" or "zstd".
+                zstd requires the zstandard package.
+            compression_level: Compression level. The default of 1 favours
+                speed over size.
+            compression_min_bytes: Send payloads smaller than this uncompressed.
+            http2: Use HTTP/2. None enables it over TLS when the h2 package is
+                installed; True on plain http uses h2c with prior knowledge.
+            pool_max_connections: Maximum number of open connections.
+            pool_max_keepalive: Maximum number of idle keep-alive connections.
+            pool_keepalive_expiry: Seconds an idle connection stays open. Keep
+                this above the usual gap between requests so connections stay warm.
+            point_batch_size: Buffer ``write_point`` calls and send them in
+                batches of up to this many points. 0 sends each point at once.
         """
         self._config = ClientConfig(
             host=host,
@@ -61,23 +115,40 @@ class AsyncArcClient:
             compression=compression,
             ssl=ssl,
             verify_ssl=verify_ssl,
+            compression_codec=compression_codec,
+            compression_level=compression_level,
+            compression_min_bytes=compression_min_bytes,
+            http2=http2,
+            pool_max_connections=pool_max_connections,
+            pool_max_keepalive=pool_max_keepalive,
+            pool_keepalive_expiry=pool_keepalive_expiry,
+            point_batch_size=point_batch_size,
         )
         self._http: Optional[AsyncHTTPClient] = None
+        self._ready_via_head = True
 
-        # Lazy-initialized sub-clients
-        self._write: Any = None
-        self._query: Any = None
-        self._auth: Any = None
-        self._retention: Any = None
-        self._continuous_queries: Any = None
-        self._delete: Any = None
+        # Lazy-initialized sub-clients, keyed by property name
+        self._subclients: dict[str, Any] = {}
 
     def _get_http(self) -> AsyncHTTPClient:
-        """Get or create the HTTP client."""
+        """Get or create the HTTP client.
+
+        httpx is imported here, on first use, to keep ``import arc_client`` cheap.
+        """
         if self._http is None:
+            from arc_client.http.async_http import AsyncHTTPClient
+
             self._http = AsyncHTTPClient(self._config)
         return self._http
 
+    def _get_subclient(self, name: str) -> Any:
+        """Get or create the sub-client registered under name."""
+        subclient = self._subclients.get(name)
+        if subclient is None:
+            subclient = _resolve(name)(self._get_http(), self._config)
+            self._subclients[name] = subclient
+        return subclient
+
     @property
     def config(self) -> ClientConfig:
         """Get the client configuration."""
@@ -86,56 +157,43 @@ class AsyncArcClient:
     @property
     def write(self) -> Any:
         """Get the async write client for data ingestion."""
-        if self._write is None:
-            from arc_client.ingestion.async_writer import AsyncWriteClient
-
-            self._write = AsyncWriteClient(self._get_http(), self._config)
-        return self._write
+        return self._get_subclient("write")
 
     @property
     def query(self) -> Any:
         """Get the async query client for SQL queries."""
-        if self._query is None:
-            from arc_client.query.async_executor import AsyncQueryClient
-
-            self._query = AsyncQueryClient(self._get_http(), self._config)
-        return self._query
+        return self._get_subclient("query")
 
     @property
     def auth(self) -> Any:
         """Get the async auth client for token management."""
-        if self._auth is None:
-            from arc_client.auth.async_manager import AsyncAuthClient
-
-            self._auth = AsyncAuthClient(self._get_http(), self._config)
-        return self._auth
+        return self._get_subclient("auth")
 
     @property
     def retention(self) -> Any:
         """Get the async retention client for policy management."""
-        if self._retention is None:
-            from arc_client.management.async_retention import AsyncRetentionClient
-
-            self._retention = AsyncRetentionClient(self._get_http(), self._config)
-        return self._retention
+        return self._get_subclient("retention")
 
     @property
     def continuous_queries(self) -> Any:
         """Get the async continuous queries client."""
-        if self._continuous_queries is None:
-            from arc_client.management.async_continuous_query import AsyncContinuousQueryClient
-
-            self._continuous_queries = AsyncContinuousQueryClient(self._get_http(), self._config)
-        return self._continuous_queries
+        return self._get_subclient("continuous_queries")
 
     @property
     def delete(self) -> Any:
         """Get the async delete client for data deletion."""
-        if self._delete is None:
-            from arc_client.management.async_delete import AsyncDeleteClient
+        return self._get_subclient("delete")
 
-            self._delete = AsyncDeleteClient(self._get_http(), self._config)
-        return self._delete
+    def batch(self) -> AsyncBatch:
+        """Start a batch of retention, continuous query and delete calls.
+
+        Example:
+            >>> async with client.batch() as b:
+            ...     policies = b.retention.list()
+            ...     dry_run = b.delete.delete("default", "logs", "time < '2024-01-01'")
+            >>> print(len(policies.result()), dry_run.result().deleted_count)
+        """
+        return AsyncBatch(self)
 
     async def health(self) -> HealthResponse:
         """Check server health.
@@ -146,23 +204,42 @@ class AsyncArcClient:
         Raises:
             ArcConnectionError: If connection to server fails.
         """
+        from arc_client.models._fast import decode_health
+
         response = await self._get_http().get("/health")
-        return HealthResponse.model_validate(response.json())
+        return decode_health(response.content)
 
     async def ready(self) -> bool:
         """Check if server is ready to accept requests.
 
+        The probe is a HEAD request with a short timeout, so no body is
+        transferred. Servers that reject HEAD with 405 are probed with GET
+        from then on.
+
         Returns:
             True if server is ready, False otherwise.
         """
+        http = self._get_http()
+        timeout = min(self._config.timeout, _READY_TIMEOUT)
         try:
-            response = await self._get_http().get("/ready")
+            if self._ready_via_head:
+                try:
+                    response = await http.head("/ready", timeout=timeout)
+                    return response.status_code == 200
+                except ArcServerError as e:
+                    if e.status_code != 405:
+                        return False
+                    self._ready_via_head = False
+            response = await http.get("/ready", timeout=timeout)
             return response.status_code == 200
         except Exception:
             return False
 
     async def close(self) -> None:
         """Close the client and release resources."""
+        write = self._subclients.get("write")
+        if write is not None:
+            await write.close()
         if self._http is not None:
             await self._http.close()
             self._http = None
@@ -2,19 +2,68 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Optional
+import asyncio
+import functools
+import time
+from collections.abc import Awaitable, Iterable
+from typing import Any, Callable, List, Optional, TypeVar, cast
 
+import httpx
+
+from arc_client._fastjson import loads, parse
+from arc_client.auth.manager import _ACTION_SUFFIXES, _raise_from, _token_url
 from arc_client.config import ClientConfig
 from arc_client.exceptions import ArcAuthenticationError, ArcNotFoundError
 from arc_client.http.async_http import AsyncHTTPClient
+from arc_client.models._fast import decode_verify
 from arc_client.models.auth import (
     CreateTokenResponse,
-    RotateTokenResponse,
     TokenInfo,
     TokenListResponse,
     VerifyResponse,
 )
 
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# How long a verify() result is reused before asking the server again
+_VERIFY_TTL = 30.0
+
+
+async def _gather_bounded(
+    func: Callable[[int], Awaitable[T]], token_ids: Iterable[int], concurrency: int
+) -> List[T]:
+    """Run func for every token ID concurrently, at most `concurrency` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(token_id: int) -> T:
+        async with semaphore:
+            return await func(token_id)
+
+    return list(await asyncio.gather(*(_one(token_id) for token_id in token_ids)))
+
+
+def _wrap_auth_errors(message: str) -> Callable[[F], F]:
+    """Re-raise unexpected errors from a coroutine as ArcAuthenticationError.
+
+    ArcNotFoundError and ArcAuthenticationError pass through unchanged;
+    anything else is wrapped as ``"{message}: {error}"``.
+    """
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except (ArcNotFoundError, ArcAuthenticationError):
+                raise
+            except Exception as e:
+                raise ArcAuthenticationError(f"{message}: {e}") from e
+
+        return cast(F, wrapper)
+
+    return decorator
+
 
 class AsyncAuthClient:
     """Asynchronous client for authentication and token management."""
@@ -22,21 +71,34 @@ class AsyncAuthClient:
     def __init__(self, http: AsyncHTTPClient, config: ClientConfig) -> None:
         self._http = http
         self._config = config
+        self._verify_cache: Optional[tuple[float, VerifyResponse]] = None
 
+    @_wrap_auth_errors("Token verification failed")
     async def verify(self) -> VerifyResponse:
-        """Verify the current token."""
+        """Verify the current token.
+
+        Results are cached for 30 seconds since token validity rarely
+        changes mid-session. Token updates, rotations, revocations and
+        deletions made through this client clear the cache.
+        """
         if not self._config.token:
             return VerifyResponse(valid=False, error="No token configured")
 
+        if self._verify_cache is not None:
+            cached_at, cached = self._verify_cache
+            if time.monotonic() - cached_at < _VERIFY_TTL:
+                return cached
+
         try:
             response = await self._http.get("/api/v1/auth/verify")
-            data = response.json()
-            return VerifyResponse(**data)
+            result = decode_verify(response.content)
         except ArcAuthenticationError:
-            return VerifyResponse(valid=False, error="Invalid or expired token")
-        except Exception as e:
-            raise ArcAuthenticationError(f"Token verification failed: {e}") from e
+            result = VerifyResponse(valid=False, error="Invalid or expired token")
+
+        self._verify_cache = (time.monotonic(), result)
+        return result
 
+    @_wrap_auth_errors("Failed to create token")
     async def create_token(
         self,
         name: str,
@@ -53,45 +115,62 @@ class AsyncAuthClient:
         if expires_in:
             payload["expires_in"] = expires_in
 
-        try:
-            response = await self._http.post("/api/v1/auth/tokens", json=payload)
-            data = response.json()
-            return CreateTokenResponse(**data)
-        except ArcAuthenticationError:
-            raise
-        except Exception as e:
-            raise ArcAuthenticationError(f"Failed to create token: {e}") from e
+        response = await self._http.post("/api/v1/auth/tokens", json=payload)
+        return parse(response, CreateTokenResponse)
 
+    @_wrap_auth_errors("Failed to list tokens")
     async def list_tokens(self) -> List[TokenInfo]:
         """List all tokens. Requires admin permissions."""
-        try:
-            response = await self._http.get("/api/v1/auth/tokens")
-            data = response.json()
-            result = TokenListResponse(**data)
-            if not result.success:
-                raise ArcAuthenticationError(result.error or "Failed to list tokens")
-            return result.tokens
-        except ArcAuthenticationError:
-            raise
-        except Exception as e:
-            raise ArcAuthenticationError(f"Failed to list tokens: {e}") from e
+        response = await self._http.get("/api/v1/auth/tokens")
+        result = parse(response, TokenListResponse)
+        if not result.success:
+            raise ArcAuthenticationError(result.error or "Failed to list tokens")
+        return result.tokens
+
+    async def list_tokens_detailed(self, concurrency: int = 16) -> List[TokenInfo]:
+        """List all tokens with full details. Requires admin permissions.
+
+        Fetches each token's details concurrently instead of awaiting one
+        get_token() round trip after another.
+
+        Args:
+            concurrency: Maximum number of detail requests in flight.
+
+        Returns:
+            List of TokenInfo, in the order returned by list_tokens().
+        """
+        tokens = await self.list_tokens()
+        return await _gather_bounded(self.get_token, [t.id for t in tokens], concurrency)
 
+    async def _token_request(
+        self,
+        send: Callable[..., Awaitable[httpx.Response]],
+        token_id: int,
+        action: str,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Send a request for a single token and return the decoded body.
+
+        Callers wrap unexpected errors with ``_wrap_auth_errors``.
+
+        Args:
+            send: Bound HTTP method to call, e.g. ``self._http.post``.
+            token_id: Token the request targets.
+            action: ``"rotate"`` or ``"revoke"`` select the action URL.
+            **kwargs: Passed through to ``send``.
+        """
+        response = await send(_token_url(token_id, _ACTION_SUFFIXES.get(action, "")), **kwargs)
+        data: dict[str, Any] = loads(response.content)
+        _raise_from(data, token_id)
+        return data
+
+    @_wrap_auth_errors("Failed to get token")
     async def get_token(self, token_id: int) -> TokenInfo:
         """Get token details by ID. Requires admin permissions."""
-        try:
-            response = await self._http.get(f"/api/v1/auth/tokens/{token_id}")
-            data = response.json()
-            if not data.get("success", True):
-                error = data.get("error", "Unknown error")
-                if "not found" in error.lower():
-                    raise ArcNotFoundError(f"Token {token_id} not found")
-                raise ArcAuthenticationError(error)
-            return TokenInfo(**data["token"])
-        except (ArcNotFoundError, ArcAuthenticationError):
-            raise
-        except Exception as e:
-            raise ArcAuthenticationError(f"Failed to get token: {e}") from e
+        data = await self._token_request(self._http.get, token_id, "get")
+        return TokenInfo.model_validate(data["token"])
 
+    @_wrap_auth_errors("Failed to update token")
     async def update_token(
         self,
         token_id: int,
@@ -111,64 +190,39 @@ class AsyncAuthClient:
         if expires_in is not None:
             payload["expires_in"] = expires_in
 
-        try:
-            response = await self._http.patch(f"/api/v1/auth/tokens/{token_id}", json=payload)
-            data = response.json()
-            if not data.get("success", True):
-                error = data.get("error", "Unknown error")
-                if "not found" in error.lower():
-                    raise ArcNotFoundError(f"Token {token_id} not found")
-                raise ArcAuthenticationError(error)
-        except (ArcNotFoundError, ArcAuthenticationError):
-            raise
-        except Exception as e:
-            raise ArcAuthenticationError(f"Failed to update token: {e}") from e
+        self._verify_cache = None
+        await self._token_request(self._http.patch, token_id, "update", json=payload)
 
+    @_wrap_auth_errors("Failed to delete token")
     async def delete_token(self, token_id: int) -> None:
         """Delete a token. Requires admin permissions."""
-        try:
-            response = await self._http.delete(f"/api/v1/auth/tokens/{token_id}")
-            data = response.json()
-            if not data.get("success", True):
-                error = data.get("error", "Unknown error")
-                if "not found" in error.lower():
-                    raise ArcNotFoundError(f"Token {token_id} not found")
-                raise ArcAuthenticationError(error)
-        except (ArcNotFoundError, ArcAuthenticationError):
-            raise
-        except Exception as e:
-            raise ArcAuthenticationError(f"Failed to delete token: {e}") from e
+        self._verify_cache = None
+        await self._token_request(self._http.delete, token_id, "delete")
 
+    @_wrap_auth_errors("Failed to rotate token")
     async def rotate_token(self, token_id: int) -> str:
         """Rotate a token and return the new value. Requires admin permissions."""
-        try:
-            response = await self._http.post(f"/api/v1/auth/tokens/{token_id}/rotate")
-            data = response.json()
-            result = RotateTokenResponse(**data)
-            if not result.success:
-                error = result.error or "Unknown error"
-                if "not found" in error.lower():
-                    raise ArcNotFoundError(f"Token {token_id} not found")
-                raise ArcAuthenticationError(error)
-            if not result.new_token:
-                raise ArcAuthenticationError("No new token returned")
-            return result.new_token
-        except (ArcNotFoundError, ArcAuthenticationError):
-            raise
-        except Exception as e:
-            raise ArcAuthenticationError(f"Failed to rotate token: {e}") from e
-
+        self._verify_cache = None
+        data = await self._token_request(self._http.post, token_id, "rotate")
+        new_token = data.get("new_token")
+        if not new_token:
+            raise ArcAuthenticationError("No new token returned")
+        return str(new_token)
+
+    async def bulk_rotate(self, token_ids: Iterable[int], concurrency: int = 16) -> List[str]:
+        """Rotate several tokens concurrently. Requires admin permissions.
+
+        Args:
+            token_ids: IDs of the tokens to rotate.
+            concurrency: Maximum number of rotate requests in flight.
+
+        Returns:
+            The new token values, in the same order as token_ids.
+        """
+        return await _gather_bounded(self.rotate_token, token_ids, concurrency)
+
+    @_wrap_auth_errors("Failed to revoke token")
     async def revoke_token(self, token_id: int) -> None:
         """Revoke a token. Requires admin permissions."""
-        try:
-            response = await self._http.post(f"/api/v1/auth/tokens/{token_id}/revoke")
-            data = response.json()
-            if not data.get("success", True):
-                error = data.get("error", "Unknown error")
-                if "not found" in error.lower():
-                    raise ArcNotFoundError(f"Token {token_id} not found")
-                raise ArcAuthenticationError(error)
-        except (ArcNotFoundError, ArcAuthenticationError):
-            raise
-        except Exception as e:
-            raise ArcAuthenticationError(f"Failed to revoke token: {e}") from e
+        self._verify_cache = None
+        await self._token_request(self._http.post, token_id, "revoke")
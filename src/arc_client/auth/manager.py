@@ -2,19 +2,46 @@
 
 from __future__ import annotations
 
-from typing import Any, List, Optional
+import re
+from typing import Any, Callable, List, Optional
 
+import httpx
+
+from arc_client._fastjson import loads, parse
 from arc_client.config import ClientConfig
 from arc_client.exceptions import ArcAuthenticationError, ArcNotFoundError
 from arc_client.http.sync_http import SyncHTTPClient
 from arc_client.models.auth import (
     CreateTokenResponse,
-    RotateTokenResponse,
     TokenInfo,
     TokenListResponse,
     VerifyResponse,
 )
 
+_TOKENS_BASE = "/api/v1/auth/tokens/"
+_ACTION_SUFFIXES = {"rotate": "/rotate", "revoke": "/revoke"}
+_NOT_FOUND_RE = re.compile(r"not\s*found", re.IGNORECASE)
+
+
+def _token_url(token_id: int, suffix: str = "") -> str:
+    """Build the URL for a single token, e.g. ``/api/v1/auth/tokens/42/rotate``."""
+    return "".join((_TOKENS_BASE, str(token_id), suffix))
+
+
+def _raise_from(data: dict[str, Any], token_id: int) -> None:
+    """Raise the matching exception if a token response reports failure.
+
+    Raises:
+        ArcNotFoundError: If the server says the token does not exist.
+        ArcAuthenticationError: For any other reported failure.
+    """
+    if data.get("success", True):
+        return
+    error = data.get("error") or "Unknown error"
+    if _NOT_FOUND_RE.search(error):
+        raise ArcNotFoundError(f"Token {token_id} not found")
+    raise ArcAuthenticationError(error)
+
 
 class AuthClient:
     """Synchronous client for authentication and token management.
@@ -42,8 +69,7 @@ class AuthClient:
 
         try:
             response = self._http.get("/api/v1/auth/verify")
-            data = response.json()
-            return VerifyResponse(**data)
+            return parse(response, VerifyResponse)
         except ArcAuthenticationError:
             return VerifyResponse(valid=False, error="Invalid or expired token")
         except Exception as e:
@@ -67,8 +93,7 @@ class AuthClient:
 
         try:
             response = self._http.post("/api/v1/auth/tokens", json=payload)
-            data = response.json()
-            return CreateTokenResponse(**data)
+            return parse(response, CreateTokenResponse)
         except ArcAuthenticationError:
             raise
         except Exception as e:
@@ -78,8 +103,7 @@ class AuthClient:
         """List all tokens. Requires admin permissions."""
         try:
             response = self._http.get("/api/v1/auth/tokens")
-            data = response.json()
-            result = TokenListResponse(**data)
+            result = parse(response, TokenListResponse)
             if not result.success:
                 raise ArcAuthenticationError(result.error or "Failed to list tokens")
             return result.tokens
@@ -88,19 +112,32 @@ class AuthClient:
         except Exception as e:
             raise ArcAuthenticationError(f"Failed to list tokens: {e}") from e
 
-    def get_token(self, token_id: int) -> TokenInfo:
-        """Get token details by ID. Requires admin permissions."""
+    def _token_request(
+        self, send: Callable[..., httpx.Response], token_id: int, action: str, **kwargs: Any
+    ) -> dict[str, Any]:
+        """Send a request for a single token and return the decoded body.
+
+        Args:
+            send: Bound HTTP method to call, e.g. ``self._http.post``.
+            token_id: Token the request targets.
+            action: Verb used in error messages and, for rotate/revoke, the URL.
+            **kwargs: Passed through to ``send``.
+        """
+        suffix = _ACTION_SUFFIXES.get(action, "")
         try:
-            response = self._http.get(f"/api/v1/auth/tokens/{token_id}")
-            data = response.json()
-            if not data.get("success", True):
-                error = data.get("error", "Unknown error")
-                if "not found" in error.lower():
-                    raise ArcNotFoundError(f"Token {token_id} not found")
-                raise ArcAuthenticationError(error)
-            return TokenInfo(**data["token"])
+            data: dict[str, Any] = loads(send(_token_url(token_id, suffix), **kwargs).content)
+            _raise_from(data, token_id)
+            return data
         except (ArcNotFoundError, ArcAuthenticationError):
             raise
+        except Exception as e:
+            raise ArcAuthenticationError(f"Failed to {action} token: {e}") from e
+
+    def get_token(self, token_id: int) -> TokenInfo:
+        """Get token details by ID. Requires admin permissions."""
+        data = self._token_request(self._http.get, token_id, "get")
+        try:
+            return TokenInfo.model_validate(data["token"])
         except Exception as e:
             raise ArcAuthenticationError(f"Failed to get token: {e}") from e
 
@@ -123,64 +160,20 @@ class AuthClient:
         if expires_in is not None:
             payload["expires_in"] = expires_in
 
-        try:
-            response = self._http.patch(f"/api/v1/auth/tokens/{token_id}", json=payload)
-            data = response.json()
-            if not data.get("success", True):
-                error = data.get("error", "Unknown error")
-                if "not found" in error.lower():
-                    raise ArcNotFoundError(f"Token {token_id} not found")
-                raise ArcAuthenticationError(error)
-        except (ArcNotFoundError, ArcAuthenticationError):
-            raise
-        except Exception as e:
-            raise ArcAuthenticationError(f"Failed to update token: {e}") from e
+        self._token_request(self._http.patch, token_id, "update", json=payload)
 
     def delete_token(self, token_id: int) -> None:
         """Delete a token. Requires admin permissions."""
-        try:
-            response = self._http.delete(f"/api/v1/auth/tokens/{token_id}")
-            data = response.json()
-            if not data.get("success", True):
-                error = data.get("error", "Unknown error")
-                if "not found" in error.lower():
-                    raise ArcNotFoundError(f"Token {token_id} not found")
-                raise ArcAuthenticationError(error)
-        except (ArcNotFoundError, ArcAuthenticationError):
-            raise
-        except Exception as e:
-            raise ArcAuthenticationError(f"Failed to delete token: {e}") from e
+        self._token_request(self._http.delete, token_id, "delete")
 
     def rotate_token(self, token_id: int) -> str:
         """Rotate a token and return the new value. Requires admin permissions."""
-        try:
-            response = self._http.post(f"/api/v1/auth/tokens/{token_id}/rotate")
-            data = response.json()
-            result = RotateTokenResponse(**data)
-            if not result.success:
-                error = result.error or "Unknown error"
-                if "not found" in error.lower():
-                    raise ArcNotFoundError(f"Token {token_id} not found")
-                raise ArcAuthenticationError(error)
-            if not result.new_token:
-                raise ArcAuthenticationError("No new token returned")
-            return result.new_token
-        except (ArcNotFoundError, ArcAuthenticationError):
-            raise
-        except Exception as e:
-            raise ArcAuthenticationError(f"Failed to rotate token: {e}") from e
+        data = self._token_request(self._http.post, token_id, "rotate")
+        new_token = data.get("new_token")
+        if not new_token:
+            raise ArcAuthenticationError("No new token returned")
+        return str(new_token)
 
     def revoke_token(self, token_id: int) -> None:
         """Revoke a token. Requires admin permissions."""
-        try:
-            response = self._http.post(f"/api/v1/auth/tokens/{token_id}/revoke")
-            data = response.json()
-            if not data.get("success", True):
-                error = data.get("error", "Unknown error")
-                if "not found" in error.lower():
-                    raise ArcNotFoundError(f"Token {token_id} not found")
-                raise ArcAuthenticationError(error)
-        except (ArcNotFoundError, ArcAuthenticationError):
-            raise
-        except Exception as e:
-            raise ArcAuthenticationError(f"Failed to revoke token: {e}") from e
+        self._token_request(self._http.post, token_id, "revoke")
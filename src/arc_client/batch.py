@@ -0,0 +1,124 @@
+"""Batched management calls for the async client."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable, List
+
+if TYPE_CHECKING:
+    from arc_client.async_client import AsyncArcClient
+
+# Sub-clients whose calls can be queued on a batch
+_BATCHABLE = ("retention", "continuous_queries", "delete")
+
+
+class _Recorder:
+    """Stand-in for a sub-client that queues calls instead of running them."""
+
+    def __init__(self, batch: AsyncBatch, target: Any) -> None:
+        self._batch = batch
+        self._target = target
+
+    def __getattr__(self, name: str) -> Callable[..., asyncio.Future[Any]]:
+        method = getattr(self._target, name)
+
+        def record(*args: Any, **kwargs: Any) -> asyncio.Future[Any]:
+            return self._batch._add(method, args, kwargs)
+
+        return record
+
+
+class AsyncBatch:
+    """Collects management calls and sends them together.
+
+    Each queued call returns a future that is resolved by ``send()``. All
+    calls are issued concurrently on the client's shared connection pool,
+    so a batch costs roughly one round-trip instead of one per call, and
+    a single multiplexed connection when HTTP/2 is available.
+
+    Calls in a batch run concurrently and in no guaranteed order, so a
+    call that needs the result of another (for example executing a policy
+    that is created in the same batch) belongs in a later batch.
+
+    Example:
+        >>> async with client.batch() as b:
+        ...     policies = b.retention.list()
+        ...     cqs = b.continuous_queries.list(database="default")
+        >>> print(policies.result(), cqs.result())
+    """
+
+    def __init__(self, client: AsyncArcClient) -> None:
+        self._client = client
+        self._calls: List[tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]] = []
+        self._futures: List[asyncio.Future[Any]] = []
+
+    @property
+    def retention(self) -> Any:
+        """Queue retention policy calls."""
+        return _Recorder(self, self._client.retention)
+
+    @property
+    def continuous_queries(self) -> Any:
+        """Queue continuous query calls."""
+        return _Recorder(self, self._client.continuous_queries)
+
+    @property
+    def delete(self) -> Any:
+        """Queue delete calls."""
+        return _Recorder(self, self._client.delete)
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _add(
+        self, method: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> asyncio.Future[Any]:
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._calls.append((method, args, kwargs))
+        self._futures.append(future)
+        return future
+
+    async def send(self, return_exceptions: bool = False) -> List[Any]:
+        """Issue all queued calls and resolve their futures.
+
+        Args:
+            return_exceptions: Return failures in the result list instead of
+                raising the first one, like ``asyncio.gather``.
+
+        Returns:
+            Results in the order the calls were queued.
+        """
+        calls, futures = self._calls, self._futures
+        self._calls, self._futures = [], []
+
+        results = await asyncio.gather(
+            *(method(*args, **kwargs) for method, args, kwargs in calls),
+            return_exceptions=True,
+        )
+        for future, result in zip(futures, results):
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+                # Surfaced through send(); don't also warn about it at GC
+                future.exception()
+            else:
+                future.set_result(result)
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+        return list(results)
+
+    async def __aenter__(self) -> AsyncBatch:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, exc_type: Any, *args: Any) -> None:
+        """Send queued calls on a clean exit, discard them otherwise."""
+        if exc_type is None:
+            if self._calls:
+                await self.send()
+        else:
+            for future in self._futures:
+                future.cancel()
+            self._calls, self._futures = [], []
@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Literal, Optional
 
 from arc_client.config import ClientConfig
-from arc_client.http.sync_http import SyncHTTPClient
-from arc_client.models.common import HealthResponse
+from arc_client.exceptions import ArcServerError
+
+if TYPE_CHECKING:
+    from arc_client.http.sync_http import SyncHTTPClient
+    from arc_client.models.common import HealthResponse
+
+# Upper bound on ready() probes; a readiness check should fail fast
+_READY_TIMEOUT = 2.0
 
 
 class ArcClient:
@@ -39,6 +45,14 @@ class ArcClient:
         compression: bool = True,
         ssl: bool = False,
         verify_ssl: bool = True,
+        compression_codec: Literal["gzip", "zstd"] = "gzip",
+        compression_level: int = 1,
+        compression_min_bytes: int = 1400,
+        http2: Optional[bool] = None,
+        pool_max_connections: int = 100,
+        pool_max_keepalive: int = 32,
+        pool_keepalive_expiry: float = 60.0,
+        point_batch_size: int = 0,
     ) -> None:
         """Initialize the Arc client.
 
@@ -51,6 +65,19 @@ class ArcClient:
             compression: Enable gzip compression for writes.
             ssl: Use HTTPS.
             verify_ssl: Verify SSL certificates.
+            compression_codec: Codec for compressed writes, "gzip" or "zstd".
+                zstd requires the zstandard package.
+            compression_level: Compression level. The default of 1 favours
+                speed over size.
+            compression_min_bytes: Send payloads smaller than this uncompressed.
+            http2: Use HTTP/2. None enables it over TLS when the h2 package is
+                installed; True on plain http uses h2c with prior knowledge.
+            pool_max_connections: Maximum number of open connections.
+            pool_max_keepalive: Maximum number of idle keep-alive connections.
+            pool_keepalive_expiry: Seconds an idle connection stays open. Keep
+                this above the usual gap between requests so connections stay warm.
+            point_batch_size: Buffer ``write_point`` calls and send them in
+                batches of up to this many points. 0 sends each point at once.
         """
         self._config = ClientConfig(
             host=host,
@@ -61,8 +88,17 @@ class ArcClient:
             compression=compression,
             ssl=ssl,
             verify_ssl=verify_ssl,
+            compression_codec=compression_codec,
+            compression_level=compression_level,
+            compression_min_bytes=compression_min_bytes,
+            http2=http2,
+            pool_max_connections=pool_max_connections,
+            pool_max_keepalive=pool_max_keepalive,
+            pool_keepalive_expiry=pool_keepalive_expiry,
+            point_batch_size=point_batch_size,
         )
         self._http: Optional[SyncHTTPClient] = None
+        self._ready_via_head = True
 
         # Lazy-initialized sub-clients
         self._write: Any = None
@@ -73,8 +109,13 @@ class ArcClient:
         self._delete: Any = None
 
     def _get_http(self) -> SyncHTTPClient:
-        """Get or create the HTTP client."""
+        """Get or create the HTTP client.
+
+        httpx is imported here, on first use, to keep ``import arc_client`` cheap.
+        """
         if self._http is None:
+            from arc_client.http.sync_http import SyncHTTPClient
+
             self._http = SyncHTTPClient(self._config)
         return self._http
 
@@ -147,22 +188,40 @@ class ArcClient:
             ArcConnectionError: If connection to server fails.
         """
         response = self._get_http().get("/health")
-        return HealthResponse.model_validate(response.json())
+        from arc_client.models._fast import decode_health
+
+        return decode_health(response.content)
 
     def ready(self) -> bool:
         """Check if server is ready to accept requests.
 
+        The probe is a HEAD request with a short timeout, so no body is
+        transferred. Servers that reject HEAD with 405 are probed with GET
+        from then on.
+
         Returns:
             True if server is ready, False otherwise.
         """
+        http = self._get_http()
+        timeout = min(self._config.timeout, _READY_TIMEOUT)
         try:
-            response = self._get_http().get("/ready")
+            if self._ready_via_head:
+                try:
+                    response = http.head("/ready", timeout=timeout)
+                    return response.status_code == 200
+                except ArcServerError as e:
+                    if e.status_code != 405:
+                        return False
+                    self._ready_via_head = False
+            response = http.get("/ready", timeout=timeout)
             return response.status_code == 200
         except Exception:
             return False
 
     def close(self) -> None:
         """Close the client and release resources."""
+        if self._write is not None:
+            self._write.close()
         if self._http is not None:
             self._http.close()
             self._http = None
@@ -2,22 +2,56 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import Any, Literal, Optional
 
-from pydantic import BaseModel, Field
 
+@dataclass(frozen=True)
+class ClientConfig:
+    """Configuration for Arc client.
 
-class ClientConfig(BaseModel):
-    """Configuration for Arc client."""
+    A plain frozen dataclass: it is built once per client and read on every
+    request, so construction and attribute access stay cheap.
 
-    host: str = Field(default="localhost", description="Arc server hostname")
-    port: int = Field(default=8000, description="Arc server port")
-    token: Optional[str] = Field(default=None, description="API token for authentication")
-    database: str = Field(default="default", description="Default database name")
-    timeout: float = Field(default=30.0, description="Request timeout in seconds")
-    compression: bool = Field(default=True, description="Enable gzip compression for writes")
-    ssl: bool = Field(default=False, description="Use HTTPS")
-    verify_ssl: bool = Field(default=True, description="Verify SSL certificates")
+    Attributes:
+        host: Arc server hostname.
+        port: Arc server port.
+        token: API token for authentication.
+        database: Default database name.
+        timeout: Request timeout in seconds.
+        compression: Enable compression for writes.
+        compression_codec: Codec used when compression is enabled.
+        compression_level: Compression level; low levels trade size for speed.
+        compression_min_bytes: Payloads smaller than this (about one MTU) are
+            sent as-is.
+        ssl: Use HTTPS.
+        verify_ssl: Verify SSL certificates.
+        http2: Use HTTP/2; None enables it when h2 is installed.
+        pool_max_connections: Maximum open connections.
+        pool_max_keepalive: Maximum idle keep-alive connections.
+        pool_keepalive_expiry: Seconds an idle connection is kept open. Keep it
+            above typical gaps between writes so proxies don't drop warm
+            connections.
+        point_batch_size: When set, ``write_point`` buffers points and sends
+            them in batches of up to this many; 0 sends each point at once.
+    """
+
+    host: str = "localhost"
+    port: int = 8000
+    token: Optional[str] = None
+    database: str = "default"
+    timeout: float = 30.0
+    compression: bool = True
+    compression_codec: Literal["gzip", "zstd"] = "gzip"
+    compression_level: int = 1
+    compression_min_bytes: int = 1400
+    ssl: bool = False
+    verify_ssl: bool = True
+    http2: Optional[bool] = None
+    pool_max_connections: int = 100
+    pool_max_keepalive: int = 32
+    pool_keepalive_expiry: float = 60.0
+    point_batch_size: int = 0
 
     @property
     def base_url(self) -> str:
@@ -25,4 +59,8 @@ class ClientConfig(BaseModel):
         scheme = "https" if self.ssl else "http"
         return f"{scheme}://{self.host}:{self.port}"
 
-    model_config = {"frozen": True}
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ClientConfig:
+        """Build a config from a mapping, ignoring unknown keys."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
@@ -1,8 +1,39 @@
-"""HTTP client implementations."""
+"""HTTP client implementations.
+
+Imported lazily on first access so that httpx is only loaded when a
+client actually needs it.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from arc_client.http.async_http import AsyncHTTPClient
+    from arc_client.http.base import HTTPClientBase
+    from arc_client.http.sync_http import SyncHTTPClient
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "AsyncHTTPClient": "arc_client.http.async_http",
+    "HTTPClientBase": "arc_client.http.base",
+    "SyncHTTPClient": "arc_client.http.sync_http",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-from arc_client.http.async_http import AsyncHTTPClient
-from arc_client.http.base import HTTPClientBase
-from arc_client.http.sync_http import SyncHTTPClient
 
 __all__ = [
     "AsyncHTTPClient",
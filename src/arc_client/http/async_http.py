@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterable, Optional, Union
 
 import httpx
 
@@ -11,6 +13,8 @@ from arc_client.http.base import (
     HTTPClientBase,
     handle_connection_error,
     handle_response_error,
+    http_versions,
+    pool_limits,
 )
 
 
@@ -22,12 +26,23 @@ class AsyncHTTPClient(HTTPClientBase):
         self._client: Optional[httpx.AsyncClient] = None
 
     def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the httpx async client."""
+        """Get or create the httpx async client.
+
+        A single client is shared by every request so connections are kept
+        alive and reused. Over TLS, HTTP/2 is enabled when the optional ``h2``
+        package is installed (or when ``http2=True``), letting concurrent
+        requests multiplex over one connection; on plain http it needs an
+        explicit ``http2=True`` and a server that accepts h2c.
+        """
         if self._client is None:
+            http1, http2 = http_versions(self.config)
             self._client = httpx.AsyncClient(
                 base_url=self._base_url,
                 timeout=self.config.timeout,
                 verify=self.config.verify_ssl,
+                http1=http1,
+                http2=http2,
+                limits=pool_limits(self.config),
             )
         return self._client
 
@@ -42,9 +57,10 @@ class AsyncHTTPClient(HTTPClientBase):
         path: str,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
     ) -> httpx.Response:
         """Make a GET request."""
-        kwargs = self._prepare_request_kwargs(headers=headers, params=params)
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
         try:
             response = await self._get_client().get(path, **kwargs)
             handle_response_error(response)
@@ -53,16 +69,37 @@ class AsyncHTTPClient(HTTPClientBase):
             handle_connection_error(e, self._build_url(path))
             raise  # Never reached, but satisfies type checker
 
+    async def head(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Make a HEAD request."""
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
+        try:
+            response = await self._get_client().head(path, **kwargs)
+            handle_response_error(response)
+            return response
+        except httpx.ConnectError as e:
+            handle_connection_error(e, self._build_url(path))
+            raise
+
     async def post(
         self,
         path: str,
         json: Optional[Any] = None,
-        content: Optional[bytes] = None,
+        content: Optional[Union[bytes, AsyncIterable[bytes]]] = None,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
     ) -> httpx.Response:
-        """Make a POST request."""
-        kwargs = self._prepare_request_kwargs(headers=headers, params=params)
+        """Make a POST request.
+
+        ``content`` may be an async iterable of bytes, which is sent chunked.
+        """
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
         if json is not None:
             kwargs["json"] = json
         if content is not None:
@@ -81,9 +118,10 @@ class AsyncHTTPClient(HTTPClientBase):
         json: Optional[Any] = None,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
     ) -> httpx.Response:
         """Make a PUT request."""
-        kwargs = self._prepare_request_kwargs(headers=headers, params=params)
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
         if json is not None:
             kwargs["json"] = json
         try:
@@ -100,9 +138,10 @@ class AsyncHTTPClient(HTTPClientBase):
         json: Optional[Any] = None,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
     ) -> httpx.Response:
         """Make a PATCH request."""
-        kwargs = self._prepare_request_kwargs(headers=headers, params=params)
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
         if json is not None:
             kwargs["json"] = json
         try:
@@ -118,9 +157,10 @@ class AsyncHTTPClient(HTTPClientBase):
         path: str,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
     ) -> httpx.Response:
         """Make a DELETE request."""
-        kwargs = self._prepare_request_kwargs(headers=headers, params=params)
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
         try:
             response = await self._get_client().delete(path, **kwargs)
             handle_response_error(response)
@@ -129,6 +169,29 @@ class AsyncHTTPClient(HTTPClientBase):
             handle_connection_error(e, self._build_url(path))
             raise
 
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Any] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """Make a request whose body is read incrementally by the caller."""
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout)
+        if json is not None:
+            kwargs["json"] = json
+        try:
+            async with self._get_client().stream(method, path, **kwargs) as response:
+                if not response.is_success:
+                    await response.aread()
+                    handle_response_error(response)
+                yield response
+        except httpx.ConnectError as e:
+            handle_connection_error(e, self._build_url(path))
+            raise
+
     async def __aenter__(self) -> AsyncHTTPClient:
         return self
 
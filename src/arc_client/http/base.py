@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import importlib.util
+from typing import Any, Optional, TypeVar
+from weakref import WeakValueDictionary
 
 import httpx
 
+from arc_client._fastjson import loads
 from arc_client.config import ClientConfig
 from arc_client.exceptions import (
     ArcAuthenticationError,
@@ -15,6 +18,60 @@ from arc_client.exceptions import (
     ArcServerError,
 )
 
+_C = TypeVar("_C", bound="HTTPClientBase")
+
+# Clients handed out by HTTPClientBase.shared(), dropped once unreferenced
+_shared_clients: WeakValueDictionary[tuple[type, ClientConfig], HTTPClientBase] = (
+    WeakValueDictionary()
+)
+
+
+def http2_available() -> bool:
+    """Return True if the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def use_http2(config: ClientConfig) -> bool:
+    """Decide whether to negotiate HTTP/2 for a client.
+
+    In auto mode (``http2=None``) HTTP/2 is only used over TLS, where it is
+    negotiated via ALPN. Plain-http servers are reached with HTTP/1.1 unless
+    HTTP/2 is requested explicitly, see ``http_versions``.
+
+    Raises:
+        ImportError: If HTTP/2 was requested explicitly but h2 is missing.
+    """
+    if config.http2 is None:
+        return config.ssl and http2_available()
+    if config.http2 and not http2_available():
+        raise ImportError(
+            "h2 is required for HTTP/2. Install it with: pip install arc-tsdb-client[http2]"
+        )
+    return config.http2
+
+
+def http_versions(config: ClientConfig) -> tuple[bool, bool]:
+    """Return the ``(http1, http2)`` flags to pass to httpx.
+
+    An explicit ``http2=True`` on a plain-http client uses HTTP/2 with prior
+    knowledge (h2c), since there is no TLS handshake to negotiate it.
+    """
+    http2 = use_http2(config)
+    return not (http2 and not config.ssl), http2
+
+
+def pool_limits(config: ClientConfig) -> httpx.Limits:
+    """Connection pool limits shared by every request a client makes.
+
+    A generous keep-alive pool lets bursts of concurrent requests reuse warm
+    TCP/TLS connections instead of paying a handshake each.
+    """
+    return httpx.Limits(
+        max_connections=config.pool_max_connections,
+        max_keepalive_connections=config.pool_max_keepalive,
+        keepalive_expiry=config.pool_keepalive_expiry,
+    )
+
 
 def build_headers(
     config: ClientConfig, extra_headers: Optional[dict[str, str]] = None
@@ -39,7 +96,7 @@ def handle_response_error(response: httpx.Response) -> None:
 
     status_code = response.status_code
     try:
-        error_body = response.json()
+        error_body = loads(response.content)
         message = error_body.get("error", error_body.get("message", response.text))
     except Exception:
         message = response.text or f"HTTP {status_code}"
@@ -69,6 +126,26 @@ class HTTPClientBase:
     def __init__(self, config: ClientConfig) -> None:
         self.config = config
         self._base_url = config.base_url
+        # The config is frozen, so the headers are fixed for the client's
+        # lifetime. Treat _base_headers as read-only: it is shared by every request.
+        self._base_headers = build_headers(config)
+
+    @classmethod
+    def shared(cls: type[_C], config: ClientConfig) -> _C:
+        """Return the client shared by every caller with an equal config.
+
+        Sub-clients built by hand, such as several management clients, can
+        use this instead of one client each so that they draw from a single
+        connection pool. The client lives while anything references it.
+        Closing it only drops the pool, which is reopened on the next
+        request. An async client must stay on one event loop.
+        """
+        key = (cls, config)
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = cls(config)
+        result: _C = client  # type: ignore[assignment]
+        return result
 
     def _build_url(self, path: str) -> str:
         """Build full URL from path."""
@@ -79,12 +156,21 @@ class HTTPClientBase:
     def _prepare_request_kwargs(
         self,
         headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
         **kwargs: Any,
     ) -> dict[str, Any]:
-        """Prepare common request kwargs."""
-        request_headers = build_headers(self.config, headers)
-        return {
-            "headers": request_headers,
-            "timeout": self.config.timeout,
-            **kwargs,
-        }
+        """Prepare common request kwargs.
+
+        The configured timeout is set once on the httpx client, so it is
+        only passed per request when ``timeout`` overrides it.
+        """
+        request_kwargs = {"headers": self._headers_with(headers), **kwargs}
+        if timeout is not None:
+            request_kwargs["timeout"] = timeout
+        return request_kwargs
+
+    def _headers_with(self, extra: Optional[dict[str, str]]) -> dict[str, str]:
+        """Return the cached base headers, merged with extra if given."""
+        if not extra:
+            return self._base_headers
+        return {**self._base_headers, **extra}
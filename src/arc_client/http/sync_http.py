@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any, Optional, Union
 
 import httpx
 
@@ -11,6 +13,8 @@ from arc_client.http.base import (
     HTTPClientBase,
     handle_connection_error,
     handle_response_error,
+    http_versions,
+    pool_limits,
 )
 
 
@@ -22,12 +26,20 @@ class SyncHTTPClient(HTTPClientBase):
         self._client: Optional[httpx.Client] = None
 
     def _get_client(self) -> httpx.Client:
-        """Get or create the httpx client."""
+        """Get or create the httpx client.
+
+        Connections are pooled and kept alive per the config, and HTTP/2 is
+        used on the same terms as the async client.
+        """
         if self._client is None:
+            http1, http2 = http_versions(self.config)
             self._client = httpx.Client(
                 base_url=self._base_url,
                 timeout=self.config.timeout,
                 verify=self.config.verify_ssl,
+                http1=http1,
+                http2=http2,
+                limits=pool_limits(self.config),
             )
         return self._client
 
@@ -42,9 +54,10 @@ class SyncHTTPClient(HTTPClientBase):
         path: str,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
     ) -> httpx.Response:
         """Make a GET request."""
-        kwargs = self._prepare_request_kwargs(headers=headers, params=params)
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
         try:
             response = self._get_client().get(path, **kwargs)
             handle_response_error(response)
@@ -53,16 +66,37 @@ class SyncHTTPClient(HTTPClientBase):
             handle_connection_error(e, self._build_url(path))
             raise  # Never reached, but satisfies type checker
 
+    def head(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        """Make a HEAD request."""
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
+        try:
+            response = self._get_client().head(path, **kwargs)
+            handle_response_error(response)
+            return response
+        except httpx.ConnectError as e:
+            handle_connection_error(e, self._build_url(path))
+            raise
+
     def post(
         self,
         path: str,
         json: Optional[Any] = None,
-        content: Optional[bytes] = None,
+        content: Optional[Union[bytes, Iterable[bytes]]] = None,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
     ) -> httpx.Response:
-        """Make a POST request."""
-        kwargs = self._prepare_request_kwargs(headers=headers, params=params)
+        """Make a POST request.
+
+        ``content`` may be an iterable of bytes, which is sent chunked.
+        """
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
         if json is not None:
             kwargs["json"] = json
         if content is not None:
@@ -81,9 +115,10 @@ class SyncHTTPClient(HTTPClientBase):
         json: Optional[Any] = None,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
     ) -> httpx.Response:
         """Make a PUT request."""
-        kwargs = self._prepare_request_kwargs(headers=headers, params=params)
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
         if json is not None:
             kwargs["json"] = json
         try:
@@ -100,9 +135,10 @@ class SyncHTTPClient(HTTPClientBase):
         json: Optional[Any] = None,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
     ) -> httpx.Response:
         """Make a PATCH request."""
-        kwargs = self._prepare_request_kwargs(headers=headers, params=params)
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
         if json is not None:
             kwargs["json"] = json
         try:
@@ -118,9 +154,10 @@ class SyncHTTPClient(HTTPClientBase):
         path: str,
         params: Optional[dict[str, Any]] = None,
         headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
     ) -> httpx.Response:
         """Make a DELETE request."""
-        kwargs = self._prepare_request_kwargs(headers=headers, params=params)
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout, params=params)
         try:
             response = self._get_client().delete(path, **kwargs)
             handle_response_error(response)
@@ -129,6 +166,29 @@ class SyncHTTPClient(HTTPClientBase):
             handle_connection_error(e, self._build_url(path))
             raise
 
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Any] = None,
+        headers: Optional[dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[httpx.Response]:
+        """Make a request whose body is read incrementally by the caller."""
+        kwargs = self._prepare_request_kwargs(headers=headers, timeout=timeout)
+        if json is not None:
+            kwargs["json"] = json
+        try:
+            with self._get_client().stream(method, path, **kwargs) as response:
+                if not response.is_success:
+                    response.read()
+                    handle_response_error(response)
+                yield response
+        except httpx.ConnectError as e:
+            handle_connection_error(e, self._build_url(path))
+            raise
+
     def __enter__(self) -> SyncHTTPClient:
         return self
 
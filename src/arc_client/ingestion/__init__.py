@@ -4,25 +4,87 @@ This module provides high-performance data ingestion for Arc using:
 - MessagePack columnar format (recommended, 25-35% faster)
 - MessagePack row format (legacy)
 - InfluxDB Line Protocol (compatibility)
+
+Public names are imported from their submodules on first access, so
+importing this package does not pull in httpx or msgpack up front.
 """
 
-from arc_client.ingestion.async_buffered import AsyncBufferedWriter
-from arc_client.ingestion.async_writer import AsyncWriteClient
-from arc_client.ingestion.buffered import BufferedWriter
-from arc_client.ingestion.compression import compress_gzip, decompress_gzip, is_gzipped
-from arc_client.ingestion.line_protocol import (
-    format_columnar_as_lines,
-    format_line_protocol,
-    format_lines,
-)
-from arc_client.ingestion.msgpack import (
-    dataframe_to_columnar,
-    encode_batch,
-    encode_columnar,
-    encode_records,
-    encode_single_record,
-)
-from arc_client.ingestion.writer import WriteClient
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from arc_client.ingestion.async_buffered import AsyncBufferedWriter
+    from arc_client.ingestion.async_writer import AsyncWriteClient
+    from arc_client.ingestion.buffered import BufferedWriter
+    from arc_client.ingestion.compression import (
+        compress_gzip,
+        compress_payload,
+        compress_zstd,
+        decompress_gzip,
+        gzip_stream,
+        is_gzipped,
+        is_zstd,
+        looks_compressible,
+    )
+    from arc_client.ingestion.line_protocol import (
+        format_columnar_as_lines,
+        format_line_protocol,
+        format_lines,
+    )
+    from arc_client.ingestion.msgpack import (
+        arrow_to_columnar,
+        dataframe_to_columnar,
+        encode_batch,
+        encode_columnar,
+        encode_columnar_compressed,
+        encode_records,
+        encode_single_record,
+        records_to_columnar,
+    )
+    from arc_client.ingestion.writer import WriteClient
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "AsyncBufferedWriter": "arc_client.ingestion.async_buffered",
+    "AsyncWriteClient": "arc_client.ingestion.async_writer",
+    "BufferedWriter": "arc_client.ingestion.buffered",
+    "compress_gzip": "arc_client.ingestion.compression",
+    "compress_payload": "arc_client.ingestion.compression",
+    "compress_zstd": "arc_client.ingestion.compression",
+    "decompress_gzip": "arc_client.ingestion.compression",
+    "gzip_stream": "arc_client.ingestion.compression",
+    "is_gzipped": "arc_client.ingestion.compression",
+    "is_zstd": "arc_client.ingestion.compression",
+    "looks_compressible": "arc_client.ingestion.compression",
+    "format_columnar_as_lines": "arc_client.ingestion.line_protocol",
+    "format_line_protocol": "arc_client.ingestion.line_protocol",
+    "format_lines": "arc_client.ingestion.line_protocol",
+    "arrow_to_columnar": "arc_client.ingestion.msgpack",
+    "dataframe_to_columnar": "arc_client.ingestion.msgpack",
+    "encode_batch": "arc_client.ingestion.msgpack",
+    "encode_columnar": "arc_client.ingestion.msgpack",
+    "encode_columnar_compressed": "arc_client.ingestion.msgpack",
+    "encode_records": "arc_client.ingestion.msgpack",
+    "encode_single_record": "arc_client.ingestion.msgpack",
+    "records_to_columnar": "arc_client.ingestion.msgpack",
+    "WriteClient": "arc_client.ingestion.writer",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     # Writers
@@ -32,16 +94,24 @@ __all__ = [
     "AsyncBufferedWriter",
     # MessagePack
     "encode_columnar",
+    "encode_columnar_compressed",
     "encode_records",
     "encode_single_record",
     "encode_batch",
     "dataframe_to_columnar",
+    "arrow_to_columnar",
+    "records_to_columnar",
     # Line Protocol
     "format_line_protocol",
     "format_lines",
     "format_columnar_as_lines",
     # Compression
     "compress_gzip",
+    "compress_zstd",
+    "compress_payload",
     "decompress_gzip",
+    "gzip_stream",
     "is_gzipped",
+    "is_zstd",
+    "looks_compressible",
 ]
@@ -5,15 +5,43 @@ from __future__ import annotations
 import asyncio
 import time
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, Sequence
+
+from arc_client.ingestion.buffered import (
+    _CLOCK_CHECK_EVERY,
+    DEFAULT_MAX_BYTES,
+    _RowStage,
+    estimate_columns_size,
+    merge_columnar,
+)
 
 if TYPE_CHECKING:
     from arc_client.ingestion.async_writer import AsyncWriteClient
 
+# Smoothing factor for the flush round-trip EWMA
+_RTT_ALPHA = 0.2
+
 
 class AsyncBufferedWriter:
     """Async buffered writer that batches records for optimal throughput.
 
+    The batch size adapts between ``min_batch`` and ``max_batch`` based on
+    flush round trips: it doubles while flushes finish well within
+    ``flush_interval`` with little else in flight, and halves once
+    ``max_concurrent`` flushes are outstanding or the smoothed round trip
+    exceeds ``flush_interval``. Both bounds default to ``batch_size``,
+    which keeps the batch size fixed. A measurement is also flushed once
+    its buffered data reaches an estimated ``max_bytes``.
+
+    With ``max_pending_flushes`` set, flushes are sent from background
+    tasks and writers wait once that many are in flight. Errors from
+    background flushes are raised by the next write, flush() or close().
+
+    Used as an async context manager, time-based flushes are driven by a
+    background timer task, so write() never reads the clock. Otherwise
+    write() checks the flush interval every few hundred records.
+
     Example:
         >>> async with client.write.buffered(batch_size=10000) as buffer:
         ...     for record in records:
@@ -26,20 +54,47 @@ class AsyncBufferedWriter:
         write_client: AsyncWriteClient,
         batch_size: int = 10000,
         flush_interval: float = 5.0,
+        min_batch: Optional[int] = None,
+        max_batch: Optional[int] = None,
+        max_concurrent: int = 4,
+        max_pending_flushes: Optional[int] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
     ) -> None:
         self._client = write_client
         self._batch_size = batch_size
         self._flush_interval = flush_interval
+        self._max_bytes = max_bytes
+        self._min_batch = min(min_batch or batch_size, batch_size)
+        self._max_batch = max(max_batch or batch_size, batch_size)
+        self._max_concurrent = max_concurrent
 
-        self._buffers: dict[str, list[dict[str, list[Any]]]] = defaultdict(list)
+        self._in_flight = 0
+        self._ewma_rtt: Optional[float] = None
+
+        self._buffers: dict[str, list[dict[str, Any]]] = defaultdict(list)
         self._record_counts: dict[str, int] = defaultdict(int)
+        self._byte_counts: dict[str, int] = defaultdict(int)
+        self._rows: dict[str, _RowStage] = {}
 
         self._last_flush_time = time.monotonic()
+        self._writes_since_check = 0
+        # A zero interval means flush on every write, so check every write
+        self._check_every = _CLOCK_CHECK_EVERY if flush_interval > 0 else 1
+        self._timer: Optional[asyncio.Task[None]] = None
+        self._stop: Optional[asyncio.Event] = None
         self._lock = asyncio.Lock()
         self._closed = False
 
+        self._error: Optional[Exception] = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._pending: Optional[asyncio.Semaphore] = None
+        if max_pending_flushes is not None:
+            self._pending = asyncio.Semaphore(max_pending_flushes)
+
     async def write(self, record: dict[str, Any]) -> None:
         """Write a single record to the buffer."""
+        self._raise_flush_error()
+
         measurement = record.get("measurement")
         if not measurement:
             raise ValueError("Record must have 'measurement' field")
@@ -50,25 +105,66 @@ class AsyncBufferedWriter:
 
         timestamp = record.get("timestamp")
         if timestamp is None:
-            timestamp = int(time.time() * 1_000_000)
+            timestamp = time.time_ns() // 1000
 
         tags = record.get("tags", {})
+        schema = ("time", *fields, *tags)
+        values = (timestamp, *fields.values(), *tags.values())
+        await self._stage_row(measurement, schema, values)
 
-        columns: dict[str, list[Any]] = {"time": [timestamp]}
-        for key, value in fields.items():
-            columns[key] = [value]
-        for key, value in tags.items():
-            columns[key] = [value]
+    def row_writer(
+        self, measurement: str, columns: Sequence[str]
+    ) -> Callable[..., Coroutine[Any, Any, None]]:
+        """Return a coroutine function that writes fixed-schema records positionally.
 
-        async with self._lock:
-            self._buffers[measurement].append(columns)
-            self._record_counts[measurement] += 1
+        See ``BufferedWriter.row_writer``.
 
-            if self._record_counts[measurement] >= self._batch_size:
-                await self._flush_measurement_unlocked(measurement)
-
-            if time.monotonic() - self._last_flush_time >= self._flush_interval:
-                await self._flush_all_unlocked()
+        Example:
+            >>> write_cpu = buffer.row_writer("cpu", ("time", "usage", "host"))
+            >>> await write_cpu(ts, usage, host)
+        """
+        if not measurement:
+            raise ValueError("Row writer needs a measurement")
+        schema = tuple(columns)
+        if "time" not in schema:
+            raise ValueError("Row writer columns must include 'time'")
+        width = len(schema)
+
+        async def write_row(*values: Any) -> None:
+            if len(values) != width:
+                raise ValueError(f"Expected {width} values, got {len(values)}")
+            self._raise_flush_error()
+            await self._stage_row(measurement, schema, values)
+
+        return write_row
+
+    async def _stage_row(
+        self, measurement: str, schema: tuple[str, ...], values: tuple[Any, ...]
+    ) -> None:
+        """Stage one record and flush whatever it makes due. Must not hold lock."""
+        async with self._lock:
+            stage = self._rows.get(measurement)
+            if stage is None:
+                stage = self._rows[measurement] = _RowStage()
+            self._byte_counts[measurement] += stage.append(schema, values)
+            # One read and one store per record. Interning measurement and
+            # column names measured slower: sys.intern costs a hash lookup
+            # per name, more than the short compares it saves.
+            count = self._record_counts[measurement] + 1
+            self._record_counts[measurement] = count
+
+            batches = []
+            if count >= self._batch_size or self._byte_counts[measurement] >= self._max_bytes:
+                batches = self._take(measurement)
+
+            if self._timer is None:
+                self._writes_since_check += 1
+                if self._writes_since_check >= self._check_every:
+                    self._writes_since_check = 0
+                    if time.monotonic() - self._last_flush_time >= self._flush_interval:
+                        batches.extend(self._take_all())
+
+        await self._dispatch(batches)
 
     async def write_columnar(
         self,
@@ -76,96 +172,201 @@ class AsyncBufferedWriter:
         columns: dict[str, list[Any]],
     ) -> None:
         """Write columnar data to the buffer."""
+        await self.write_columns(measurement, columns)
+
+    async def write_columns(
+        self,
+        measurement: str,
+        columns: dict[str, Any],
+    ) -> None:
+        """Write a chunk of columnar arrays (lists or NumPy arrays) to the buffer."""
+        self._raise_flush_error()
         if not columns:
             return
 
         num_records = len(next(iter(columns.values())))
 
         async with self._lock:
+            self._seal_rows(measurement)
             self._buffers[measurement].append(columns)
             self._record_counts[measurement] += num_records
+            self._byte_counts[measurement] += estimate_columns_size(columns)
 
-            if self._record_counts[measurement] >= self._batch_size:
-                await self._flush_measurement_unlocked(measurement)
+            batches = []
+            if (
+                self._record_counts[measurement] >= self._batch_size
+                or self._byte_counts[measurement] >= self._max_bytes
+            ):
+                batches = self._take(measurement)
 
-            if time.monotonic() - self._last_flush_time >= self._flush_interval:
-                await self._flush_all_unlocked()
+            if (
+                self._timer is None
+                and time.monotonic() - self._last_flush_time >= self._flush_interval
+            ):
+                batches.extend(self._take_all())
+
+        await self._dispatch(batches)
 
     async def flush(self) -> None:
-        """Manually flush all buffered data."""
+        """Manually flush all buffered data and wait for it to be sent."""
         async with self._lock:
-            await self._flush_all_unlocked()
-
-    async def _flush_measurement_unlocked(self, measurement: str) -> None:
-        """Flush a single measurement. Must hold lock."""
-        if measurement not in self._buffers or not self._buffers[measurement]:
-            return
-
-        merged = self._merge_columnar(self._buffers[measurement])
+            batches = self._take_all()
+        await self._dispatch(batches)
+        await self._wait_pending()
+
+    def _seal_rows(self, measurement: str) -> None:
+        """Move staged records into the batch list, keeping write order. Must hold lock."""
+        stage = self._rows.get(measurement)
+        if stage is not None and stage.count:
+            self._buffers[measurement].append(stage.take())
+
+    def _take(self, measurement: str) -> list[tuple[str, dict[str, Any]]]:
+        """Detach a measurement's buffered data as one merged batch. Must hold lock."""
+        self._seal_rows(measurement)
+        if not self._buffers.get(measurement):
+            return []
+
+        merged = merge_columnar(self._buffers[measurement])
         self._buffers[measurement] = []
         self._record_counts[measurement] = 0
-
-        # Release lock during I/O
-        self._lock.release()
-        try:
-            await self._client.write_columnar(measurement, merged)
-        finally:
-            await self._lock.acquire()
-
+        self._byte_counts[measurement] = 0
         self._last_flush_time = time.monotonic()
+        return [(measurement, merged)]
 
-    async def _flush_all_unlocked(self) -> None:
-        """Flush all measurements. Must hold lock."""
-        measurements = list(self._buffers.keys())
-        for measurement in measurements:
-            if self._buffers[measurement]:
-                await self._flush_measurement_unlocked(measurement)
+    def _take_all(self) -> list[tuple[str, dict[str, Any]]]:
+        """Detach every measurement's buffered data. Must hold lock."""
+        batches: list[tuple[str, dict[str, Any]]] = []
+        for measurement in list(self._buffers.keys() | self._rows.keys()):
+            batches.extend(self._take(measurement))
+        return batches
 
-    def _merge_columnar(self, batches: list[dict[str, list[Any]]]) -> dict[str, list[Any]]:
-        """Merge multiple columnar batches into one.
+    async def _dispatch(self, batches: list[tuple[str, dict[str, Any]]]) -> None:
+        """Send detached batches. Must not hold lock.
 
-        When batches have different column sets (sparse columns), missing
-        positions are filled with None so all columns have equal length.
+        Inline, all batches are written concurrently and the first error is
+        raised once they have all finished. In background mode each batch
+        becomes a task, waiting for a free slot first.
         """
         if not batches:
-            return {}
-
-        if len(batches) == 1:
-            return batches[0]
+            return
 
-        all_columns: set[str] = set()
-        for batch in batches:
-            all_columns.update(batch.keys())
+        if self._pending is not None:
+            for measurement, columns in batches:
+                await self._pending.acquire()
+                self._in_flight += 1
+                task = asyncio.create_task(
+                    self._send_and_release(measurement, columns, self._in_flight)
+                )
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            return
 
-        # Merge each column, padding missing columns with None
-        merged: dict[str, list[Any]] = {}
-        for col_name in all_columns:
-            merged[col_name] = []
-            for batch in batches:
-                if col_name in batch:
-                    merged[col_name].extend(batch[col_name])
-                else:
-                    # Column missing from this batch — pad with None
-                    batch_len = len(batch.get("time", next(iter(batch.values()))))
-                    merged[col_name].extend([None] * batch_len)
+        sends = []
+        for measurement, columns in batches:
+            self._in_flight += 1
+            sends.append(self._send(measurement, columns, self._in_flight))
+        results = await asyncio.gather(*sends, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _send(self, measurement: str, columns: dict[str, Any], in_flight: int) -> None:
+        """Write one merged batch and feed its round trip to the batch sizing."""
+        started = time.monotonic()
+        try:
+            await self._client.write_columnar(measurement, columns)
+        finally:
+            self._in_flight -= 1
+        self._adapt_batch_size(time.monotonic() - started, in_flight)
 
-        return merged
+    async def _send_and_release(
+        self, measurement: str, columns: dict[str, Any], in_flight: int
+    ) -> None:
+        """Background flush task: send, record any error, free the slot."""
+        assert self._pending is not None
+        try:
+            await self._send(measurement, columns, in_flight)
+        except Exception as e:
+            if self._error is None:
+                self._error = e
+        finally:
+            self._pending.release()
+
+    async def _wait_pending(self) -> None:
+        """Wait for background flushes, then raise the first error if any."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+        self._raise_flush_error()
+
+    def _raise_flush_error(self) -> None:
+        """Re-raise the first error from a background flush, if any."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _adapt_batch_size(self, rtt: float, in_flight: int) -> None:
+        """Grow or shrink the batch size from the latest flush round trip."""
+        if self._ewma_rtt is None:
+            self._ewma_rtt = rtt
+        else:
+            self._ewma_rtt = _RTT_ALPHA * rtt + (1 - _RTT_ALPHA) * self._ewma_rtt
+
+        if in_flight >= self._max_concurrent or self._ewma_rtt > self._flush_interval:
+            self._batch_size = max(self._batch_size // 2, self._min_batch)
+        elif in_flight < 2 and self._ewma_rtt < self._flush_interval / 2:
+            self._batch_size = min(self._batch_size * 2, self._max_batch)
+
+    async def _flush_periodically(self) -> None:
+        """Flush everything whenever flush_interval passes without a flush."""
+        assert self._stop is not None
+        while not self._stop.is_set():
+            delay = self._last_flush_time + self._flush_interval - time.monotonic()
+            if delay > 0:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stop.wait(), delay)
+                continue
+
+            async with self._lock:
+                batches = self._take_all()
+                self._last_flush_time = time.monotonic()
+            try:
+                await self._dispatch(batches)
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
 
     async def close(self) -> None:
         """Close the buffer and flush remaining data."""
         if self._closed:
             return
 
+        if self._timer is not None and self._stop is not None:
+            # Let the timer finish any flush in progress rather than cancel it
+            self._stop.set()
+            await self._timer
+            self._timer = None
+
         async with self._lock:
-            await self._flush_all_unlocked()
+            batches = self._take_all()
             self._closed = True
+        await self._dispatch(batches)
+        await self._wait_pending()
 
     async def __aenter__(self) -> AsyncBufferedWriter:
+        # A timer with no positive interval would never yield to the loop
+        if self._timer is None and self._flush_interval > 0:
+            self._stop = asyncio.Event()
+            self._timer = asyncio.create_task(self._flush_periodically())
         return self
 
     async def __aexit__(self, *args: Any) -> None:
         await self.close()
 
+    @property
+    def batch_size(self) -> int:
+        """Get the current flush threshold in records."""
+        return self._batch_size
+
     @property
     def pending_count(self) -> int:
         """Get the total number of pending records."""
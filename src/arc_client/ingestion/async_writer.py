@@ -2,22 +2,85 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import asyncio
+import zlib
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional, Union
 
 from arc_client.config import ClientConfig
 from arc_client.exceptions import ArcIngestionError, ArcValidationError
 from arc_client.http.async_http import AsyncHTTPClient
-from arc_client.ingestion.compression import compress_gzip
+from arc_client.ingestion.compression import (
+    compress_gzip_stream,
+    compress_payload,
+    looks_compressible,
+)
 from arc_client.ingestion.line_protocol import format_line_protocol
 from arc_client.ingestion.msgpack import (
+    _columnar_encoder,
+    _is_dataframe,
+    arrow_to_columnar,
+    column_values,
     dataframe_to_columnar,
-    encode_columnar,
     encode_records,
+    records_to_columnar,
 )
 
 if TYPE_CHECKING:
     from arc_client.ingestion.async_buffered import AsyncBufferedWriter
 
+# Bodies at least this large are compressed off the event loop thread
+_OFFLOAD_MIN_BYTES = 16 * 1024
+# gzip bodies at least this large are compressed while they are sent
+_STREAM_MIN_BYTES = 1024 * 1024
+# Longest a point buffered by write_point waits before it is sent
+_POINT_FLUSH_INTERVAL = 0.5
+
+
+def _shard_columns(columns: dict[str, Any], shard_key: str, shards: int) -> list[dict[str, Any]]:
+    """Split columns into per-shard chunks by hashing the shard key column.
+
+    Each distinct key value is hashed once (CRC32 of its string form), rows
+    are reordered with a single stable sort by shard, and every column is
+    then sliced into contiguous ranges. Rows sharing a key stay together
+    and keep their relative order.
+    """
+    if shard_key not in columns:
+        raise ArcValidationError(f"Shard key column '{shard_key}' not found")
+
+    shard_of: dict[Any, int] = {}
+    shard_ids = []
+    for value in column_values(columns[shard_key]):
+        shard = shard_of.get(value)
+        if shard is None:
+            shard = shard_of[value] = zlib.crc32(str(value).encode()) % shards
+        shard_ids.append(shard)
+    if not shard_ids:
+        return [columns]
+
+    order = sorted(range(len(shard_ids)), key=shard_ids.__getitem__)
+    reordered: dict[str, Any] = {}
+    for name, values in columns.items():
+        if type(values).__module__ == "numpy":
+            reordered[name] = values[order]
+        elif len(order) == 1:
+            reordered[name] = [values[0]]
+        else:
+            reordered[name] = list(itemgetter(*order)(values))
+
+    parts = []
+    start = 0
+    counts = [0] * shards
+    for shard in shard_ids:
+        counts[shard] += 1
+    for count in counts:
+        if count:
+            parts.append(
+                {name: values[start : start + count] for name, values in reordered.items()}
+            )
+            start += count
+    return parts
+
 
 class AsyncWriteClient:
     """Asynchronous client for writing data to Arc.
@@ -41,6 +104,35 @@ class AsyncWriteClient:
     def __init__(self, http: AsyncHTTPClient, config: ClientConfig) -> None:
         self._http = http
         self._config = config
+        self._points: Optional[AsyncBufferedWriter] = None
+
+    async def write(
+        self,
+        data: Any,
+        measurement: Optional[str] = None,
+        database: Optional[str] = None,
+        compress: Optional[bool] = None,
+    ) -> None:
+        """Write data in the fastest format that fits it.
+
+        See ``WriteClient.write``.
+        """
+        if isinstance(data, str) or (isinstance(data, list) and data and isinstance(data[0], str)):
+            await self.write_line_protocol(data, database, compress)
+        elif isinstance(data, list):
+            columnar = records_to_columnar(data)
+            if columnar is None:
+                await self.write_records(data, database, compress)
+            else:
+                await self.write_columnar(*columnar, database, compress)
+        elif not measurement:
+            raise ArcValidationError("measurement is required to write columns or DataFrames")
+        elif isinstance(data, dict):
+            await self.write_columnar(measurement, data, database, compress)
+        elif _is_dataframe(data):
+            await self.write_dataframe(data, measurement, database, compress=compress)
+        else:
+            raise ArcValidationError(f"Unsupported data type for write(): {type(data).__name__}")
 
     async def write_columnar(
         self,
@@ -49,6 +141,7 @@ class AsyncWriteClient:
         database: Optional[str] = None,
         compress: Optional[bool] = None,
         time_unit: str = "us",
+        float_precision: str = "f64",
     ) -> None:
         """Write columnar data to Arc (highest performance method).
 
@@ -56,11 +149,14 @@ class AsyncWriteClient:
             measurement: The measurement (table) name.
             columns: Dictionary mapping column names to lists of values.
             database: Target database. Uses client default if not specified.
-            compress: Whether to gzip compress. Uses client default if not specified.
+            compress: Whether to compress. Uses client default if not specified.
             time_unit: Unit of timestamps - "s", "ms", or "us" (default).
+            float_precision: "f64" (default) or "f32" to send float fields as
+                32-bit floats. Timestamps keep full precision.
         """
         try:
-            data = encode_columnar(measurement, columns, time_unit)
+            encoder = _columnar_encoder(measurement, tuple(columns), time_unit, float_precision)
+            data = encoder.encode(columns)
         except ArcValidationError:
             raise
         except Exception as e:
@@ -68,6 +164,45 @@ class AsyncWriteClient:
 
         await self._write_msgpack(data, database, compress)
 
+    async def write_columnar_sharded(
+        self,
+        measurement: str,
+        columns: dict[str, Any],
+        shard_key: str,
+        shards: int = 8,
+        database: Optional[str] = None,
+        compress: Optional[bool] = None,
+        time_unit: str = "us",
+    ) -> None:
+        """Write columnar data as concurrent per-shard requests.
+
+        Rows are partitioned by a hash of the shard_key column (e.g. a host
+        tag) and each partition is posted concurrently, so wide batches are
+        spread over the server's ingestion workers.
+
+        Args:
+            measurement: The measurement (table) name.
+            columns: Dictionary mapping column names to lists or NumPy arrays.
+            shard_key: Column whose values select the shard.
+            shards: Maximum number of concurrent requests.
+            database: Target database. Uses client default if not specified.
+            compress: Whether to compress. Uses client default if not specified.
+            time_unit: Unit of timestamps - "s", "ms", or "us" (default).
+        """
+        try:
+            parts = _shard_columns(columns, shard_key, max(shards, 1))
+        except ArcValidationError:
+            raise
+        except Exception as e:
+            raise ArcValidationError(f"Failed to shard columnar data: {e}") from e
+
+        await asyncio.gather(
+            *(
+                self.write_columnar(measurement, part, database, compress, time_unit)
+                for part in parts
+            )
+        )
+
     async def write_records(
         self,
         records: list[dict[str, Any]],
@@ -103,6 +238,25 @@ class AsyncWriteClient:
 
         await self.write_columnar(measurement, columns, database, compress)
 
+    async def write_arrow(
+        self,
+        table: Any,
+        measurement: str,
+        database: Optional[str] = None,
+        time_column: str = "time",
+        tag_columns: Optional[list[str]] = None,
+        compress: Optional[bool] = None,
+    ) -> None:
+        """Write a PyArrow Table or RecordBatch to Arc."""
+        try:
+            columns = arrow_to_columnar(table, time_column, tag_columns)
+        except ArcValidationError:
+            raise
+        except Exception as e:
+            raise ArcValidationError(f"Failed to convert Arrow data: {e}") from e
+
+        await self.write_columnar(measurement, columns, database, compress)
+
     async def write_line_protocol(
         self,
         lines: str | list[str],
@@ -122,19 +276,105 @@ class AsyncWriteClient:
         database: Optional[str] = None,
         compress: Optional[bool] = None,
     ) -> None:
-        """Write a single data point using Line Protocol."""
+        """Write a single data point using Line Protocol.
+
+        Buffered per ``point_batch_size`` like ``WriteClient.write_point``.
+        """
+        if self._config.point_batch_size and database is None and compress is None:
+            if self._points is None:
+                from arc_client.ingestion.async_buffered import AsyncBufferedWriter
+
+                points = AsyncBufferedWriter(
+                    self, self._config.point_batch_size, _POINT_FLUSH_INTERVAL
+                )
+                self._points = await points.__aenter__()
+            await self._points.write(
+                {
+                    "measurement": measurement,
+                    "fields": fields,
+                    "tags": tags or {},
+                    "timestamp": timestamp,
+                }
+            )
+            return
         line = format_line_protocol(measurement, fields, tags, timestamp)
         await self._write_line_protocol(line.encode("utf-8"), database, compress)
 
+    async def close(self) -> None:
+        """Send any points buffered by ``write_point``."""
+        points, self._points = self._points, None
+        if points is not None:
+            await points.close()
+
     def buffered(
         self,
         batch_size: int = 10000,
         flush_interval: float = 5.0,
+        min_batch: Optional[int] = None,
+        max_batch: Optional[int] = None,
+        max_concurrent: int = 4,
+        max_pending_flushes: Optional[int] = None,
+        max_bytes: Optional[int] = None,
     ) -> AsyncBufferedWriter:
-        """Create a buffered writer for automatic batching."""
+        """Create a buffered writer for automatic batching.
+
+        Args:
+            batch_size: Initial number of records per flush.
+            flush_interval: Seconds between time-based flushes.
+            min_batch: Lower bound for the adaptive batch size.
+            max_batch: Upper bound for the adaptive batch size.
+            max_concurrent: In-flight flushes at which the batch size shrinks.
+            max_pending_flushes: If set, send batches from background tasks
+                and make writers wait once this many are in flight.
+            max_bytes: Estimated buffered bytes per measurement that trigger
+                a flush. Default 16 MiB.
+        """
         from arc_client.ingestion.async_buffered import AsyncBufferedWriter
+        from arc_client.ingestion.buffered import DEFAULT_MAX_BYTES
+
+        return AsyncBufferedWriter(
+            self,
+            batch_size,
+            flush_interval,
+            min_batch,
+            max_batch,
+            max_concurrent,
+            max_pending_flushes,
+            DEFAULT_MAX_BYTES if max_bytes is None else max_bytes,
+        )
+
+    async def _compress(
+        self, data: bytes, compress: Optional[bool]
+    ) -> tuple[Union[bytes, AsyncIterator[bytes]], Optional[str]]:
+        """Compress a request body per the config.
+
+        Bodies below ``compression_min_bytes`` fit in a packet or so and
+        are sent uncompressed, as are large bodies that a quick probe finds
+        incompressible. Bodies of ``_OFFLOAD_MIN_BYTES`` or more are
+        compressed in a worker thread (the codecs release the GIL) so the
+        event loop keeps serving other requests meanwhile; below that the
+        thread hop costs more than the compression itself.
+
+        gzip bodies of ``_STREAM_MIN_BYTES`` or more are returned as a
+        stream that is compressed as httpx sends it (chunked), so the whole
+        compressed copy is never held alongside the raw one. Its chunks are
+        compressed in worker threads too.
 
-        return AsyncBufferedWriter(self, batch_size, flush_interval)
+        Returns:
+            The body to send and its Content-Encoding, or None if uncompressed.
+        """
+        should_compress = compress if compress is not None else self._config.compression
+        if not should_compress or len(data) < self._config.compression_min_bytes:
+            return data, None
+        if not looks_compressible(data):
+            return data, None
+        codec = self._config.compression_codec
+        level = self._config.compression_level
+        if codec == "gzip" and len(data) >= _STREAM_MIN_BYTES:
+            return compress_gzip_stream(data, level), codec
+        if len(data) >= _OFFLOAD_MIN_BYTES:
+            return await asyncio.to_thread(compress_payload, data, codec, level), codec
+        return compress_payload(data, codec, level), codec
 
     async def _write_msgpack(
         self,
@@ -143,16 +383,13 @@ class AsyncWriteClient:
         compress: Optional[bool],
     ) -> None:
         """Send MessagePack data to Arc."""
-        should_compress = compress if compress is not None else self._config.compression
-
-        if should_compress:
-            data = compress_gzip(data)
+        body, encoding = await self._compress(data, compress)
 
         headers = {
             "Content-Type": "application/msgpack",
         }
-        if should_compress:
-            headers["Content-Encoding"] = "gzip"
+        if encoding:
+            headers["Content-Encoding"] = encoding
 
         if database:
             headers["x-arc-database"] = database
@@ -160,18 +397,17 @@ class AsyncWriteClient:
         try:
             response = await self._http.post(
                 "/api/v1/write/msgpack",
-                content=data,
+                content=body,
                 headers=headers,
             )
-            if response.status_code not in (200, 204):
-                raise ArcIngestionError(
-                    f"Write failed with status {response.status_code}: {response.text}"
-                )
-        except ArcIngestionError:
-            raise
         except Exception as e:
             raise ArcIngestionError(f"Failed to write data: {e}") from e
 
+        if response.status_code not in (200, 204):
+            raise ArcIngestionError(
+                f"Write failed with status {response.status_code}: {response.text}"
+            )
+
     async def _write_line_protocol(
         self,
         data: bytes,
@@ -179,16 +415,13 @@ class AsyncWriteClient:
         compress: Optional[bool],
     ) -> None:
         """Send Line Protocol data to Arc."""
-        should_compress = compress if compress is not None else self._config.compression
-
-        if should_compress:
-            data = compress_gzip(data)
+        body, encoding = await self._compress(data, compress)
 
         headers = {
             "Content-Type": "text/plain",
         }
-        if should_compress:
-            headers["Content-Encoding"] = "gzip"
+        if encoding:
+            headers["Content-Encoding"] = encoding
 
         if database:
             headers["x-arc-database"] = database
@@ -196,14 +429,13 @@ class AsyncWriteClient:
         try:
             response = await self._http.post(
                 "/api/v1/write/line-protocol",
-                content=data,
+                content=body,
                 headers=headers,
             )
-            if response.status_code not in (200, 204):
-                raise ArcIngestionError(
-                    f"Write failed with status {response.status_code}: {response.text}"
-                )
-        except ArcIngestionError:
-            raise
         except Exception as e:
             raise ArcIngestionError(f"Failed to write data: {e}") from e
+
+        if response.status_code not in (200, 204):
+            raise ArcIngestionError(
+                f"Write failed with status {response.status_code}: {response.text}"
+            )
@@ -9,29 +9,226 @@ from __future__ import annotations
 import threading
 import time
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Sequence
+
+from arc_client.ingestion.msgpack import column_values
 
 if TYPE_CHECKING:
     from arc_client.ingestion.writer import WriteClient
 
+# Number of measurement-keyed locks in BufferedWriter; a power of two
+_LOCK_SHARDS = 16
+
+# Without the context-manager timer, write() reads the clock once per this many records
+_CLOCK_CHECK_EVERY = 256
+
+# Default cap on the estimated size of one measurement's buffered data
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+
+# Smoothing factor for the per-measurement write rate and flush latency EWMAs
+_EWMA_ALPHA = 0.2
+
+# With background flushes, batches estimated above this are sent as several
+# requests compressed in parallel; large enough to keep per-request overhead low
+_SPLIT_BYTES = 4 * 1024 * 1024
+
+
+def _value_size(value: Any) -> int:
+    """Rough encoded size of one value: its length for strings, else a packed number."""
+    return len(value) if type(value) is str else 9
+
+
+def estimate_columns_size(columns: dict[str, Any]) -> int:
+    """Cheaply estimate the encoded size of a columnar chunk.
+
+    Arrays report their buffer size. Lists are sized from their first
+    value, so a chunk costs one call per column rather than per value.
+    """
+    size = 0
+    for values in columns.values():
+        nbytes = getattr(values, "nbytes", None)
+        if nbytes is not None:
+            size += nbytes
+        elif len(values):
+            size += len(values) * _value_size(values[0])
+    return size
+
+
+def concat_column(pieces: list[Any]) -> Any:
+    """Concatenate the pieces of one column staged across several batches.
+
+    NumPy pieces stay NumPy when every piece is an array, so numeric chunks
+    are joined with a single ``np.concatenate``. Otherwise pieces are
+    flattened into one list.
+    """
+    if all(type(piece).__module__ == "numpy" for piece in pieces):
+        import numpy as np
+
+        return np.concatenate(pieces)
+
+    # list.extend from a list is a memcpy with amortised growth; measured
+    # faster than pre-sizing with slice assignment or list(chain(...))
+    merged: list[Any] = []
+    for piece in pieces:
+        merged.extend(column_values(piece))
+    return merged
+
+
+def merge_columnar(batches: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge staged columnar batches into one.
+
+    Columns keep the order they first appear in. When batches have
+    different column sets (sparse columns), missing positions are filled
+    with None so all columns have equal length.
+    """
+    if not batches:
+        return {}
+
+    if len(batches) == 1:
+        return batches[0]
+
+    names = list(dict.fromkeys(chain.from_iterable(batches)))
+    if all(len(batch) == len(names) for batch in batches):
+        # Same columns everywhere: no padding to work out
+        return {name: concat_column([batch[name] for batch in batches]) for name in names}
+
+    lengths = [len(batch.get("time", next(iter(batch.values())))) for batch in batches]
+    merged: dict[str, Any] = {}
+    for name in names:
+        pieces = [
+            batch[name] if name in batch else [None] * length
+            for batch, length in zip(batches, lengths)
+        ]
+        merged[name] = concat_column(pieces)
+    return merged
+
+
+class _RowStage:
+    """Column lists for the records written to one measurement.
+
+    ``schema`` is the column order shared by every record staged so far,
+    or None once records with different columns have been mixed. A record
+    matching it appends its values straight onto the column lists with no
+    per-record dicts. The schema outlives take(), so steady-state ingestion
+    derives the column layout once rather than once per flush. The size of
+    a record is estimated from the first record of the schema and reused
+    for the ones that match it.
+
+    Columns are plain lists. Typed ``array.array`` columns would hold
+    numeric values in a quarter of the memory, but array.append measured
+    about four times slower than list.append and the values have to be
+    boxed again for MessagePack at flush. Numeric data that is already
+    columnar keeps its compact form through ``write_columns``.
+    """
+
+    def __init__(self) -> None:
+        self.schema: Optional[tuple[str, ...]] = None
+        self.columns: dict[str, list[Any]] = {}
+        self._lists: list[list[Any]] = []
+        self.count = 0
+        self.record_size = 0
+
+    def append(self, schema: tuple[str, ...], values: tuple[Any, ...]) -> int:
+        """Stage one record given its column names and matching values.
+
+        Returns:
+            The estimated encoded size of the record in bytes.
+        """
+        if schema != self.schema:
+            size = self._append_mismatched(schema, values)
+        else:
+            for column, value in zip(self._lists, values):
+                column.append(value)
+            size = self.record_size
+        self.count += 1
+        return size
+
+    def _append_mismatched(self, schema: tuple[str, ...], values: tuple[Any, ...]) -> int:
+        row = dict(zip(schema, values))
+        size = sum(map(_value_size, values))
+        if self.count == 0 and len(row) == len(schema):
+            self._reset(schema)
+            self.record_size = size
+            for column, value in zip(self._lists, values):
+                column.append(value)
+            return size
+
+        # Sparse columns: pad so every column keeps the same length
+        self.schema = None
+        for name, value in row.items():
+            if name not in self.columns:
+                self.columns[name] = [None] * self.count
+            self.columns[name].append(value)
+        for name, column in self.columns.items():
+            if name not in row:
+                column.append(None)
+        return size
+
+    def _reset(self, schema: tuple[str, ...]) -> None:
+        self.schema = schema
+        self._lists = [[] for _ in schema]
+        self.columns = dict(zip(schema, self._lists))
+
+    def take(self) -> dict[str, list[Any]]:
+        """Return the staged columns and start over with fresh lists.
+
+        Fresh lists rather than clear(), since the returned columns may
+        still be in use by a background flush.
+        """
+        columns = self.columns
+        self.count = 0
+        if self.schema is not None:
+            self._reset(self.schema)
+        else:
+            self.columns, self._lists = {}, []
+        return columns
+
 
 class BufferedWriter:
     """Buffered writer that batches records for optimal throughput.
 
     Automatically flushes when:
     - batch_size records have accumulated for a measurement
+    - a measurement's buffered data reaches an estimated max_bytes
     - flush_interval seconds have passed since last flush
     - The context manager exits
 
+    With ``max_pending_flushes`` set, flushes are sent from a pool of that
+    many background threads, so producing the next batch overlaps with
+    sending the previous ones, and writers block once that many flushes
+    are in flight. Batches over a few MiB are split across the pool so
+    their compression runs in parallel. Errors from background flushes are
+    raised by the next write, flush() or close().
+
+    Used as a context manager, time-based flushes are driven by a timer
+    thread, so write() never reads the clock and no caller inherits a
+    flush of other measurements. Otherwise write() checks the flush
+    interval every few hundred records. Errors from timer flushes are
+    raised like background flush errors.
+
+    Buffers are guarded by a small array of locks keyed by measurement, so
+    threads writing to different measurements rarely contend; only flushing
+    everything takes all of them.
+
+    When ``min_batch`` and ``max_batch`` differ, each measurement gets its
+    own batch size within those bounds: the smoothed rate at which its
+    records arrive times its smoothed flush latency. Filling a batch then
+    takes about as long as sending one, so busy measurements batch more
+    and quiet ones don't sit on small buffers. Both bounds default to
+    ``batch_size``, which keeps the batch size fixed.
+
     Example:
         >>> with client.write.buffered(batch_size=10000) as buffer:
         ...     for record in records:
         ...         buffer.write(record)
         ...     # Auto-flushes on exit
 
-        >>> # Or with columnar data
+        >>> # Or with columnar data (lists or NumPy arrays)
         >>> with client.write.buffered() as buffer:
-        ...     buffer.write_columnar("cpu", {"time": [...], "usage": [...]})
+        ...     buffer.write_columns("cpu", {"time": [...], "usage": [...]})
     """
 
     def __init__(
@@ -39,6 +236,10 @@ class BufferedWriter:
         write_client: WriteClient,
         batch_size: int = 10000,
         flush_interval: float = 5.0,
+        max_pending_flushes: Optional[int] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        min_batch: Optional[int] = None,
+        max_batch: Optional[int] = None,
     ) -> None:
         """Initialize the buffered writer.
 
@@ -46,19 +247,55 @@ class BufferedWriter:
             write_client: The underlying WriteClient instance.
             batch_size: Maximum records per measurement before auto-flush.
             flush_interval: Maximum seconds between flushes.
+            max_pending_flushes: If set, send flushes from background
+                threads with at most this many in flight. None flushes
+                inline on the writing thread.
+            max_bytes: Estimated encoded size per measurement before
+                auto-flush, so wide records don't pile up until batch_size.
+            min_batch: Lower bound for adaptive per-measurement batch sizes.
+            max_batch: Upper bound for adaptive per-measurement batch sizes.
         """
         self._client = write_client
         self._batch_size = batch_size
         self._flush_interval = flush_interval
+        self._max_bytes = max_bytes
+        self._min_batch = min(min_batch or batch_size, batch_size)
+        self._max_batch = max(max_batch or batch_size, batch_size)
+
+        # Adaptive sizing, per measurement: batch size, records/s, flush seconds
+        self._batch_sizes: dict[str, int] = {}
+        self._rates: dict[str, float] = {}
+        self._latencies: dict[str, float] = {}
+        self._taken_at: dict[str, float] = {}
 
         # Buffers: measurement -> list of column dicts
-        self._buffers: dict[str, list[dict[str, list[Any]]]] = defaultdict(list)
+        self._buffers: dict[str, list[dict[str, Any]]] = defaultdict(list)
         self._record_counts: dict[str, int] = defaultdict(int)
+        self._byte_counts: dict[str, int] = defaultdict(int)
+        # Records from write(), staged column-wise per measurement
+        self._rows: dict[str, _RowStage] = {}
 
         self._last_flush_time = time.monotonic()
-        self._lock = threading.Lock()
+        self._writes_since_check = 0
+        # A zero interval means flush on every write, so check every write
+        self._check_every = _CLOCK_CHECK_EVERY if flush_interval > 0 else 1
+        self._timer: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        # Writers only take their measurement's shard; flush-all takes every shard
+        self._locks = [threading.Lock() for _ in range(_LOCK_SHARDS)]
         self._closed = False
 
+        self._error: Optional[Exception] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[threading.Semaphore] = None
+        self._futures: set[Future[None]] = set()
+        if max_pending_flushes is not None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=max_pending_flushes, thread_name_prefix="arc-buffered-flush"
+            )
+            self._slots = threading.Semaphore(max_pending_flushes)
+        self._max_pending = max_pending_flushes or 1
+
     def write(self, record: dict[str, Any]) -> None:
         """Write a single record to the buffer.
 
@@ -72,6 +309,8 @@ class BufferedWriter:
                 - fields: dict (required)
                 - tags: dict (optional)
         """
+        self._raise_flush_error()
+
         measurement = record.get("measurement")
         if not measurement:
             raise ValueError("Record must have 'measurement' field")
@@ -82,28 +321,83 @@ class BufferedWriter:
 
         timestamp = record.get("timestamp")
         if timestamp is None:
-            timestamp = int(time.time() * 1_000_000)
+            timestamp = time.time_ns() // 1000
 
         tags = record.get("tags", {})
+        schema = ("time", *fields, *tags)
+        values = (timestamp, *fields.values(), *tags.values())
+        self._stage_row(measurement, schema, values)
 
-        # Convert row to columnar format for buffering
-        columns: dict[str, list[Any]] = {"time": [timestamp]}
-        for key, value in fields.items():
-            columns[key] = [value]
-        for key, value in tags.items():
-            columns[key] = [value]
+    def row_writer(self, measurement: str, columns: Sequence[str]) -> Callable[..., None]:
+        """Return a function that writes records of a fixed schema positionally.
 
-        with self._lock:
-            self._buffers[measurement].append(columns)
+        For narrow, fixed-schema workloads such as metrics, this skips the
+        per-record dict handling of write(): each call takes the values in
+        ``columns`` order and appends them straight onto the staged column
+        lists.
+
+        Args:
+            measurement: The measurement name.
+            columns: Column names, including "time" (timestamps in
+                microseconds).
+
+        Returns:
+            A function called with one value per column.
+
+        Raises:
+            ValueError: If measurement is empty or columns lack "time".
+
+        Example:
+            >>> with client.write.buffered() as buffer:
+            ...     write_cpu = buffer.row_writer("cpu", ("time", "usage", "host"))
+            ...     for ts, usage, host in samples:
+            ...         write_cpu(ts, usage, host)
+        """
+        if not measurement:
+            raise ValueError("Row writer needs a measurement")
+        schema = tuple(columns)
+        if "time" not in schema:
+            raise ValueError("Row writer columns must include 'time'")
+        width = len(schema)
+
+        def write_row(*values: Any) -> None:
+            if len(values) != width:
+                raise ValueError(f"Expected {width} values, got {len(values)}")
+            self._raise_flush_error()
+            self._stage_row(measurement, schema, values)
+
+        return write_row
+
+    def _stage_row(
+        self, measurement: str, schema: tuple[str, ...], values: tuple[Any, ...]
+    ) -> None:
+        """Stage one record and flush whatever it makes due. Must not hold a lock."""
+        with self._lock_for(measurement):
+            stage = self._rows.get(measurement)
+            if stage is None:
+                stage = self._rows[measurement] = _RowStage()
+            self._byte_counts[measurement] += stage.append(schema, values)
             self._record_counts[measurement] += 1
 
             # Check if we should flush this measurement
-            if self._record_counts[measurement] >= self._batch_size:
-                self._flush_measurement(measurement)
-
-            # Check time-based flush
-            if time.monotonic() - self._last_flush_time >= self._flush_interval:
-                self._flush_all()
+            chunks = None
+            if (
+                self._record_counts[measurement]
+                >= self._batch_sizes.get(measurement, self._batch_size)
+                or self._byte_counts[measurement] >= self._max_bytes
+            ):
+                chunks = self._take(measurement)
+
+        if chunks is not None:
+            self._send(measurement, chunks)
+
+        # Without the timer thread, check the flush interval every few hundred records
+        if self._timer is None:
+            self._writes_since_check += 1
+            if self._writes_since_check >= self._check_every:
+                self._writes_since_check = 0
+                if time.monotonic() - self._last_flush_time >= self._flush_interval:
+                    self._flush_all()
 
     def write_columnar(
         self,
@@ -116,112 +410,268 @@ class BufferedWriter:
             measurement: The measurement name.
             columns: Dictionary of column name to value list.
         """
+        self.write_columns(measurement, columns)
+
+    def write_columns(
+        self,
+        measurement: str,
+        columns: dict[str, Any],
+    ) -> None:
+        """Write a chunk of columnar arrays to the buffer.
+
+        The chunk is staged as-is with no per-row work, so NumPy arrays can
+        be handed over directly. Chunks are concatenated once per flush.
+
+        Args:
+            measurement: The measurement name.
+            columns: Dictionary of column name to list or NumPy array.
+                All columns must have the same length.
+
+        Example:
+            >>> with client.write.buffered() as buffer:
+            ...     buffer.write_columns("cpu", {"time": ts_array, "usage": usage_array})
+        """
+        self._raise_flush_error()
         if not columns:
             return
 
         num_records = len(next(iter(columns.values())))
 
-        with self._lock:
+        with self._lock_for(measurement):
+            self._seal_rows(measurement)
             self._buffers[measurement].append(columns)
             self._record_counts[measurement] += num_records
+            self._byte_counts[measurement] += estimate_columns_size(columns)
 
             # Check if we should flush this measurement
-            if self._record_counts[measurement] >= self._batch_size:
-                self._flush_measurement(measurement)
-
-            # Check time-based flush
-            if time.monotonic() - self._last_flush_time >= self._flush_interval:
-                self._flush_all()
-
-    def flush(self) -> None:
-        """Manually flush all buffered data."""
-        with self._lock:
+            chunks = None
+            if (
+                self._record_counts[measurement]
+                >= self._batch_sizes.get(measurement, self._batch_size)
+                or self._byte_counts[measurement] >= self._max_bytes
+            ):
+                chunks = self._take(measurement)
+
+        if chunks is not None:
+            self._send(measurement, chunks)
+
+        # Check time-based flush
+        if self._timer is None and time.monotonic() - self._last_flush_time >= self._flush_interval:
             self._flush_all()
 
-    def _flush_measurement(self, measurement: str) -> None:
-        """Flush a single measurement's buffer. Must hold lock."""
-        if measurement not in self._buffers or not self._buffers[measurement]:
-            return
-
-        # Merge all columnar batches into one
-        merged = self._merge_columnar(self._buffers[measurement])
-
-        # Clear buffer
+    def flush(self) -> None:
+        """Manually flush all buffered data and wait for it to be sent."""
+        self._flush_all()
+        wait(list(self._futures))
+        self._raise_flush_error()
+
+    def _seal_rows(self, measurement: str) -> None:
+        """Move staged records into the batch list in write order. Must hold its shard lock."""
+        stage = self._rows.get(measurement)
+        if stage is not None and stage.count:
+            self._buffers[measurement].append(stage.take())
+
+    def _lock_for(self, measurement: str) -> threading.Lock:
+        """Return the shard lock guarding a measurement's buffers."""
+        return self._locks[hash(measurement) & (_LOCK_SHARDS - 1)]
+
+    @contextmanager
+    def _all_locks(self) -> Iterator[None]:
+        """Hold every shard lock, always acquired in the same order."""
+        with ExitStack() as stack:
+            for lock in self._locks:
+                stack.enter_context(lock)
+            yield
+
+    def _take(self, measurement: str) -> Optional[list[dict[str, Any]]]:
+        """Detach a measurement's buffered chunks, unmerged.
+
+        Must hold the measurement's shard lock. Merging is left to _send(),
+        so writers are never blocked behind the copy.
+        """
+        self._seal_rows(measurement)
+        chunks = self._buffers.get(measurement)
+        if not chunks:
+            return None
+
+        now = time.monotonic()
+        if self._min_batch < self._max_batch:
+            self._track_rate(measurement, self._record_counts[measurement], now)
         self._buffers[measurement] = []
         self._record_counts[measurement] = 0
+        self._byte_counts[measurement] = 0
+        self._last_flush_time = now
+        return chunks
+
+    def _track_rate(self, measurement: str, records: int, now: float) -> None:
+        """Fold the records taken since the last take into the rate EWMA. Must hold its lock."""
+        since = self._taken_at.get(measurement)
+        self._taken_at[measurement] = now
+        if since is None or now <= since:
+            return
+        rate = records / (now - since)
+        previous = self._rates.get(measurement)
+        self._rates[measurement] = (
+            rate if previous is None else _EWMA_ALPHA * rate + (1 - _EWMA_ALPHA) * previous
+        )
+
+    def _adapt_batch_size(self, measurement: str, latency: float) -> None:
+        """Resize a measurement's batch so filling one takes about as long as sending one."""
+        with self._lock_for(measurement):
+            previous = self._latencies.get(measurement)
+            if previous is not None:
+                latency = _EWMA_ALPHA * latency + (1 - _EWMA_ALPHA) * previous
+            self._latencies[measurement] = latency
+            rate = self._rates.get(measurement)
+            if rate is not None:
+                target = int(rate * latency)
+                self._batch_sizes[measurement] = min(max(target, self._min_batch), self._max_batch)
+
+    def _send(self, measurement: str, chunks: list[dict[str, Any]]) -> None:
+        """Merge and write detached chunks, or hand them to the pool. Must not hold a lock.
+
+        A pooled batch larger than ``_SPLIT_BYTES`` is cut into row ranges
+        sent as separate requests, so several workers compress and send
+        it in parallel instead of one worker taking the whole batch.
+        """
+        if self._pool is not None:
+            size = sum(estimate_columns_size(chunk) for chunk in chunks)
+            parts = min(-(-size // _SPLIT_BYTES), self._max_pending)
+            if parts < 2:
+                self._submit(measurement, chunks)
+                return
+            columns = merge_columnar(chunks)
+            rows = len(next(iter(columns.values())))
+            step = -(-rows // parts)
+            for start in range(0, rows, step):
+                part = {name: values[start : start + step] for name, values in columns.items()}
+                self._submit(measurement, [part])
+            return
 
-        # Write to Arc (release lock during I/O)
-        self._lock.release()
-        try:
-            self._client.write_columnar(measurement, merged)
-        finally:
-            self._lock.acquire()
-
-        self._last_flush_time = time.monotonic()
+        self._write_chunks(measurement, chunks)
+        if self._min_batch < self._max_batch:
+            # The writer was blocked sending; don't count that time against its rate
+            with self._lock_for(measurement):
+                self._taken_at[measurement] = time.monotonic()
+
+    def _write_chunks(self, measurement: str, chunks: list[dict[str, Any]]) -> None:
+        """Merge detached chunks and write them as one batch."""
+        started = time.monotonic()
+        self._client.write_columnar(measurement, merge_columnar(chunks))
+        if self._min_batch < self._max_batch:
+            self._adapt_batch_size(measurement, time.monotonic() - started)
+
+    def _submit(self, measurement: str, chunks: list[dict[str, Any]]) -> None:
+        """Merge and send from the pool, blocking while all slots are in flight."""
+        assert self._pool is not None and self._slots is not None
+        self._slots.acquire()
+        future = self._pool.submit(self._write_chunks, measurement, chunks)
+        self._futures.add(future)
+        future.add_done_callback(self._flush_done)
+
+    def _flush_done(self, future: Future[None]) -> None:
+        """Record the first background error and free the slot."""
+        assert self._slots is not None
+        error = future.exception()
+        if isinstance(error, Exception) and self._error is None:
+            self._error = error
+        self._futures.discard(future)
+        self._slots.release()
+
+    def _raise_flush_error(self) -> None:
+        """Re-raise the first error from a background flush, if any."""
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
 
     def _flush_all(self) -> None:
-        """Flush all measurements. Must hold lock."""
-        measurements = list(self._buffers.keys())
-        for measurement in measurements:
-            if self._buffers[measurement]:
-                self._flush_measurement(measurement)
+        """Flush all measurements. Must not hold a lock.
 
-    def _merge_columnar(self, batches: list[dict[str, list[Any]]]) -> dict[str, list[Any]]:
-        """Merge multiple columnar batches into one.
-
-        When batches have different column sets (sparse columns), missing
-        positions are filled with None so all columns have equal length.
+        Every measurement is sent even if one fails; the first error is
+        raised afterwards.
         """
-        if not batches:
-            return {}
-
-        if len(batches) == 1:
-            return batches[0]
-
-        # Get all column names
-        all_columns: set[str] = set()
-        for batch in batches:
-            all_columns.update(batch.keys())
-
-        # Merge each column, padding missing columns with None
-        merged: dict[str, list[Any]] = {}
-        for col_name in all_columns:
-            merged[col_name] = []
-            for batch in batches:
-                if col_name in batch:
-                    merged[col_name].extend(batch[col_name])
-                else:
-                    # Column missing from this batch — pad with None
-                    batch_len = len(batch.get("time", next(iter(batch.values()))))
-                    merged[col_name].extend([None] * batch_len)
-
-        return merged
+        with self._all_locks():
+            batches = []
+            for measurement in list(self._buffers.keys() | self._rows.keys()):
+                chunks = self._take(measurement)
+                if chunks is not None:
+                    batches.append((measurement, chunks))
+            self._last_flush_time = time.monotonic()
+
+        error: Optional[Exception] = None
+        for measurement, chunks in batches:
+            try:
+                self._send(measurement, chunks)
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
 
     def close(self) -> None:
         """Close the buffer and flush remaining data."""
         if self._closed:
             return
 
-        with self._lock:
+        if self._timer is not None:
+            # Let the timer finish any flush in progress rather than abandon it
+            self._stop.set()
+            self._timer.join()
+            self._timer = None
+
+        try:
             self._flush_all()
+        finally:
             self._closed = True
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+        self._raise_flush_error()
+
+    def _flush_periodically(self) -> None:
+        """Timer thread: flush everything whenever flush_interval passes without a flush."""
+        while True:
+            delay = self._last_flush_time + self._flush_interval - time.monotonic()
+            if delay > 0:
+                if self._stop.wait(delay):
+                    return
+                continue
+            try:
+                self._flush_all()
+            except Exception as e:
+                if self._error is None:
+                    self._error = e
 
     def __enter__(self) -> BufferedWriter:
-        """Enter context manager."""
+        """Enter context manager, starting the flush timer thread.
+
+        Without a positive flush_interval there is nothing to wait for, so
+        no timer is started and writes keep checking the interval.
+        """
+        if self._timer is None and self._flush_interval > 0:
+            self._timer = threading.Thread(
+                target=self._flush_periodically, name="arc-buffered-timer", daemon=True
+            )
+            self._timer.start()
         return self
 
     def __exit__(self, *args: Any) -> None:
         """Exit context manager, flushing remaining data."""
         self.close()
 
+    @property
+    def batch_sizes(self) -> dict[str, int]:
+        """Get the current flush threshold of each adaptively sized measurement."""
+        with self._all_locks():
+            return dict(self._batch_sizes)
+
     @property
     def pending_count(self) -> int:
         """Get the total number of pending records across all measurements."""
-        with self._lock:
+        with self._all_locks():
             return sum(self._record_counts.values())
 
     @property
     def pending_measurements(self) -> dict[str, int]:
         """Get pending record counts by measurement."""
-        with self._lock:
+        with self._all_locks():
             return dict(self._record_counts)
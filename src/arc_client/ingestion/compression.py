@@ -1,21 +1,61 @@
 """Compression utilities for Arc ingestion.
 
 Arc supports gzip compression for ingestion payloads. Compressed payloads
-are auto-detected by the magic bytes (0x1f 0x8b) at the start.
+are auto-detected by the magic bytes (0x1f 0x8b) at the start. zstd is
+available as a faster alternative when the zstandard package is installed.
+
+When python-isal is installed (``pip install arc-tsdb-client[fast]``), gzip
+output is produced by Intel ISA-L, several times faster than zlib at low
+levels for a slightly larger payload.
 """
 
 from __future__ import annotations
 
+import asyncio
 import gzip
+import importlib
 import io
+import sys
+import threading
+import zlib
+from typing import IO, Any, AsyncIterator, Iterator, Optional, Union
+
+# wbits for a gzip header and trailer around the deflate stream
+_GZIP_WBITS = 31
+# zlib.compress() takes wbits from Python 3.11. Being one-shot, it skips
+# the compressobj setup, which dominates on small payloads (~5x at 2 KiB).
+_ZLIB_ONESHOT_GZIP = sys.version_info >= (3, 11)
+
+# Payloads at least this large are probed before being compressed
+_PROBE_MIN_BYTES = 64 * 1024
+# Number and size of the slices compressed by the probe
+_PROBE_SLICES = 4
+_PROBE_SLICE_BYTES = 1024
+# Probed samples that shrink less than this are sent uncompressed
+_PROBE_MAX_RATIO = 0.95
+
+
+def _load_isal() -> Any:
+    """Return isal.isal_zlib, or None if python-isal is not installed."""
+    try:
+        return importlib.import_module("isal.isal_zlib")
+    except ImportError:
+        return None
+
 
+_isal_zlib = _load_isal()
 
-def compress_gzip(data: bytes, level: int = 6) -> bytes:
+
+def compress_gzip(data: bytes, level: int = 1) -> bytes:
     """Compress data using gzip.
 
+    Level 1 compresses roughly twice as fast as the zlib default of 6,
+    with only a small size penalty on MessagePack payloads. With ISA-L,
+    levels 1-9 map onto its levels 1-3.
+
     Args:
         data: Raw bytes to compress.
-        level: Compression level (0-9). Default 6 is a good balance.
+        level: Compression level (0-9). Default 1 favours speed.
             0 = no compression, 9 = maximum compression.
 
     Returns:
@@ -27,10 +67,217 @@ def compress_gzip(data: bytes, level: int = 6) -> bytes:
         >>> compressed[:2]  # Magic bytes
         b'\\x1f\\x8b'
     """
-    buf = io.BytesIO()
-    with gzip.GzipFile(fileobj=buf, mode="wb", compresslevel=level) as f:
-        f.write(data)
-    return buf.getvalue()
+    if _isal_zlib is not None and level > 0:
+        result: bytes = _isal_zlib.compress(data, min(3, (level + 2) // 3), wbits=_GZIP_WBITS)
+        return result
+    if _ZLIB_ONESHOT_GZIP:
+        return zlib.compress(data, level, wbits=_GZIP_WBITS)  # type: ignore[call-arg]
+    compressor = zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+def iter_gzip(
+    data: Union[bytes, memoryview], level: int = 1, chunk_size: int = 65536
+) -> Iterator[bytes]:
+    """Compress data with gzip, yielding the output as it is produced.
+
+    Passed as a request body, this lets httpx send each compressed chunk
+    while the rest is still being compressed: the socket drains what was
+    already written while the next chunk is compressed, and the full
+    compressed copy of a large payload is never held in memory. The
+    concatenated chunks are a single gzip stream, equivalent to
+    ``compress_gzip(data, level)``.
+
+    Args:
+        data: Raw bytes to compress.
+        level: Compression level (0-9), as for ``compress_gzip``.
+        chunk_size: Bytes of input compressed per step.
+
+    Yields:
+        Non-empty chunks of the gzip stream.
+    """
+    compressor = compressobj("gzip", level)
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        chunk = compressor.compress(view[start : start + chunk_size])
+        if chunk:
+            yield chunk
+    yield compressor.flush()
+
+
+async def compress_gzip_stream(
+    data: Union[bytes, memoryview], level: int = 1, chunk_size: int = 256 * 1024
+) -> AsyncIterator[bytes]:
+    """Async variant of ``iter_gzip`` for async request bodies.
+
+    Each step is compressed in a worker thread, so a large body never
+    blocks the event loop. The default step is larger than ``iter_gzip``'s
+    to amortise the thread hop.
+
+    Args:
+        data: Raw bytes to compress.
+        level: Compression level (0-9), as for ``compress_gzip``.
+        chunk_size: Bytes of input compressed per step.
+
+    Yields:
+        Non-empty chunks of the gzip stream.
+    """
+    chunks = iter_gzip(data, level, chunk_size)
+    while True:
+        chunk = await asyncio.to_thread(next, chunks, b"")
+        if not chunk:
+            return
+        yield chunk
+
+
+def gzip_stream(fileobj: IO[bytes], level: int = 1) -> gzip.GzipFile:
+    """Open a writable gzip stream on top of a file object.
+
+    Data written to the returned file is compressed as it arrives, so an
+    encoder such as ``msgpack.Packer`` can be fed piecewise without first
+    building the whole uncompressed payload. Close the returned file to
+    write the gzip trailer; ``fileobj`` itself is left open.
+
+    Args:
+        fileobj: Binary file the compressed stream is written to.
+        level: Compression level (0-9), as for ``compress_gzip``.
+
+    Returns:
+        A writable gzip file (ISA-L backed when python-isal is installed).
+
+    Example:
+        >>> buf = io.BytesIO()
+        >>> with gzip_stream(buf) as out:
+        ...     out.write(packer.pack(columns))
+        >>> body = buf.getvalue()
+    """
+    if _isal_zlib is not None and level > 0:
+        igzip: Any = importlib.import_module("isal.igzip")
+        stream: gzip.GzipFile = igzip.IGzipFile(
+            fileobj=fileobj, mode="wb", compresslevel=min(3, (level + 2) // 3)
+        )
+        return stream
+    return gzip.GzipFile(fileobj=fileobj, mode="wb", compresslevel=level)
+
+
+def looks_compressible(data: bytes) -> bool:
+    """Estimate whether compressing data is worth the CPU.
+
+    Large payloads are probed by compressing a few slices spread across
+    them at the fastest zlib level, which costs tens of microseconds. If
+    the samples barely shrink (already-compressed or random bytes), the
+    full payload would not either, so it is better sent as-is. Smaller
+    payloads are not probed; compressing them is cheap enough.
+
+    Args:
+        data: Raw bytes to check.
+
+    Returns:
+        False if the data appears incompressible.
+    """
+    size = len(data)
+    if size < _PROBE_MIN_BYTES:
+        return True
+    step = size // _PROBE_SLICES
+    sample = b"".join(data[start : start + _PROBE_SLICE_BYTES] for start in range(0, size, step))
+    return len(zlib.compress(sample, 1)) < len(sample) * _PROBE_MAX_RATIO
+
+
+def compress_zstd(data: bytes, level: int = 3) -> bytes:
+    """Compress data using zstd.
+
+    For columnar numeric payloads zstd typically compresses faster and
+    smaller than gzip. Compression contexts are reused per thread and
+    level, which saves their setup on every small payload.
+
+    Args:
+        data: Raw bytes to compress.
+        level: Compression level (1-22). Default 3.
+
+    Returns:
+        Zstd compressed bytes.
+
+    Raises:
+        ImportError: If zstandard is not installed.
+    """
+    result: bytes = _zstd_compressor(level).compress(data)
+    return result
+
+
+_zstd_local = threading.local()
+
+
+def _zstd_compressor(level: int) -> Any:
+    """Return this thread's ZstdCompressor for a level; they are not thread-safe."""
+    compressors: Optional[dict[int, Any]] = getattr(_zstd_local, "compressors", None)
+    if compressors is None:
+        compressors = _zstd_local.compressors = {}
+    compressor = compressors.get(level)
+    if compressor is None:
+        compressor = compressors[level] = _load_zstandard().ZstdCompressor(level=level)
+    return compressor
+
+
+def _load_zstandard() -> Any:
+    """Import zstandard, with an install hint if it is missing."""
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError as e:
+        raise ImportError(
+            "zstandard is required for zstd compression. "
+            "Install it with: pip install arc-tsdb-client[zstd]"
+        ) from e
+
+
+def compressobj(codec: str = "gzip", level: Optional[int] = None) -> Any:
+    """Return an incremental compressor for the given codec.
+
+    The object has zlib's ``compress(data)`` / ``flush()`` interface, and
+    the concatenated output equals ``compress_payload`` of the whole input.
+
+    Args:
+        codec: "gzip" or "zstd".
+        level: Compression level. None uses the codec's default.
+
+    Returns:
+        A compressor object.
+
+    Raises:
+        ValueError: If the codec is not supported.
+        ImportError: If zstd is requested and zstandard is not installed.
+    """
+    if codec == "gzip":
+        level = 1 if level is None else level
+        if _isal_zlib is not None and level > 0:
+            return _isal_zlib.compressobj(min(3, (level + 2) // 3), zlib.DEFLATED, _GZIP_WBITS)
+        return zlib.compressobj(level, zlib.DEFLATED, _GZIP_WBITS)
+    if codec == "zstd":
+        # A fresh context: a shared one could be interleaved by two callers
+        return _load_zstandard().ZstdCompressor(level=3 if level is None else level).compressobj()
+    raise ValueError(f"Unsupported compression codec: {codec}")
+
+
+def compress_payload(data: bytes, codec: str = "gzip", level: Optional[int] = None) -> bytes:
+    """Compress data with the given codec.
+
+    The codec name doubles as the HTTP Content-Encoding value.
+
+    Args:
+        data: Raw bytes to compress.
+        codec: "gzip" or "zstd".
+        level: Compression level. None uses the codec's default.
+
+    Returns:
+        Compressed bytes.
+
+    Raises:
+        ValueError: If the codec is not supported.
+    """
+    if codec == "gzip":
+        return compress_gzip(data) if level is None else compress_gzip(data, level)
+    if codec == "zstd":
+        return compress_zstd(data) if level is None else compress_zstd(data, level)
+    raise ValueError(f"Unsupported compression codec: {codec}")
 
 
 def decompress_gzip(data: bytes) -> bytes:
@@ -65,3 +312,17 @@ def is_gzipped(data: bytes) -> bool:
         True if data appears to be gzip compressed.
     """
     return len(data) >= 2 and data[0] == 0x1F and data[1] == 0x8B
+
+
+def is_zstd(data: bytes) -> bool:
+    """Check if data is zstd compressed.
+
+    Zstd frames start with magic bytes 0x28 0xB5 0x2F 0xFD.
+
+    Args:
+        data: Bytes to check.
+
+    Returns:
+        True if data appears to be zstd compressed.
+    """
+    return data[:4] == b"\x28\xb5\x2f\xfd"
@@ -15,6 +15,7 @@ Line Protocol is provided for compatibility with existing tooling.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Optional
 
 from arc_client.exceptions import ArcValidationError
@@ -61,32 +62,31 @@ def format_line_protocol(
     if not fields:
         raise ArcValidationError("Fields cannot be empty")
 
-    # Escape measurement name
-    escaped_measurement = _escape_measurement(measurement)
+    # Built as one list of pieces joined once at the end. Measurements,
+    # keys and whole tag sets repeat from point to point, so their escaped
+    # forms are cached.
+    parts = [_escape_measurement(measurement)]
 
-    # Build tag set
-    tag_str = ""
     if tags:
-        sorted_tags = sorted(tags.items())  # Sort for deterministic output
-        tag_parts = [f"{_escape_tag_key(k)}={_escape_tag_value(v)}" for k, v in sorted_tags if v]
-        if tag_parts:
-            tag_str = "," + ",".join(tag_parts)
+        parts.append(_format_tags(tuple(tags.items())))
 
-    # Build field set
-    field_parts = []
+    separator = " "
     for key, value in fields.items():
-        escaped_key = _escape_field_key(key)
-        formatted_value = _format_field_value(value)
-        field_parts.append(f"{escaped_key}={formatted_value}")
-    field_str = ",".join(field_parts)
-
-    # Build timestamp (convert to nanoseconds for Line Protocol)
-    ts_str = ""
+        kind = type(value)
+        if kind is float:
+            formatted = repr(value)
+        elif kind is int:
+            formatted = f"{value}i"
+        else:
+            formatted = _format_field_value(value)
+        parts.append(f"{separator}{_escape_field_key(key)}={formatted}")
+        separator = ","
+
+    # Timestamp in nanoseconds for Line Protocol
     if timestamp is not None:
-        ts_ns = _normalize_to_nanoseconds(timestamp, time_unit)
-        ts_str = f" {ts_ns}"
+        parts.append(f" {_normalize_to_nanoseconds(timestamp, time_unit)}")
 
-    return f"{escaped_measurement}{tag_str} {field_str}{ts_str}"
+    return "".join(parts)
 
 
 def format_lines(
@@ -163,60 +163,150 @@ def format_columnar_as_lines(
     if not columns:
         raise ArcValidationError("Columns cannot be empty")
 
-    # Get number of records
+    if not measurement:
+        raise ArcValidationError("Measurement name cannot be empty")
+
+    # Each column is formatted into its line fragments in one pass, so the
+    # per-row work is only gathering and joining strings. Tag fragments are
+    # "" when the value is missing, field fragments None.
+    prefix = _escape_measurement(measurement)
+    tag_parts = [
+        _format_tag_column(name, _column_values(columns[name]))
+        for name in sorted(columns)
+        if name in tag_columns and name != time_column
+    ]
+    field_parts = [
+        _format_field_column(name, _column_values(values))
+        for name, values in columns.items()
+        if name not in tag_columns and name != time_column
+    ]
+
     num_records = len(next(iter(columns.values())))
+    if time_column in columns:
+        multiplier = _normalize_to_nanoseconds(1, time_unit)
+        suffixes = [
+            "" if ts is None else f" {ts * multiplier}"
+            for ts in _column_values(columns[time_column])
+        ]
+    else:
+        suffixes = [""] * num_records
 
     lines = []
-    for i in range(num_records):
-        fields = {}
-        tags = {}
-        timestamp = None
-
-        for col_name, values in columns.items():
-            value = values[i]
-
-            if col_name == time_column:
-                timestamp = value
-            elif col_name in tag_columns:
-                tags[col_name] = str(value) if value is not None else ""
-            else:
-                if value is not None:
-                    fields[col_name] = value
-
-        if fields:  # Only create line if there are fields
-            line = format_line_protocol(
-                measurement=measurement,
-                fields=fields,
-                tags=tags if tags else None,
-                timestamp=timestamp,
-                time_unit=time_unit,
-            )
-            lines.append(line)
+    tag_rows = zip(*tag_parts) if tag_parts else [()] * num_records
+    for tags, fields, suffix in zip(tag_rows, zip(*field_parts), suffixes):
+        field_str = ",".join([part for part in fields if part is not None])
+        if field_str:  # Only create line if there are fields
+            lines.append(f"{prefix}{''.join(tags)} {field_str}{suffix}")
 
     return "\n".join(lines)
 
 
+# Leading values of a tag column checked for repeats
+_TAG_SAMPLE = 256
+
+
+def _column_values(values: Any) -> Any:
+    """Return a column as a list of Python scalars (NumPy arrays via tolist)."""
+    return values.tolist() if hasattr(values, "tolist") else values
+
+
+def _format_tag_column(name: str, values: Any) -> list[str]:
+    """Format a tag column as ",key=value" fragments, "" for missing values.
+
+    Tag columns are usually low-cardinality. When the leading values are
+    strings that repeat, each distinct value is escaped once and the
+    fragments are looked up; otherwise every value is escaped in turn.
+    Only string columns are deduplicated, since equal numbers of different
+    types (1, 1.0, True) would share one fragment.
+    """
+    key = _escape_tag_key(name)
+    sample = values[:_TAG_SAMPLE]
+    if all(type(value) is str for value in sample) and len(set(sample)) * 2 <= len(sample):
+        distinct = set(values)
+        if all(type(value) is str or value is None for value in distinct):
+            fragments = {value: _tag_fragment(key, value) for value in distinct}
+            return [fragments[value] for value in values]
+
+    parts = []
+    for value in values:
+        if value is None:
+            parts.append("")
+            continue
+        value = str(value)
+        if value:
+            value = value.replace(",", r"\,").replace("=", r"\=").replace(" ", r"\ ")
+            parts.append(f",{key}={value}")
+        else:
+            parts.append("")
+    return parts
+
+
+def _tag_fragment(key: str, value: Any) -> str:
+    """Format one escaped ",key=value" tag fragment, "" for a missing value."""
+    if value is None:
+        return ""
+    value = str(value)
+    if not value:
+        return ""
+    value = value.replace(",", r"\,").replace("=", r"\=").replace(" ", r"\ ")
+    return f",{key}={value}"
+
+
+def _format_field_column(name: str, values: Any) -> list[Optional[str]]:
+    """Format a field column as "key=value" fragments, None for missing values."""
+    key = _escape_field_key(name)
+    parts: list[Optional[str]] = []
+    for value in values:
+        kind = type(value)
+        if kind is float:
+            parts.append(f"{key}={value!r}")
+        elif kind is int:
+            parts.append(f"{key}={value}i")
+        elif value is None:
+            parts.append(None)
+        else:
+            parts.append(f"{key}={_format_field_value(value)}")
+    return parts
+
+
+# Escaping uses chained str.replace rather than str.translate: replace
+# returns its input untouched when there is nothing to escape, the common
+# case, and measured several times faster on short names.
+
+
+@lru_cache(maxsize=1024)
 def _escape_measurement(measurement: str) -> str:
     """Escape special characters in measurement name."""
-    # Escape commas and spaces
     return measurement.replace(",", r"\,").replace(" ", r"\ ")
 
 
+@lru_cache(maxsize=4096)
 def _escape_tag_key(key: str) -> str:
     """Escape special characters in tag key."""
     return key.replace(",", r"\,").replace("=", r"\=").replace(" ", r"\ ")
 
 
-def _escape_tag_value(value: str) -> str:
-    """Escape special characters in tag value."""
-    return value.replace(",", r"\,").replace("=", r"\=").replace(" ", r"\ ")
-
-
+@lru_cache(maxsize=4096)
 def _escape_field_key(key: str) -> str:
     """Escape special characters in field key."""
     return key.replace(",", r"\,").replace("=", r"\=").replace(" ", r"\ ")
 
 
+@lru_cache(maxsize=4096)
+def _format_tags(items: tuple[tuple[str, str], ...]) -> str:
+    """Format a tag set as sorted ",key=value" pairs, skipping empty values.
+
+    Cached per tag set: series repeat the same tags on every point. Tag
+    sets that never repeat pay for a cache miss instead.
+    """
+    parts = []
+    for key, value in sorted(items):  # Sort for deterministic output
+        if value:
+            value = value.replace(",", r"\,").replace("=", r"\=").replace(" ", r"\ ")
+            parts.append(f",{_escape_tag_key(key)}={value}")
+    return "".join(parts)
+
+
 def _format_field_value(value: Any) -> str:
     """Format a field value for Line Protocol.
 
@@ -226,6 +316,14 @@ def _format_field_value(value: Any) -> str:
     - Boolean: true/false
     - String: "value" (quoted)
     """
+    # Exact-type checks first, most common first: they skip the isinstance
+    # walk for plain floats and ints. bool is tested before int below since
+    # it subclasses int.
+    kind = type(value)
+    if kind is float:
+        return repr(value)
+    if kind is int:
+        return f"{value}i"
     if isinstance(value, bool):
         return "true" if value else "false"
     elif isinstance(value, int):
@@ -25,18 +25,23 @@ Row Format (LEGACY):
 
 from __future__ import annotations
 
+import os
 import time
-from typing import Any, Optional
+from functools import lru_cache, singledispatch
+from operator import itemgetter
+from typing import Any, Callable, Iterator, Optional
 
 import msgpack
 
 from arc_client.exceptions import ArcValidationError
+from arc_client.ingestion.compression import compressobj
 
 
 def encode_columnar(
     measurement: str,
     columns: dict[str, list[Any]],
     time_unit: str = "us",
+    float_precision: str = "f64",
 ) -> bytes:
     """Encode columnar data to MessagePack format.
 
@@ -51,6 +56,9 @@ def encode_columnar(
         time_unit: Unit of timestamps in the 'time' column.
             Options: "s" (seconds), "ms" (milliseconds), "us" (microseconds).
             Default is "us" (microseconds).
+        float_precision: "f64" (default) or "f32". With "f32", float values
+            outside the time column are sent as 32-bit floats, halving their
+            size for metrics that don't need double precision.
 
     Returns:
         MessagePack encoded bytes ready for Arc ingestion.
@@ -74,30 +82,295 @@ def encode_columnar(
     if not columns:
         raise ArcValidationError("Columns cannot be empty")
 
-    # Validate all arrays have the same length
-    lengths = {name: len(values) for name, values in columns.items()}
-    unique_lengths = set(lengths.values())
-    if len(unique_lengths) > 1:
-        raise ArcValidationError(f"All columns must have the same length. Got: {lengths}")
+    # The per-schema encoder packs the caller's columns as they are, adding a
+    # generated or rescaled time column without copying the dict
+    encoder = _columnar_encoder(measurement, tuple(columns), time_unit, float_precision)
+    return encoder.encode(columns)
 
-    # Ensure 'time' column exists
-    if "time" not in columns:
-        # Generate timestamps if missing
-        num_records = next(iter(lengths.values())) if lengths else 0
-        now_us = int(time.time() * 1_000_000)
-        columns = dict(columns)  # Make a copy
-        columns["time"] = [now_us + i for i in range(num_records)]
 
-    # Normalize timestamps to microseconds if needed
-    columns = _normalize_timestamps(columns, time_unit)
+_TIME_MULTIPLIERS = {"s": 1_000_000, "ms": 1_000, "us": 1}
+_FLOAT_PRECISIONS = ("f64", "f32")
 
-    payload = {
-        "m": measurement,
-        "columns": columns,
-    }
 
-    result: bytes = msgpack.packb(payload, use_bin_type=True)
-    return result
+def _map_header(size: int) -> bytes:
+    """Return the MessagePack header for a map with ``size`` entries."""
+    if size < 16:
+        return bytes((0x80 | size,))
+    if size < 0x10000:
+        return b"\xde" + size.to_bytes(2, "big")
+    return b"\xdf" + size.to_bytes(4, "big")
+
+
+class _ColumnarEncoder:
+    """Columnar encoder specialised to one measurement, column list and time unit.
+
+    Time-series writers send the same measurement and columns over and over,
+    so everything that depends only on the schema is worked out once, in
+    the constructor: validation, the ``{"m": ..., "columns": {...}}``
+    header and the column order. Encoding a payload then only converts and
+    packs the column values. Instances are cached by ``_columnar_encoder``.
+    """
+
+    def __init__(
+        self, measurement: str, names: tuple[str, ...], time_unit: str, float_precision: str
+    ) -> None:
+        if not measurement:
+            raise ArcValidationError("Measurement name cannot be empty")
+        if not names:
+            raise ArcValidationError("Columns cannot be empty")
+        multiplier = _TIME_MULTIPLIERS.get(time_unit)
+        if multiplier is None:
+            raise ArcValidationError(f"Invalid time_unit: {time_unit}. Must be 's', 'ms', or 'us'")
+        if float_precision not in _FLOAT_PRECISIONS:
+            raise ArcValidationError(
+                f"Invalid float_precision: {float_precision}. Must be 'f64' or 'f32'"
+            )
+
+        self._measurement = measurement
+        self._single_float = float_precision == "f32"
+        self._multiplier = multiplier
+        self._generate_time = "time" not in names
+        self._names = [*names, "time"] if self._generate_time else list(names)
+        self._time_index = self._names.index("time")
+        self._packed_names = [msgpack.packb(name, use_bin_type=True) for name in self._names]
+        self._header = (
+            _map_header(2)
+            + msgpack.packb("m", use_bin_type=True)
+            + msgpack.packb(measurement, use_bin_type=True)
+            + msgpack.packb("columns", use_bin_type=True)
+            + _map_header(len(self._names))
+        )
+
+    def _values(
+        self, columns: dict[str, Any]
+    ) -> tuple[list[Any], tuple[Callable[[Any], list[Any]], ...]]:
+        """Return the column values to pack, time included, and their list converters."""
+        values = list(columns.values())
+        num_records = len(values[0])
+        for column in values:
+            if len(column) != num_records:
+                lengths = {name: len(v) for name, v in columns.items()}
+                raise ArcValidationError(f"All columns must have the same length. Got: {lengths}")
+
+        if self._generate_time:
+            # Generated timestamps are already in microseconds
+            now_us = int(time.time() * 1_000_000)
+            values.append([now_us + i for i in range(num_records)])
+        elif self._multiplier != 1 and num_records:
+            values[self._time_index] = _scale_times(values[self._time_index], self._multiplier)
+
+        return values, _column_encoders(tuple(map(type, values)))
+
+    def encode(self, columns: dict[str, Any]) -> bytes:
+        """Encode one payload; the bytes equal ``packb`` of the payload dict.
+
+        Everything is packed into one Packer buffer that is copied out once,
+        rather than packing each column to its own bytes and joining them.
+        A fresh Packer per call: a cached one would keep its buffer at the
+        size of the largest payload ever encoded.
+        """
+        values, encoders = self._values(columns)
+        packer = msgpack.Packer(use_bin_type=True, autoreset=False)
+        packer.pack_map_header(2)
+        packer.pack("m")
+        packer.pack(self._measurement)
+        packer.pack("columns")
+        packer.pack_map_header(len(self._names))
+
+        segments = []
+        pack_single = self._single_float_packer()
+        for index, (name, column, to_list) in enumerate(zip(self._names, values, encoders)):
+            packer.pack(name)
+            packed = self._prepacked(index, column, to_list, pack_single)
+            if packed is None:
+                packer.pack(to_list(column))
+            else:
+                # Packed separately; splice it in between Packer segments
+                segments.append(packer.bytes())
+                segments.append(packed)
+                packer.reset()
+        if not segments:
+            result: bytes = packer.bytes()
+            return result
+        segments.append(packer.bytes())
+        return b"".join(segments)
+
+    def parts(self, columns: dict[str, Any]) -> Iterator[bytes]:
+        """Encode one payload as pieces, one column at a time.
+
+        The pieces concatenate to ``encode(columns)``; consumers such as a
+        streaming compressor never need the whole payload at once.
+        """
+        values, encoders = self._values(columns)
+        pack = msgpack.Packer(use_bin_type=True).pack
+        pack_single = self._single_float_packer()
+        yield self._header
+        for index, (packed_name, column, to_list) in enumerate(
+            zip(self._packed_names, values, encoders)
+        ):
+            yield packed_name
+            packed = self._prepacked(index, column, to_list, pack_single)
+            yield pack(to_list(column)) if packed is None else packed
+
+    def _single_float_packer(self) -> Optional[Callable[[Any], bytes]]:
+        """Return a pack function writing floats as float32, if enabled."""
+        if not self._single_float:
+            return None
+        packer = msgpack.Packer(use_bin_type=True, use_single_float=True)
+        pack: Callable[[Any], bytes] = packer.pack
+        return pack
+
+    def _prepacked(
+        self,
+        index: int,
+        column: Any,
+        to_list: Callable[[Any], Any],
+        pack_single: Optional[Callable[[Any], bytes]],
+    ) -> Optional[bytes]:
+        """Pack a column outside the main Packer, or return None to pack it there.
+
+        NumPy columns go through ``_pack_ndarray``. With float32 enabled,
+        every column but time is packed by a single-float Packer.
+        """
+        single = pack_single is not None and index != self._time_index
+        if type(column).__module__ == "numpy":
+            packed = _pack_ndarray(column, single)
+            if packed is not None:
+                return packed
+        if single and pack_single is not None:
+            return pack_single(to_list(column))
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _columnar_encoder(
+    measurement: str, names: tuple[str, ...], time_unit: str, float_precision: str = "f64"
+) -> _ColumnarEncoder:
+    """Return the cached encoder for a schema.
+
+    Raises:
+        ArcValidationError: If the measurement, columns, time unit or float
+            precision are invalid.
+    """
+    return _ColumnarEncoder(measurement, names, time_unit, float_precision)
+
+
+def _array_header(size: int) -> bytes:
+    """Return the MessagePack header for an array with ``size`` items."""
+    if size < 16:
+        return bytes((0x90 | size,))
+    if size < 0x10000:
+        return b"\xdc" + size.to_bytes(2, "big")
+    return b"\xdd" + size.to_bytes(4, "big")
+
+
+# How MessagePack packs a Python int, by value range: (low, high, tag, layout).
+# A tag of None is a fixint, where the value is the whole encoding.
+_INT_ENCODINGS = (
+    (0, 1 << 7, None, "u1"),
+    (-32, 0, None, "i1"),
+    (1 << 7, 1 << 8, 0xCC, "u1"),
+    (1 << 8, 1 << 16, 0xCD, ">u2"),
+    (1 << 16, 1 << 32, 0xCE, ">u4"),
+    (1 << 32, 1 << 64, 0xCF, ">u8"),
+    (-(1 << 7), -32, 0xD0, "i1"),
+    (-(1 << 15), -(1 << 7), 0xD1, ">i2"),
+    (-(1 << 31), -(1 << 15), 0xD2, ">i4"),
+    (-(1 << 63), -(1 << 31), 0xD3, ">i8"),
+)
+
+
+def _pack_ndarray(values: Any, single_float: bool = False) -> Optional[bytes]:
+    """Pack a 1-D NumPy column as MessagePack without boxing its values.
+
+    Python floats always pack as a 0xcb tag plus a big-endian double, and
+    booleans as a single 0xc2/0xc3 byte. Integers use the smallest encoding
+    for their value, so an integer column qualifies when its minimum and
+    maximum share one encoding, as counters (fixints) and microsecond
+    timestamps (0xcf plus a uint64) do. For those columns the packed array
+    is laid out directly by NumPy as (tag, value) records, producing the
+    same bytes as ``tolist()`` followed by packing, several times faster.
+
+    With ``single_float``, floats are packed as a 0xca tag plus a big-endian
+    float32, as a Packer with ``use_single_float`` would.
+
+    Returns:
+        The packed array, or None if the column needs the generic path.
+    """
+    if values.ndim != 1 or len(values) < _VECTORIZE_MIN:
+        return None
+
+    import numpy as np
+
+    header = _array_header(len(values))
+    kind = values.dtype.kind
+    if kind == "b":
+        flags: bytes = (values.view("u1") + 0xC2).tobytes()
+        return header + flags
+    if kind == "f" and values.dtype.itemsize <= 8:
+        tag: Optional[int] = 0xCA if single_float else 0xCB
+        layout = ">f4" if single_float else ">f8"
+    elif kind in "iu":
+        encoding = _int_encoding(int(values.min()), int(values.max()))
+        if encoding is None:
+            return None
+        tag, layout = encoding
+    else:
+        return None
+
+    if tag is None:
+        fixints: bytes = values.astype(layout).tobytes()
+        return header + fixints
+    records = np.empty(len(values), dtype=[("tag", "u1"), ("value", layout)])
+    records["tag"] = tag
+    records["value"] = values
+    return header + records.tobytes()
+
+
+def _int_encoding(low: int, high: int) -> Optional[tuple[Optional[int], str]]:
+    """Return the (tag, layout) shared by all integers in [low, high], if any."""
+    for start, stop, tag, layout in _INT_ENCODINGS:
+        if start <= low and high < stop:
+            return tag, layout
+    return None
+
+
+def encode_columnar_compressed(
+    measurement: str,
+    columns: dict[str, Any],
+    time_unit: str = "us",
+    codec: str = "gzip",
+    level: Optional[int] = None,
+) -> bytes:
+    """Encode columnar data to MessagePack and compress it in one pass.
+
+    Each column is packed and fed to the compressor before the next one is
+    packed, so the uncompressed payload is never assembled as a whole.
+    Peak memory is one packed column plus the compressed output rather
+    than the full raw payload. Equivalent to compressing the output of
+    ``encode_columnar``.
+
+    Args:
+        measurement: The measurement (table) name.
+        columns: Dictionary mapping column names to lists or arrays of values.
+        time_unit: Unit of timestamps - "s", "ms", or "us" (default).
+        codec: "gzip" or "zstd".
+        level: Compression level. None uses the codec's default.
+
+    Returns:
+        Compressed MessagePack bytes.
+
+    Raises:
+        ArcValidationError: If the data is invalid.
+        ValueError: If the codec is not supported.
+    """
+    compressor = compressobj(codec, level)
+    chunks = [
+        compressor.compress(part)
+        for part in _columnar_encoder(measurement, tuple(columns), time_unit).parts(columns)
+    ]
+    chunks.append(compressor.flush())
+    return b"".join(chunks)
 
 
 def encode_records(records: list[dict[str, Any]]) -> bytes:
@@ -129,13 +402,16 @@ def encode_records(records: list[dict[str, Any]]) -> bytes:
     if not records:
         raise ArcValidationError("Records list cannot be empty")
 
-    payload = []
+    # Records are packed one at a time into a single growing buffer, so
+    # the list of converted record dicts is never built. A fresh Packer per
+    # call (about a microsecond) rather than a cached one, since a cached
+    # buffer would stay as large as the biggest batch ever encoded.
+    packer = msgpack.Packer(use_bin_type=True, autoreset=False)
+    packer.pack_array_header(len(records))
+    pack = packer.pack
     for record in records:
-        item = _encode_single_record(record)
-        payload.append(item)
-
-    # Wrap in batch format
-    result: bytes = msgpack.packb(payload, use_bin_type=True)
+        pack(_encode_single_record(record))
+    result: bytes = packer.bytes()
     return result
 
 
@@ -172,6 +448,67 @@ def encode_batch(items: list[dict[str, Any]]) -> bytes:
     return result
 
 
+@singledispatch
+def column_values(values: Any) -> list[Any]:
+    """Return a column as a list that MessagePack can pack.
+
+    Lists pass through untouched. NumPy arrays, pandas Series and PyArrow
+    arrays are converted with their C-level ``tolist()``/``to_pylist()``
+    instead of being iterated element by element in Python.
+
+    Dispatch is on the column type. The first time an array type is seen,
+    its converter is registered so later columns of that type go straight
+    to it.
+
+    Args:
+        values: Column values (list, tuple, or array-like).
+
+    Returns:
+        The column values as a list.
+    """
+    return _converter(type(values))(values)
+
+
+@column_values.register(list)
+def _list_values(values: list[Any]) -> list[Any]:
+    return values
+
+
+def _call_tolist(values: Any) -> list[Any]:
+    result: list[Any] = values.tolist()
+    return result
+
+
+def _call_to_pylist(values: Any) -> list[Any]:
+    result: list[Any] = values.to_pylist()
+    return result
+
+
+def _converter(cls: type) -> Callable[[Any], list[Any]]:
+    """Return the list conversion for a column type, registering array types."""
+    impl: Callable[[Any], list[Any]] = column_values.dispatch(cls)
+    if impl is not column_values.registry[object]:
+        return impl
+    if hasattr(cls, "tolist"):
+        impl = _call_tolist
+    elif hasattr(cls, "to_pylist"):
+        impl = _call_to_pylist
+    else:
+        return list
+    column_values.register(cls, impl)
+    return impl
+
+
+@lru_cache(maxsize=256)
+def _column_encoders(types: tuple[type, ...]) -> tuple[Callable[[Any], list[Any]], ...]:
+    """Resolve the list conversion for each column type once.
+
+    Keyed by the tuple of column types, so repeated writes with the same
+    column layout call each converter directly instead of dispatching.
+    """
+    return tuple(_converter(cls) for cls in types)
+
+
 def _encode_single_record(record: dict[str, Any]) -> dict[str, Any]:
     """Convert a record dict to Arc's row format payload."""
     measurement = record.get("measurement")
@@ -196,43 +533,44 @@ def _encode_single_record(record: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-def _normalize_timestamps(columns: dict[str, list[Any]], time_unit: str) -> dict[str, list[Any]]:
-    """Normalize timestamps to microseconds.
+# Below this many values a list comprehension beats the NumPy round trip
+_VECTORIZE_MIN = 32
+_INT64_MAX = 2**63 - 1
 
-    Arc expects timestamps in microseconds. This function converts from
-    the specified unit to microseconds.
 
-    Args:
-        columns: Column dictionary containing a 'time' column.
-        time_unit: Input unit - "s", "ms", or "us".
+def _scale_times(values: Any, multiplier: int) -> Any:
+    """Multiply a time column into integer microseconds.
 
-    Returns:
-        Column dictionary with normalized timestamps.
+    NumPy arrays and longer lists are scaled in one vectorised operation
+    and returned as an int64 array, which the encoder converts in C.
+    Floats are multiplied before truncating, as ``int(t * multiplier)``
+    does. Short lists, values NumPy can't type, and installs without
+    NumPy use the plain comprehension, as do values whose scaled result
+    would overflow int64.
     """
-    if "time" not in columns:
-        return columns
-
-    time_col = columns["time"]
-    if not time_col:
-        return columns
-
-    # Determine multiplier
-    if time_unit == "s":
-        multiplier = 1_000_000
-    elif time_unit == "ms":
-        multiplier = 1_000
-    elif time_unit == "us":
-        multiplier = 1
-    else:
-        raise ArcValidationError(f"Invalid time_unit: {time_unit}. Must be 's', 'ms', or 'us'")
-
-    if multiplier == 1:
-        return columns
-
-    # Convert timestamps
-    columns = dict(columns)  # Make a copy
-    columns["time"] = [int(t * multiplier) for t in time_col]
-    return columns
+    if type(values).__module__ == "numpy" or len(values) >= _VECTORIZE_MIN:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            array = np.asarray(values)
+            # int64 arithmetic wraps silently, so anything whose scaled value
+            # would leave the int64 range takes the Python-int path
+            bound = _INT64_MAX // multiplier
+            if array.dtype.kind in "iu" and (
+                not array.size or (int(array.min()) >= -bound and int(array.max()) <= bound)
+            ):
+                return array.astype(np.int64) * multiplier
+            if array.dtype.kind == "f" and (
+                not array.size
+                or (np.isfinite(array).all() and np.abs(array).max() * multiplier < 2.0**63)
+            ):
+                return (array * multiplier).astype(np.int64)
+            if array.dtype.kind in "iuf":
+                # NumPy scalars wrap too; scale plain Python numbers instead
+                values = array.tolist()
+    return [int(t * multiplier) for t in values]
 
 
 def dataframe_to_columnar(
@@ -240,10 +578,12 @@ def dataframe_to_columnar(
     measurement: str,
     time_column: str = "time",
     tag_columns: Optional[list[str]] = None,
-) -> dict[str, list[Any]]:
+) -> dict[str, Any]:
     """Convert a DataFrame to columnar format for Arc ingestion.
 
-    Supports pandas DataFrames, Polars DataFrames, and PyArrow Tables.
+    Supports pandas DataFrames, Polars DataFrames, PyArrow Tables and
+    RecordBatches. Everything is converted through Arrow, so numeric
+    columns come out as NumPy arrays without iterating rows in Python.
 
     Args:
         df: DataFrame to convert (pandas, polars, or pyarrow).
@@ -252,7 +592,7 @@ def dataframe_to_columnar(
         tag_columns: Columns to treat as tags (string dimensions).
 
     Returns:
-        Dictionary of column name to list of values.
+        Dictionary of column name to list or NumPy array of values.
 
     Raises:
         ArcValidationError: If DataFrame is invalid or time column is missing.
@@ -263,12 +603,29 @@ def dataframe_to_columnar(
     # Detect DataFrame type and convert
     df_type = type(df).__module__
 
+    # Checked before the Arrow conversion so the error names the caller's type
+    if ("pandas" in df_type or "polars" in df_type) and time_column not in df.columns:
+        raise ArcValidationError(f"Time column '{time_column}' not found in DataFrame")
+
     if "pandas" in df_type:
-        return _pandas_to_columnar(df, time_column, tag_columns)
+        import pyarrow as pa
+
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False, nthreads=os.cpu_count())
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Mixed-type object columns have no Arrow type; convert row-wise
+            return _pandas_to_columnar(df, time_column, tag_columns)
+        columns = arrow_to_columnar(table, time_column, tag_columns)
+        # Arrow turns NaN into null; send NumPy float columns as they are so
+        # NaN stays NaN on the wire and the column keeps its fast path
+        for name, dtype in df.dtypes.items():
+            if dtype.kind == "f" and name != time_column:
+                columns[name] = df[name].to_numpy()
+        return columns
     elif "polars" in df_type:
-        return _polars_to_columnar(df, time_column, tag_columns)
+        return arrow_to_columnar(df.to_arrow(), time_column, tag_columns)
     elif "pyarrow" in df_type:
-        return _arrow_to_columnar(df, time_column, tag_columns)
+        return arrow_to_columnar(df, time_column, tag_columns)
     else:
         raise ArcValidationError(
             f"Unsupported DataFrame type: {type(df)}. "
@@ -276,14 +633,20 @@ def dataframe_to_columnar(
         )
 
 
-def _pandas_to_columnar(df: Any, time_column: str, tag_columns: list[str]) -> dict[str, list[Any]]:
+def _is_dataframe(data: Any) -> bool:
+    """Return True for pandas/Polars DataFrames and Arrow tables or batches."""
+    module = type(data).__module__.partition(".")[0]
+    return module in ("pandas", "polars", "pyarrow") or hasattr(data, "__arrow_c_stream__")
+
+
+def _pandas_to_columnar(df: Any, time_column: str, tag_columns: list[str]) -> dict[str, Any]:
     """Convert pandas DataFrame to columnar format."""
     import pandas as pd
 
     if time_column not in df.columns:
         raise ArcValidationError(f"Time column '{time_column}' not found in DataFrame")
 
-    columns: dict[str, list[Any]] = {}
+    columns: dict[str, Any] = {}
 
     for col_name in df.columns:
         col = df[col_name]
@@ -291,59 +654,185 @@ def _pandas_to_columnar(df: Any, time_column: str, tag_columns: list[str]) -> di
         # Handle timestamp column
         if col_name == time_column:
             if pd.api.types.is_datetime64_any_dtype(col):
-                # Convert datetime to microseconds since epoch
-                columns["time"] = (col.astype("int64") // 1000).tolist()
+                # Microseconds since epoch, whatever the column's unit (pandas
+                # 2+ allows s/ms/us as well as ns); tz-aware values are UTC.
+                # A no-op view when the column is already in microseconds.
+                columns["time"] = col.values.astype("datetime64[us]", copy=False).view("int64")
             else:
                 # Assume already numeric timestamps
-                columns["time"] = col.tolist()
+                columns["time"] = _series_values(col)
         else:
-            # Convert to Python native types
-            columns[col_name] = col.tolist()
+            columns[col_name] = _series_values(col)
 
     return columns
 
 
-def _polars_to_columnar(df: Any, time_column: str, tag_columns: list[str]) -> dict[str, list[Any]]:
-    """Convert Polars DataFrame to columnar format."""
-    if time_column not in df.columns:
-        raise ArcValidationError(f"Time column '{time_column}' not found in DataFrame")
+def _series_values(col: Any) -> Any:
+    """Keep numeric pandas columns as NumPy arrays; box everything else."""
+    if col.dtype.kind in "biuf":
+        return col.to_numpy()
+    return col.tolist()
 
-    columns: dict[str, list[Any]] = {}
 
-    for col_name in df.columns:
-        col = df[col_name]
+def arrow_to_columnar(
+    table: Any,
+    time_column: str = "time",
+    tag_columns: Optional[list[str]] = None,
+) -> dict[str, Any]:
+    """Convert a PyArrow Table or RecordBatch to columnar format.
 
-        # Handle timestamp column
-        if col_name == time_column:
-            # Check if it's a datetime type
-            if "datetime" in str(col.dtype).lower() or "date" in str(col.dtype).lower():
-                # Convert to microseconds
-                columns["time"] = col.cast(df.__class__._from_arrow.__self__.Int64).to_list()
-            else:
-                columns["time"] = col.to_list()
-        else:
-            columns[col_name] = col.to_list()
+    Null-free integer, float and boolean columns are returned as NumPy arrays
+    (zero-copy for single-chunk columns); other columns become lists.
+    Timestamp columns are converted to integer microseconds.
 
-    return columns
+    Dictionary-encoded columns (pandas categoricals, Polars categoricals)
+    are decoded by indexing their categories with the codes, which makes
+    one Python object per distinct value rather than one per row. String
+    tag columns are dictionary-encoded first, since tags repeat by nature.
+
+    Args:
+        table: pyarrow.Table or pyarrow.RecordBatch.
+        time_column: Name of the timestamp column.
+        tag_columns: Columns to treat as tags (string dimensions).
 
+    Returns:
+        Dictionary of column name to list or NumPy array of values.
+
+    Raises:
+        ArcValidationError: If the time column is missing.
+    """
+    import pyarrow as pa
 
-def _arrow_to_columnar(
-    table: Any, time_column: str, tag_columns: list[str]
-) -> dict[str, list[Any]]:
-    """Convert PyArrow Table to columnar format."""
     if time_column not in table.column_names:
         raise ArcValidationError(f"Time column '{time_column}' not found in Table")
 
-    columns: dict[str, list[Any]] = {}
+    columns: dict[str, Any] = {}
+    tags = set(tag_columns or ())
 
     for col_name in table.column_names:
         col = table.column(col_name)
 
         # Handle timestamp column
         if col_name == time_column:
-            # Convert to Python list - Arrow handles timestamp conversion
-            columns["time"] = col.to_pylist()
+            if pa.types.is_timestamp(col.type):
+                col = col.cast(pa.timestamp("us", tz=col.type.tz), safe=False).cast(pa.int64())
+            columns["time"] = _arrow_values(col)
         else:
-            columns[col_name] = col.to_pylist()
+            if col_name in tags and (
+                pa.types.is_string(col.type) or pa.types.is_large_string(col.type)
+            ):
+                col = col.dictionary_encode()
+            columns[col_name] = _arrow_values(col)
 
     return columns
+
+
+def _arrow_values(col: Any) -> Any:
+    """Return an Arrow column as a NumPy array when lossless, else a list."""
+    import pyarrow as pa
+
+    if pa.types.is_dictionary(col.type) and _is_scalar_type(col.type.value_type):
+        return _dictionary_values(col)
+
+    if col.null_count == 0 and (
+        pa.types.is_integer(col.type)
+        or pa.types.is_floating(col.type)
+        or pa.types.is_boolean(col.type)
+    ):
+        return col.to_numpy()
+    return col.to_pylist()
+
+
+def records_to_columnar(
+    records: list[dict[str, Any]],
+) -> Optional[tuple[str, dict[str, list[Any]]]]:
+    """Transpose uniform row-format records into one columnar payload.
+
+    Records qualify when they all share one measurement and the same tag
+    and field keys, and each has a timestamp. Tags and fields become
+    columns next to ``time``, as they do for DataFrames. Each column is
+    gathered with a single ``map(itemgetter(...))`` pass, so the records
+    are never walked key by key in Python.
+
+    Args:
+        records: Records in the ``write_records`` format.
+
+    Returns:
+        ``(measurement, columns)``, or None if the records are not uniform
+        and need the row format.
+    """
+    if not records:
+        return None
+    first = records[0]
+    measurement = first.get("measurement")
+    if not measurement or not first.get("fields"):
+        return None
+    field_keys = tuple(first["fields"])
+    tag_keys = tuple(first.get("tags") or ())
+    if len({"time", *field_keys, *tag_keys}) != 1 + len(field_keys) + len(tag_keys):
+        return None  # Names collide; only the row format keeps them apart
+
+    try:
+        if set(map(itemgetter("measurement"), records)) != {measurement}:
+            return None
+        times = list(map(itemgetter("timestamp"), records))
+        fields = list(map(itemgetter("fields"), records))
+        tags = list(map(itemgetter("tags"), records)) if tag_keys else []
+    except KeyError:
+        return None
+    if None in times:
+        return None
+    # Anything but dicts (e.g. "tags": None) is left to the row encoder
+    if set(map(type, fields)) != {dict}:
+        return None
+    if tag_keys and set(map(type, tags)) != {dict}:
+        return None
+    # With equal sizes, finding every key of the first record below means
+    # each record has exactly the same keys
+    if set(map(len, fields)) != {len(field_keys)}:
+        return None
+    if tag_keys and set(map(len, tags)) != {len(tag_keys)}:
+        return None
+    if not tag_keys and any(record.get("tags") for record in records):
+        return None
+
+    columns: dict[str, list[Any]] = {"time": times}
+    try:
+        for key in tag_keys:
+            columns[key] = list(map(itemgetter(key), tags))
+        for key in field_keys:
+            columns[key] = list(map(itemgetter(key), fields))
+    except KeyError:
+        return None
+    return measurement, columns
+
+
+def _is_scalar_type(arrow_type: Any) -> bool:
+    """Return True for Arrow string, integer, float and boolean types."""
+    import pyarrow as pa
+
+    return bool(
+        pa.types.is_string(arrow_type)
+        or pa.types.is_large_string(arrow_type)
+        or pa.types.is_integer(arrow_type)
+        or pa.types.is_floating(arrow_type)
+        or pa.types.is_boolean(arrow_type)
+    )
+
+
+def _dictionary_values(col: Any) -> list[Any]:
+    """Decode a dictionary-encoded Arrow column to a list via its codes.
+
+    ``to_pylist()`` on a dictionary column boxes every row separately and
+    is over 100x slower; taking from an object array of the categories
+    reuses one Python object per distinct value. Nulls index an extra
+    trailing None category.
+    """
+    import numpy as np
+
+    values: list[Any] = []
+    for chunk in getattr(col, "chunks", [col]):
+        categories = np.array([*chunk.dictionary.to_pylist(), None], dtype=object)
+        codes = chunk.indices.fill_null(len(categories) - 1).to_numpy(zero_copy_only=False)
+        values.extend(categories[codes].tolist())
+    return values
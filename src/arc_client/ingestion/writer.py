@@ -2,22 +2,31 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union
 
 from arc_client.config import ClientConfig
 from arc_client.exceptions import ArcIngestionError, ArcValidationError
 from arc_client.http.sync_http import SyncHTTPClient
-from arc_client.ingestion.compression import compress_gzip
+from arc_client.ingestion.compression import compress_payload, iter_gzip, looks_compressible
 from arc_client.ingestion.line_protocol import format_line_protocol
 from arc_client.ingestion.msgpack import (
+    _is_dataframe,
+    arrow_to_columnar,
     dataframe_to_columnar,
     encode_columnar,
     encode_records,
+    records_to_columnar,
 )
 
 if TYPE_CHECKING:
     from arc_client.ingestion.buffered import BufferedWriter
 
+# gzip bodies at least this large are compressed while they are sent
+_STREAM_MIN_BYTES = 1024 * 1024
+# Longest a point buffered by write_point waits before it is sent
+_POINT_FLUSH_INTERVAL = 0.5
+
 
 class WriteClient:
     """Synchronous client for writing data to Arc.
@@ -47,6 +56,52 @@ class WriteClient:
     def __init__(self, http: SyncHTTPClient, config: ClientConfig) -> None:
         self._http = http
         self._config = config
+        self._points: Optional[BufferedWriter] = None
+        self._points_lock = threading.Lock()
+
+    def write(
+        self,
+        data: Any,
+        measurement: Optional[str] = None,
+        database: Optional[str] = None,
+        compress: Optional[bool] = None,
+    ) -> None:
+        """Write data in the fastest format that fits it.
+
+        - a string or list of strings is sent as Line Protocol
+        - a dict of columns, or a pandas/Polars DataFrame or Arrow table,
+          is sent as MessagePack columnar
+        - a list of records (the ``write_records`` format) is transposed
+          to columnar when all records share a measurement, tag and field
+          keys and carry timestamps, and sent in row format otherwise
+
+        Args:
+            data: Lines, columns, a DataFrame, or records.
+            measurement: The measurement name; required for columns and
+                DataFrames, which don't carry one.
+            database: Target database. Uses client default if not specified.
+            compress: Whether to compress. Uses client default if not specified.
+
+        Raises:
+            ArcIngestionError: If the write fails.
+            ArcValidationError: If the data is invalid or of an unsupported type.
+        """
+        if isinstance(data, str) or (isinstance(data, list) and data and isinstance(data[0], str)):
+            self.write_line_protocol(data, database, compress)
+        elif isinstance(data, list):
+            columnar = records_to_columnar(data)
+            if columnar is None:
+                self.write_records(data, database, compress)
+            else:
+                self.write_columnar(*columnar, database, compress)
+        elif not measurement:
+            raise ArcValidationError("measurement is required to write columns or DataFrames")
+        elif isinstance(data, dict):
+            self.write_columnar(measurement, data, database, compress)
+        elif _is_dataframe(data):
+            self.write_dataframe(data, measurement, database, compress=compress)
+        else:
+            raise ArcValidationError(f"Unsupported data type for write(): {type(data).__name__}")
 
     def write_columnar(
         self,
@@ -55,6 +110,7 @@ class WriteClient:
         database: Optional[str] = None,
         compress: Optional[bool] = None,
         time_unit: str = "us",
+        float_precision: str = "f64",
     ) -> None:
         """Write columnar data to Arc (highest performance method).
 
@@ -67,8 +123,10 @@ class WriteClient:
                 Must include a 'time' column with timestamps.
                 All arrays must have the same length.
             database: Target database. Uses client default if not specified.
-            compress: Whether to gzip compress. Uses client default if not specified.
+            compress: Whether to compress. Uses client default if not specified.
             time_unit: Unit of timestamps - "s", "ms", or "us" (default).
+            float_precision: "f64" (default) or "f32" to send float fields as
+                32-bit floats. Timestamps keep full precision.
 
         Raises:
             ArcIngestionError: If the write fails.
@@ -86,7 +144,7 @@ class WriteClient:
         """
         # Encode to MessagePack
         try:
-            data = encode_columnar(measurement, columns, time_unit)
+            data = encode_columnar(measurement, columns, time_unit, float_precision)
         except ArcValidationError:
             raise
         except Exception as e:
@@ -112,7 +170,7 @@ class WriteClient:
                 - fields: dict - Field values (required)
                 - tags: dict - Tag values (optional)
             database: Target database. Uses client default if not specified.
-            compress: Whether to gzip compress. Uses client default if not specified.
+            compress: Whether to compress. Uses client default if not specified.
 
         Raises:
             ArcIngestionError: If the write fails.
@@ -147,7 +205,7 @@ class WriteClient:
             database: Target database. Uses client default if not specified.
             time_column: Name of the timestamp column. Default "time".
             tag_columns: Columns to treat as tags (dimensions).
-            compress: Whether to gzip compress. Uses client default if not specified.
+            compress: Whether to compress. Uses client default if not specified.
 
         Raises:
             ArcIngestionError: If the write fails.
@@ -171,6 +229,45 @@ class WriteClient:
 
         self.write_columnar(measurement, columns, database, compress)
 
+    def write_arrow(
+        self,
+        table: Any,
+        measurement: str,
+        database: Optional[str] = None,
+        time_column: str = "time",
+        tag_columns: Optional[list[str]] = None,
+        compress: Optional[bool] = None,
+    ) -> None:
+        """Write a PyArrow Table or RecordBatch to Arc.
+
+        Numeric columns are handed to the encoder as NumPy views of the
+        Arrow buffers, so no Python-level row iteration takes place.
+
+        Args:
+            table: pyarrow.Table or pyarrow.RecordBatch.
+            measurement: The measurement (table) name.
+            database: Target database. Uses client default if not specified.
+            time_column: Name of the timestamp column. Default "time".
+            tag_columns: Columns to treat as tags (dimensions).
+            compress: Whether to compress. Uses client default if not specified.
+
+        Raises:
+            ArcIngestionError: If the write fails.
+            ArcValidationError: If the table is invalid.
+
+        Example:
+            >>> table = pa.table({"time": [1633024800000000], "usage": [45.2]})
+            >>> client.write.write_arrow(table, measurement="cpu")
+        """
+        try:
+            columns = arrow_to_columnar(table, time_column, tag_columns)
+        except ArcValidationError:
+            raise
+        except Exception as e:
+            raise ArcValidationError(f"Failed to convert Arrow data: {e}") from e
+
+        self.write_columnar(measurement, columns, database, compress)
+
     def write_line_protocol(
         self,
         lines: str | list[str],
@@ -185,7 +282,7 @@ class WriteClient:
         Args:
             lines: Line Protocol string or list of lines.
             database: Target database. Uses client default if not specified.
-            compress: Whether to gzip compress. Uses client default if not specified.
+            compress: Whether to compress. Uses client default if not specified.
 
         Raises:
             ArcIngestionError: If the write fails.
@@ -217,26 +314,74 @@ class WriteClient:
             tags: Optional dictionary of tag values.
             timestamp: Optional timestamp in microseconds.
             database: Target database. Uses client default if not specified.
-            compress: Whether to gzip compress. Uses client default if not specified.
+            compress: Whether to compress. Uses client default if not specified.
+
+        With ``point_batch_size`` set in the config, points for the default
+        database are buffered instead and sent as columnar batches when the
+        batch fills, every ``_POINT_FLUSH_INTERVAL`` seconds, and on
+        ``close()``. Points without a timestamp then get the client's clock.
+        Errors from background sends are raised by a later call.
         """
+        if self._config.point_batch_size and database is None and compress is None:
+            points = self._points or self._open_points()
+            points.write(
+                {
+                    "measurement": measurement,
+                    "fields": fields,
+                    "tags": tags or {},
+                    "timestamp": timestamp,
+                }
+            )
+            return
         line = format_line_protocol(measurement, fields, tags, timestamp)
         self._write_line_protocol(line.encode("utf-8"), database, compress)
 
+    def _open_points(self) -> BufferedWriter:
+        """Create the buffer behind batched ``write_point`` calls."""
+        from arc_client.ingestion.buffered import BufferedWriter
+
+        with self._points_lock:
+            if self._points is None:
+                points = BufferedWriter(self, self._config.point_batch_size, _POINT_FLUSH_INTERVAL)
+                self._points = points.__enter__()
+            return self._points
+
+    def close(self) -> None:
+        """Send any points buffered by ``write_point``."""
+        with self._points_lock:
+            points, self._points = self._points, None
+        if points is not None:
+            points.close()
+
     def buffered(
         self,
         batch_size: int = 10000,
         flush_interval: float = 5.0,
+        max_pending_flushes: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        min_batch: Optional[int] = None,
+        max_batch: Optional[int] = None,
     ) -> BufferedWriter:
         """Create a buffered writer for automatic batching.
 
         The buffered writer accumulates records and flushes them in batches
         for optimal throughput. It flushes automatically when:
         - batch_size records have accumulated
+        - the buffered data reaches an estimated max_bytes
         - flush_interval seconds have passed since last flush
 
         Args:
             batch_size: Maximum number of records per batch. Default 10000.
             flush_interval: Maximum seconds between flushes. Default 5.0.
+            max_pending_flushes: If set, send batches from a background
+                thread and block writers once this many are queued.
+            max_bytes: Estimated buffered bytes per measurement that trigger
+                a flush. Default 16 MiB.
+            min_batch: Lower bound when adapting each measurement's batch
+                size to its write rate and flush latency. Defaults to
+                batch_size (no adaptation).
+            max_batch: Upper bound for the adaptive batch size. Defaults to
+                batch_size.
 
         Returns:
             BufferedWriter context manager.
@@ -247,9 +392,44 @@ class WriteClient:
             ...         buffer.write(record)
             ...     # Auto-flushes on exit
         """
-        from arc_client.ingestion.buffered import BufferedWriter
+        from arc_client.ingestion.buffered import DEFAULT_MAX_BYTES, BufferedWriter
+
+        return BufferedWriter(
+            self,
+            batch_size,
+            flush_interval,
+            max_pending_flushes,
+            DEFAULT_MAX_BYTES if max_bytes is None else max_bytes,
+            min_batch,
+            max_batch,
+        )
+
+    def _compress(
+        self, data: bytes, compress: Optional[bool]
+    ) -> tuple[Union[bytes, Iterator[bytes]], Optional[str]]:
+        """Compress a request body per the config.
+
+        Bodies below ``compression_min_bytes`` fit in a packet or so and
+        are sent uncompressed, as are large bodies that a quick probe finds
+        incompressible.
+
+        gzip bodies of ``_STREAM_MIN_BYTES`` or more are returned as a
+        stream that is compressed as httpx sends it (chunked), so the
+        network transfer of each chunk overlaps compressing the next.
 
-        return BufferedWriter(self, batch_size, flush_interval)
+        Returns:
+            The body to send and its Content-Encoding, or None if uncompressed.
+        """
+        should_compress = compress if compress is not None else self._config.compression
+        if not should_compress or len(data) < self._config.compression_min_bytes:
+            return data, None
+        if not looks_compressible(data):
+            return data, None
+        codec = self._config.compression_codec
+        level = self._config.compression_level
+        if codec == "gzip" and len(data) >= _STREAM_MIN_BYTES:
+            return iter_gzip(data, level), codec
+        return compress_payload(data, codec, level), codec
 
     def _write_msgpack(
         self,
@@ -258,16 +438,13 @@ class WriteClient:
         compress: Optional[bool],
     ) -> None:
         """Send MessagePack data to Arc."""
-        should_compress = compress if compress is not None else self._config.compression
-
-        if should_compress:
-            data = compress_gzip(data)
+        body, encoding = self._compress(data, compress)
 
         headers = {
             "Content-Type": "application/msgpack",
         }
-        if should_compress:
-            headers["Content-Encoding"] = "gzip"
+        if encoding:
+            headers["Content-Encoding"] = encoding
 
         if database:
             headers["x-arc-database"] = database
@@ -275,19 +452,18 @@ class WriteClient:
         try:
             response = self._http.post(
                 "/api/v1/write/msgpack",
-                content=data,
+                content=body,
                 headers=headers,
             )
-            # Arc returns 204 No Content on success
-            if response.status_code not in (200, 204):
-                raise ArcIngestionError(
-                    f"Write failed with status {response.status_code}: {response.text}"
-                )
-        except ArcIngestionError:
-            raise
         except Exception as e:
             raise ArcIngestionError(f"Failed to write data: {e}") from e
 
+        # Arc returns 204 No Content on success
+        if response.status_code not in (200, 204):
+            raise ArcIngestionError(
+                f"Write failed with status {response.status_code}: {response.text}"
+            )
+
     def _write_line_protocol(
         self,
         data: bytes,
@@ -295,16 +471,13 @@ class WriteClient:
         compress: Optional[bool],
     ) -> None:
         """Send Line Protocol data to Arc."""
-        should_compress = compress if compress is not None else self._config.compression
-
-        if should_compress:
-            data = compress_gzip(data)
+        body, encoding = self._compress(data, compress)
 
         headers = {
             "Content-Type": "text/plain",
         }
-        if should_compress:
-            headers["Content-Encoding"] = "gzip"
+        if encoding:
+            headers["Content-Encoding"] = encoding
 
         if database:
             headers["x-arc-database"] = database
@@ -312,15 +485,14 @@ class WriteClient:
         try:
             response = self._http.post(
                 "/api/v1/write/line-protocol",
-                content=data,
+                content=body,
                 headers=headers,
             )
-            # Arc returns 204 No Content on success
-            if response.status_code not in (200, 204):
-                raise ArcIngestionError(
-                    f"Write failed with status {response.status_code}: {response.text}"
-                )
-        except ArcIngestionError:
-            raise
         except Exception as e:
             raise ArcIngestionError(f"Failed to write data: {e}") from e
+
+        # Arc returns 204 No Content on success
+        if response.status_code not in (200, 204):
+            raise ArcIngestionError(
+                f"Write failed with status {response.status_code}: {response.text}"
+            )
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from arc_client._fastjson import loads
 from arc_client.config import ClientConfig
-from arc_client.exceptions import ArcError, ArcValidationError
+from arc_client.exceptions import ArcError
 from arc_client.http.async_http import AsyncHTTPClient
+from arc_client.management.delete import _delete_payload
 from arc_client.models.delete import DeleteConfigResponse, DeleteResponse
 
 
@@ -24,26 +26,11 @@ class AsyncDeleteClient:
         confirm: bool = False,
     ) -> DeleteResponse:
         """Delete data matching the WHERE clause."""
-        if not database:
-            raise ArcValidationError("database is required")
-        if not measurement:
-            raise ArcValidationError("measurement is required")
-        if not where or not where.strip():
-            raise ArcValidationError(
-                "where clause is required. Use '1=1' with confirm=True for full delete"
-            )
-
-        payload = {
-            "database": database,
-            "measurement": measurement,
-            "where": where,
-            "dry_run": dry_run,
-            "confirm": confirm,
-        }
+        payload = _delete_payload(database, measurement, where, dry_run, confirm)
 
         try:
             response = await self._http.post("/api/v1/delete", json=payload)
-            data = response.json()
+            data = loads(response.content)
             return DeleteResponse(**data)
         except ArcError:
             raise
@@ -54,7 +41,7 @@ class AsyncDeleteClient:
         """Get delete configuration settings."""
         try:
             response = await self._http.get("/api/v1/delete/config")
-            data = response.json()
+            data = loads(response.content)
             return DeleteConfigResponse(**data)
         except Exception as e:
             raise ArcError(f"Failed to get delete config: {e}") from e
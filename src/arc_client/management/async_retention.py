@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any, List, Optional
 
+from arc_client._fastjson import loads, parse_list
 from arc_client.config import ClientConfig
 from arc_client.exceptions import ArcError, ArcNotFoundError
 from arc_client.http.async_http import AsyncHTTPClient
@@ -41,7 +42,7 @@ class AsyncRetentionClient:
         }
         try:
             response = await self._http.post("/api/v1/retention", json=payload)
-            data = response.json()
+            data = loads(response.content)
             if not data.get("success", True):
                 raise ArcError(data.get("error", "Failed to create policy"))
             return RetentionPolicy(**data.get("policy", data))
@@ -54,9 +55,9 @@ class AsyncRetentionClient:
         """List all retention policies."""
         try:
             response = await self._http.get("/api/v1/retention")
-            data = response.json()
+            data = loads(response.content)
             policies = data.get("policies", [])
-            return [RetentionPolicy(**p) for p in policies]
+            return parse_list(policies, RetentionPolicy)
         except Exception as e:
             raise ArcError(f"Failed to list retention policies: {e}") from e
 
@@ -64,7 +65,7 @@ class AsyncRetentionClient:
         """Get retention policy details."""
         try:
             response = await self._http.get(f"/api/v1/retention/{policy_id}")
-            data = response.json()
+            data = loads(response.content)
             if not data.get("success", True):
                 error = data.get("error", "Unknown error")
                 if "not found" in error.lower():
@@ -100,7 +101,7 @@ class AsyncRetentionClient:
 
         try:
             response = await self._http.put(f"/api/v1/retention/{policy_id}", json=payload)
-            data = response.json()
+            data = loads(response.content)
             if not data.get("success", True):
                 error = data.get("error", "Unknown error")
                 if "not found" in error.lower():
@@ -116,7 +117,7 @@ class AsyncRetentionClient:
         """Delete a retention policy."""
         try:
             response = await self._http.delete(f"/api/v1/retention/{policy_id}")
-            data = response.json()
+            data = loads(response.content)
             if not data.get("success", True):
                 error = data.get("error", "Unknown error")
                 if "not found" in error.lower():
@@ -134,7 +135,7 @@ class AsyncRetentionClient:
         payload = {"dry_run": dry_run, "confirm": confirm}
         try:
             response = await self._http.post(f"/api/v1/retention/{policy_id}/execute", json=payload)
-            data = response.json()
+            data = loads(response.content)
             return ExecuteRetentionResponse(**data)
         except Exception as e:
             raise ArcError(f"Failed to execute retention policy: {e}") from e
@@ -146,8 +147,8 @@ class AsyncRetentionClient:
                 f"/api/v1/retention/{policy_id}/executions",
                 params={"limit": limit},
             )
-            data = response.json()
+            data = loads(response.content)
             executions = data.get("executions", [])
-            return [RetentionExecution(**e) for e in executions]
+            return parse_list(executions, RetentionExecution)
         except Exception as e:
             raise ArcError(f"Failed to get retention executions: {e}") from e
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, List, Optional, Union
 
+from arc_client._fastjson import loads, parse_list, parse_list_field
 from arc_client.config import ClientConfig
 from arc_client.exceptions import ArcError, ArcNotFoundError
 from arc_client.http.sync_http import SyncHTTPClient
@@ -50,7 +51,7 @@ class ContinuousQueryClient:
         }
         try:
             response = self._http.post("/api/v1/continuous_queries", json=payload)
-            data = response.json()
+            data = loads(response.content)
             if not data.get("success", True):
                 raise ArcError(data.get("error", "Failed to create CQ"))
             return ContinuousQuery(**data.get("query", data))
@@ -71,9 +72,9 @@ class ContinuousQueryClient:
                 params["is_active"] = str(is_active).lower()
 
             response = self._http.get("/api/v1/continuous_queries", params=params)
-            data = response.json()
+            data = loads(response.content)
             queries = data.get("queries", [])
-            return [ContinuousQuery(**q) for q in queries]
+            return parse_list(queries, ContinuousQuery)
         except Exception as e:
             raise ArcError(f"Failed to list continuous queries: {e}") from e
 
@@ -81,7 +82,7 @@ class ContinuousQueryClient:
         """Get continuous query details."""
         try:
             response = self._http.get(f"/api/v1/continuous_queries/{query_id}")
-            data = response.json()
+            data = loads(response.content)
             if not data.get("success", True):
                 error = data.get("error", "Unknown error")
                 if "not found" in error.lower():
@@ -123,7 +124,7 @@ class ContinuousQueryClient:
 
         try:
             response = self._http.put(f"/api/v1/continuous_queries/{query_id}", json=payload)
-            data = response.json()
+            data = loads(response.content)
             if not data.get("success", True):
                 error = data.get("error", "Unknown error")
                 if "not found" in error.lower():
@@ -139,7 +140,7 @@ class ContinuousQueryClient:
         """Delete a continuous query."""
         try:
             response = self._http.delete(f"/api/v1/continuous_queries/{query_id}")
-            data = response.json()
+            data = loads(response.content)
             if not data.get("success", True):
                 error = data.get("error", "Unknown error")
                 if "not found" in error.lower():
@@ -172,7 +173,7 @@ class ContinuousQueryClient:
             response = self._http.post(
                 f"/api/v1/continuous_queries/{query_id}/execute", json=payload
             )
-            data = response.json()
+            data = loads(response.content)
             return ExecuteCQResponse(**data)
         except Exception as e:
             raise ArcError(f"Failed to execute continuous query: {e}") from e
@@ -184,8 +185,6 @@ class ContinuousQueryClient:
                 f"/api/v1/continuous_queries/{query_id}/executions",
                 params={"limit": limit},
             )
-            data = response.json()
-            executions = data.get("executions", [])
-            return [CQExecution(**e) for e in executions]
+            return parse_list_field(response.content, "executions", CQExecution)
         except Exception as e:
             raise ArcError(f"Failed to get CQ executions: {e}") from e
@@ -2,12 +2,42 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from arc_client._fastjson import loads
 from arc_client.config import ClientConfig
 from arc_client.exceptions import ArcError, ArcValidationError
 from arc_client.http.sync_http import SyncHTTPClient
 from arc_client.models.delete import DeleteConfigResponse, DeleteResponse
 
 
+def _delete_payload(
+    database: str, measurement: str, where: str, dry_run: bool, confirm: bool
+) -> dict[str, Any]:
+    """Validate delete arguments and build the request body.
+
+    Shared by the sync and async clients.
+
+    Raises:
+        ArcValidationError: If the database, measurement or WHERE clause is empty.
+    """
+    if not database:
+        raise ArcValidationError("database is required")
+    if not measurement:
+        raise ArcValidationError("measurement is required")
+    if not where or not where.strip():
+        raise ArcValidationError(
+            "where clause is required. Use '1=1' with confirm=True for full delete"
+        )
+    return {
+        "database": database,
+        "measurement": measurement,
+        "where": where,
+        "dry_run": dry_run,
+        "confirm": confirm,
+    }
+
+
 class DeleteClient:
     """Synchronous client for data deletion operations.
 
@@ -27,26 +57,11 @@ class DeleteClient:
         confirm: bool = False,
     ) -> DeleteResponse:
         """Delete data matching the WHERE clause."""
-        if not database:
-            raise ArcValidationError("database is required")
-        if not measurement:
-            raise ArcValidationError("measurement is required")
-        if not where or not where.strip():
-            raise ArcValidationError(
-                "where clause is required. Use '1=1' with confirm=True for full delete"
-            )
-
-        payload = {
-            "database": database,
-            "measurement": measurement,
-            "where": where,
-            "dry_run": dry_run,
-            "confirm": confirm,
-        }
+        payload = _delete_payload(database, measurement, where, dry_run, confirm)
 
         try:
             response = self._http.post("/api/v1/delete", json=payload)
-            data = response.json()
+            data = loads(response.content)
             return DeleteResponse(**data)
         except ArcError:
             raise
@@ -57,7 +72,7 @@ class DeleteClient:
         """Get delete configuration settings."""
         try:
             response = self._http.get("/api/v1/delete/config")
-            data = response.json()
+            data = loads(response.content)
             return DeleteConfigResponse(**data)
         except Exception as e:
             raise ArcError(f"Failed to get delete config: {e}") from e
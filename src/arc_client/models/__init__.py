@@ -1,25 +1,71 @@
-"""Arc client data models."""
-
-from arc_client.models.auth import (
-    CreateTokenResponse,
-    RotateTokenResponse,
-    TokenInfo,
-    TokenListResponse,
-    VerifyResponse,
-)
-from arc_client.models.common import HealthResponse, ReadyResponse
-from arc_client.models.continuous_query import (
-    ContinuousQuery,
-    CQExecution,
-    ExecuteCQResponse,
-)
-from arc_client.models.delete import DeleteConfigResponse, DeleteResponse
-from arc_client.models.query import EstimateResponse, MeasurementInfo, QueryResponse
-from arc_client.models.retention import (
-    ExecuteRetentionResponse,
-    RetentionExecution,
-    RetentionPolicy,
-)
+"""Arc client data models.
+
+Imported lazily on first access so that only the models a program uses
+have their pydantic schemas built.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from arc_client.models.auth import (
+        CreateTokenResponse,
+        RotateTokenResponse,
+        TokenInfo,
+        TokenListResponse,
+        VerifyResponse,
+    )
+    from arc_client.models.common import HealthResponse, ReadyResponse
+    from arc_client.models.continuous_query import (
+        ContinuousQuery,
+        CQExecution,
+        ExecuteCQResponse,
+    )
+    from arc_client.models.delete import DeleteConfigResponse, DeleteResponse
+    from arc_client.models.query import EstimateResponse, MeasurementInfo, QueryResponse
+    from arc_client.models.retention import (
+        ExecuteRetentionResponse,
+        RetentionExecution,
+        RetentionPolicy,
+    )
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    "ContinuousQuery": "arc_client.models.continuous_query",
+    "CQExecution": "arc_client.models.continuous_query",
+    "CreateTokenResponse": "arc_client.models.auth",
+    "DeleteConfigResponse": "arc_client.models.delete",
+    "DeleteResponse": "arc_client.models.delete",
+    "EstimateResponse": "arc_client.models.query",
+    "ExecuteCQResponse": "arc_client.models.continuous_query",
+    "ExecuteRetentionResponse": "arc_client.models.retention",
+    "HealthResponse": "arc_client.models.common",
+    "MeasurementInfo": "arc_client.models.query",
+    "QueryResponse": "arc_client.models.query",
+    "ReadyResponse": "arc_client.models.common",
+    "RetentionExecution": "arc_client.models.retention",
+    "RetentionPolicy": "arc_client.models.retention",
+    "RotateTokenResponse": "arc_client.models.auth",
+    "TokenInfo": "arc_client.models.auth",
+    "TokenListResponse": "arc_client.models.auth",
+    "VerifyResponse": "arc_client.models.auth",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "ContinuousQuery",
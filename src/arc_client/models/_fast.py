@@ -0,0 +1,96 @@
+"""Fast decoders for the hottest response models.
+
+``health()`` and ``verify()`` sit on readiness probes and request paths.
+When msgspec is installed (``pip install arc-tsdb-client[fast]``), their
+bodies are decoded and type-checked in a single C pass into msgspec
+structs, which are then wrapped in the public pydantic models without a
+second validation. Without msgspec, pydantic parses the bytes directly.
+"""
+
+from __future__ import annotations
+
+import importlib
+from datetime import datetime
+from typing import Any, Optional
+
+from arc_client.models.auth import TokenInfo, VerifyResponse
+from arc_client.models.common import HealthResponse
+
+
+def _load_msgspec() -> Any:
+    """Return the msgspec module, or None if it is not installed."""
+    try:
+        return importlib.import_module("msgspec")
+    except ImportError:
+        return None
+
+
+_msgspec = _load_msgspec()
+_HEALTH_DECODER: Any = None
+_VERIFY_DECODER: Any = None
+
+if _msgspec is not None:
+    _HealthStruct = _msgspec.defstruct(
+        "_HealthStruct",
+        [("status", str), ("version", Optional[str], None), ("uptime", Optional[str], None)],
+    )
+    _TokenInfoStruct = _msgspec.defstruct(
+        "_TokenInfoStruct",
+        [
+            ("id", int),
+            ("name", str),
+            ("description", Optional[str], None),
+            ("permissions", list[str], []),
+            ("created_at", Optional[datetime], None),
+            ("last_used_at", Optional[datetime], None),
+            ("enabled", bool, True),
+            ("expires_at", Optional[datetime], None),
+        ],
+    )
+    _VerifyStruct = _msgspec.defstruct(
+        "_VerifyStruct",
+        [
+            ("valid", bool),
+            ("token_info", Optional[_TokenInfoStruct], None),
+            ("permissions", Optional[list[str]], None),
+            ("error", Optional[str], None),
+        ],
+    )
+    _HEALTH_DECODER = _msgspec.json.Decoder(_HealthStruct, strict=False)
+    _VERIFY_DECODER = _msgspec.json.Decoder(_VerifyStruct, strict=False)
+
+
+def _decode(decoder: Any, content: bytes) -> Any:
+    """Decode with msgspec, returning None if it is unavailable or rejects the body."""
+    if decoder is None:
+        return None
+    try:
+        return decoder.decode(content)
+    except _msgspec.MsgspecError:
+        # Let pydantic produce the authoritative result or error
+        return None
+
+
+def decode_health(content: bytes) -> HealthResponse:
+    """Decode a ``/health`` response body."""
+    fast = _decode(_HEALTH_DECODER, content)
+    if fast is None:
+        return HealthResponse.model_validate_json(content)
+    return HealthResponse.model_construct(**_msgspec.structs.asdict(fast))
+
+
+def decode_verify(content: bytes) -> VerifyResponse:
+    """Decode a ``/api/v1/auth/verify`` response body."""
+    fast = _decode(_VERIFY_DECODER, content)
+    if fast is None:
+        return VerifyResponse.model_validate_json(content)
+
+    token_info = None
+    if fast.token_info is not None:
+        token_info = TokenInfo.model_construct(**_msgspec.structs.asdict(fast.token_info))
+    return VerifyResponse.model_construct(
+        valid=fast.valid,
+        token_info=token_info,
+        permissions=fast.permissions,
+        error=fast.error,
+    )
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any, Optional
 
 from pydantic import BaseModel, Field
@@ -28,6 +29,17 @@ class QueryResponse(BaseModel):
     timestamp: Optional[str] = None
     error: Optional[str] = None
 
+    @cached_property
+    def columns_data(self) -> dict[str, list[Any]]:
+        """Result values keyed by column name.
+
+        Transposed from ``data`` on first access and cached, e.g. for
+        ``pd.DataFrame(result.columns_data)``.
+        """
+        if not self.data:
+            return {name: [] for name in self.columns}
+        return {name: list(values) for name, values in zip(self.columns, zip(*self.data))}
+
 
 class EstimateResponse(BaseModel):
     """Response from query estimation.
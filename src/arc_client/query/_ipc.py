@@ -0,0 +1,157 @@
+"""Incremental Arrow IPC stream decoding.
+
+pyarrow's stream reader pulls bytes from a blocking file, which does not fit
+an async response body. ArrowStreamDecoder is push-based instead: byte
+chunks are fed in as they arrive, each IPC message is framed from its
+prefix and flatbuffer header, and the reader is only asked for the next
+batch once that batch is fully buffered. Memory use is bounded by the
+largest single message rather than by the whole result.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections import deque
+from typing import Any, Optional, Union
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+_CONTINUATION = 0xFFFFFFFF
+_RECORD_BATCH = 3  # MessageHeader.RecordBatch in Message.fbs
+
+
+def _message_info(metadata: bytes) -> tuple[int, int]:
+    """Return (header_type, body_length) from serialized Message metadata."""
+    table = struct.unpack_from("<I", metadata, 0)[0]
+    vtable = table - struct.unpack_from("<i", metadata, table)[0]
+    vtable_size = struct.unpack_from("<H", metadata, vtable)[0]
+
+    def field_offset(index: int) -> int:
+        pos = 4 + 2 * index
+        if pos >= vtable_size:
+            return 0
+        offset: int = struct.unpack_from("<H", metadata, vtable + pos)[0]
+        return offset
+
+    offset = field_offset(1)
+    header_type = metadata[table + offset] if offset else 0
+    offset = field_offset(3)
+    body_length = struct.unpack_from("<q", metadata, table + offset)[0] if offset else 0
+    return header_type, body_length
+
+
+class _Fifo:
+    """Minimal readable file that pyarrow consumes from the front.
+
+    Holds whole IPC messages and hands out views into them, so a message
+    is not copied again on its way into pyarrow.
+    """
+
+    closed = False
+
+    def __init__(self) -> None:
+        self._messages: deque[memoryview] = deque()
+
+    def push(self, message: bytes) -> None:
+        self._messages.append(memoryview(message))
+
+    def read(self, size: int = -1) -> Union[bytes, memoryview]:
+        messages = self._messages
+        if size is None or size < 0:
+            size = sum(map(len, messages))
+        if messages and len(messages[0]) >= size:
+            head = messages.popleft()
+            if len(head) > size:
+                messages.appendleft(head[size:])
+            return head[:size]
+
+        parts = []
+        while size > 0 and messages:
+            head = messages.popleft()
+            if len(head) > size:
+                messages.appendleft(head[size:])
+                head = head[:size]
+            parts.append(head)
+            size -= len(head)
+        return b"".join(parts)
+
+
+class ArrowStreamDecoder:
+    """Decode an Arrow IPC stream from byte chunks into record batches.
+
+    Example:
+        >>> decoder = ArrowStreamDecoder()
+        >>> for chunk in response.iter_bytes():
+        ...     for batch in decoder.feed(chunk):
+        ...         process(batch)
+        >>> decoder.close()
+    """
+
+    def __init__(self) -> None:
+        self._pending = bytearray()
+        self._fifo = _Fifo()
+        self._reader: Optional[Any] = None
+        self._finished = False
+
+    @property
+    def schema(self) -> Optional[pa.Schema]:
+        """The stream schema, once its message has been received."""
+        return None if self._reader is None else self._reader.schema
+
+    def feed(self, chunk: bytes) -> list[pa.RecordBatch]:
+        """Add a chunk of the stream and return any batches it completes."""
+        self._pending += chunk
+        batches: list[pa.RecordBatch] = []
+        while not self._finished:
+            message = self._next_message()
+            if message is None:
+                break
+            size, header_type = message
+            with memoryview(self._pending) as view:
+                self._fifo.push(bytes(view[:size]))
+            del self._pending[:size]
+
+            if header_type is None:
+                self._finished = True
+            elif self._reader is None:
+                self._reader = ipc.open_stream(pa.PythonFile(self._fifo, mode="r"))
+            elif header_type == _RECORD_BATCH:
+                batches.append(self._reader.read_next_batch())
+        return batches
+
+    def close(self) -> None:
+        """Check that the stream ended cleanly.
+
+        Raises:
+            pyarrow.ArrowInvalid: If the stream was truncated.
+        """
+        if self._reader is None or self._pending:
+            raise pa.ArrowInvalid("Arrow IPC stream ended before a complete message")
+
+    def _next_message(self) -> Optional[tuple[int, Optional[int]]]:
+        """Return (size, header_type) of the next complete message, if buffered.
+
+        header_type is None for the end-of-stream marker.
+        """
+        buffer = self._pending
+        if len(buffer) < 4:
+            return None
+
+        prefix = 4
+        length = struct.unpack_from("<I", buffer, 0)[0]
+        if length == _CONTINUATION:
+            if len(buffer) < 8:
+                return None
+            length = struct.unpack_from("<i", buffer, 4)[0]
+            prefix = 8
+        if length == 0:
+            return prefix, None
+        if len(buffer) < prefix + length:
+            return None
+
+        header_type, body_length = _message_info(bytes(buffer[prefix : prefix + length]))
+        size = prefix + length + body_length
+        if len(buffer) < size:
+            return None
+        return size, header_type
@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any, Optional
 
 import pyarrow as pa
-import pyarrow.ipc as ipc
 
+from arc_client._fastjson import loads, parse, parse_list
 from arc_client.config import ClientConfig
 from arc_client.exceptions import ArcQueryError, ArcValidationError
 from arc_client.http.async_http import AsyncHTTPClient
 from arc_client.models.query import EstimateResponse, MeasurementInfo, QueryResponse
+from arc_client.query._ipc import ArrowStreamDecoder
+from arc_client.query.executor import (
+    _ARROW_HEADERS,
+    database_headers,
+    query_response,
+    table_to_pandas,
+)
 
 if TYPE_CHECKING:
     pass
@@ -63,26 +71,23 @@ class AsyncQueryClient:
         if not sql or not sql.strip():
             raise ArcValidationError("SQL query cannot be empty")
 
-        headers = {}
-        if database:
-            headers["x-arc-database"] = database
-
         try:
             response = await self._http.post(
                 "/api/v1/query",
                 json={"sql": sql},
-                headers=headers if headers else None,
+                headers=database_headers(database),
             )
 
-            data = response.json()
-            return QueryResponse(**data)
+            return query_response(loads(response.content))
 
         except ArcQueryError:
             raise
         except Exception as e:
             raise ArcQueryError(f"Query failed: {e}") from e
 
-    async def query_pandas(self, sql: str, database: Optional[str] = None) -> Any:
+    async def query_pandas(
+        self, sql: str, database: Optional[str] = None, arrow_dtypes: bool = False
+    ) -> Any:
         """Execute a SQL query and return results as a pandas DataFrame.
 
         Uses Arrow IPC streaming for efficient data transfer. Requires
@@ -91,6 +96,8 @@ class AsyncQueryClient:
         Args:
             sql: SQL query to execute.
             database: Target database. Uses client default if not specified.
+            arrow_dtypes: Back columns with ``pd.ArrowDtype`` instead of NumPy,
+                which avoids copying strings and decimals.
 
         Returns:
             pandas.DataFrame with query results.
@@ -108,7 +115,7 @@ class AsyncQueryClient:
             ) from e
 
         table = await self.query_arrow(sql, database)
-        return table.to_pandas()
+        return table_to_pandas(table, arrow_dtypes)
 
     async def query_polars(self, sql: str, database: Optional[str] = None) -> Any:
         """Execute a SQL query and return results as a Polars DataFrame.
@@ -142,9 +149,9 @@ class AsyncQueryClient:
     async def query_arrow(self, sql: str, database: Optional[str] = None) -> pa.Table:
         """Execute a SQL query and return results as a PyArrow Table.
 
-        Uses Arrow IPC streaming for efficient zero-copy data transfer.
-        This method provides the most efficient way to handle large
-        result sets when you need raw Arrow data.
+        Record batches are decoded as the response body arrives and the
+        table references their buffers, so the full body is never held
+        in memory next to the table.
 
         Args:
             sql: SQL query to execute.
@@ -157,31 +164,57 @@ class AsyncQueryClient:
             ArcQueryError: If the query fails.
             ArcValidationError: If the SQL is invalid.
         """
+        decoder = ArrowStreamDecoder()
+        batches = [batch async for batch in self._arrow_batches(sql, database, decoder)]
+        return pa.Table.from_batches(batches, schema=decoder.schema)
+
+    def query_arrow_stream(
+        self, sql: str, database: Optional[str] = None
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Execute a SQL query and yield results as PyArrow RecordBatches.
+
+        Batches are decoded as the response body arrives, so memory use
+        stays bounded by a single batch instead of the whole result set.
+
+        Args:
+            sql: SQL query to execute.
+            database: Target database. Uses client default if not specified.
+
+        Yields:
+            pyarrow.RecordBatch objects in result order.
+
+        Raises:
+            ArcQueryError: If the query fails.
+            ArcValidationError: If the SQL is invalid.
+        """
+        # Checked here, not in the generator, so the error is raised at the call
         if not sql or not sql.strip():
             raise ArcValidationError("SQL query cannot be empty")
+        return self._arrow_batches(sql, database, ArrowStreamDecoder())
 
-        headers = {
-            "Accept": "application/vnd.apache.arrow.stream",
-        }
-        if database:
-            headers["x-arc-database"] = database
+    async def _arrow_batches(
+        self, sql: str, database: Optional[str], decoder: ArrowStreamDecoder
+    ) -> AsyncIterator[pa.RecordBatch]:
+        """Stream a query and yield batches decoded by the given decoder."""
+        if not sql or not sql.strip():
+            raise ArcValidationError("SQL query cannot be empty")
 
+        headers = database_headers(database, _ARROW_HEADERS)
         try:
-            response = await self._http.post(
-                "/api/v1/query/arrow",
-                json={"sql": sql},
-                headers=headers,
-            )
-
-            # Check if we got JSON error response instead of Arrow
-            content_type = response.headers.get("content-type", "")
-            if "application/json" in content_type:
-                error_data = response.json()
-                raise ArcQueryError(error_data.get("error", "Query failed with unknown error"))
-
-            # Parse Arrow IPC stream
-            reader = ipc.open_stream(response.content)
-            return reader.read_all()
+            async with self._http.stream(
+                "POST", "/api/v1/query/arrow", json={"sql": sql}, headers=headers
+            ) as response:
+                # Check if we got JSON error response instead of Arrow
+                content_type = response.headers.get("content-type", "")
+                if "application/json" in content_type:
+                    await response.aread()
+                    error_data = loads(response.content)
+                    raise ArcQueryError(error_data.get("error", "Query failed with unknown error"))
+
+                async for chunk in response.aiter_bytes():
+                    for batch in decoder.feed(chunk):
+                        yield batch
+                decoder.close()
 
         except ArcQueryError:
             raise
@@ -190,6 +223,36 @@ class AsyncQueryClient:
         except Exception as e:
             raise ArcQueryError(f"Query failed: {e}") from e
 
+    async def query_polars_stream(
+        self, sql: str, database: Optional[str] = None, rechunk: bool = False
+    ) -> Any:
+        """Execute a SQL query and build a Polars DataFrame from streamed batches.
+
+        Args:
+            sql: SQL query to execute.
+            database: Target database. Uses client default if not specified.
+            rechunk: Consolidate the per-batch chunks into contiguous memory.
+
+        Returns:
+            polars.DataFrame with query results.
+
+        Raises:
+            ArcQueryError: If the query fails.
+            ImportError: If polars is not installed.
+        """
+        try:
+            import polars as pl
+        except ImportError as e:
+            raise ImportError(
+                "polars is required for query_polars_stream(). "
+                "Install it with: pip install arc-client[polars]"
+            ) from e
+
+        decoder = ArrowStreamDecoder()
+        batches = [batch async for batch in self._arrow_batches(sql, database, decoder)]
+        table = pa.Table.from_batches(batches, schema=decoder.schema)
+        return pl.from_arrow(table, rechunk=rechunk)
+
     async def estimate(self, sql: str, database: Optional[str] = None) -> EstimateResponse:
         """Estimate the cost of a SQL query.
 
@@ -210,19 +273,14 @@ class AsyncQueryClient:
         if not sql or not sql.strip():
             raise ArcValidationError("SQL query cannot be empty")
 
-        headers = {}
-        if database:
-            headers["x-arc-database"] = database
-
         try:
             response = await self._http.post(
                 "/api/v1/query/estimate",
                 json={"sql": sql},
-                headers=headers if headers else None,
+                headers=database_headers(database),
             )
 
-            data = response.json()
-            return EstimateResponse(**data)
+            return parse(response, EstimateResponse)
 
         except ArcQueryError:
             raise
@@ -248,12 +306,12 @@ class AsyncQueryClient:
                 params["database"] = database
 
             response = await self._http.get("/api/v1/measurements", params=params)
-            data = response.json()
+            data = loads(response.content)
 
             if not data.get("success", True):
                 raise ArcQueryError(data.get("error", "Failed to list measurements"))
 
-            return [MeasurementInfo(**m) for m in data.get("measurements", [])]
+            return parse_list(data.get("measurements", []), MeasurementInfo)
 
         except ArcQueryError:
             raise
@@ -176,3 +176,188 @@ class TestAuthClientVerify:
         assert result.valid is False
         assert result.error == "No token configured"
         http.get.assert_not_called()
+
+    def test_verify_and_list_parse_body(self) -> None:
+        """Test that verify() and list_tokens() decode models from the raw body."""
+        from datetime import datetime
+        from unittest.mock import MagicMock
+
+        import httpx
+
+        from arc_client.auth.manager import AuthClient
+
+        info = {"id": 1, "name": "t", "created_at": "2024-01-01T00:00:00Z"}
+        http = MagicMock()
+        config = MagicMock()
+        config.token = "secret"
+        client = AuthClient(http, config)
+
+        http.get.return_value = httpx.Response(200, json={"valid": True, "token_info": info})
+        result = client.verify()
+        assert result.token_info is not None
+        assert isinstance(result.token_info.created_at, datetime)
+
+        http.get.return_value = httpx.Response(200, json={"success": True, "tokens": [info]})
+        assert [token.id for token in client.list_tokens()] == [1]
+
+
+class TestAsyncAuthClientBulk:
+    """Tests for AsyncAuthClient concurrent helpers."""
+
+    async def test_list_tokens_detailed(self) -> None:
+        """Test that token details are fetched for every listed token."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import httpx
+
+        from arc_client.auth.async_manager import AsyncAuthClient
+
+        async def fake_get(path: str, **kwargs: object) -> httpx.Response:
+            if path == "/api/v1/auth/tokens":
+                tokens = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+                return httpx.Response(200, json={"success": True, "tokens": tokens})
+            token_id = int(path.rsplit("/", 1)[1])
+            token = {"id": token_id, "name": f"t{token_id}", "permissions": ["read"]}
+            return httpx.Response(200, json={"success": True, "token": token})
+
+        http = MagicMock()
+        http.get = AsyncMock(side_effect=fake_get)
+        client = AsyncAuthClient(http, MagicMock())
+
+        tokens = await client.list_tokens_detailed(concurrency=2)
+
+        assert [t.name for t in tokens] == ["t1", "t2"]
+        assert tokens[0].permissions == ["read"]
+
+    async def test_bulk_rotate_preserves_order(self) -> None:
+        """Test that bulk_rotate returns new tokens in input order."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import httpx
+
+        from arc_client.auth.async_manager import AsyncAuthClient
+
+        async def fake_post(path: str, **kwargs: object) -> httpx.Response:
+            token_id = path.split("/")[-2]
+            return httpx.Response(200, json={"success": True, "new_token": f"new-{token_id}"})
+
+        http = MagicMock()
+        http.post = AsyncMock(side_effect=fake_post)
+        client = AsyncAuthClient(http, MagicMock())
+
+        assert await client.bulk_rotate([3, 1, 2]) == ["new-3", "new-1", "new-2"]
+
+
+class TestAsyncAuthClientVerifyCache:
+    """Tests for AsyncAuthClient verify caching."""
+
+    async def test_verify_result_is_cached(self) -> None:
+        """Test that repeated verify() calls reuse the cached result."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import httpx
+
+        from arc_client.auth.async_manager import AsyncAuthClient
+
+        http = MagicMock()
+        http.get = AsyncMock(return_value=httpx.Response(200, json={"valid": True}))
+        config = MagicMock()
+        config.token = "secret"
+        client = AsyncAuthClient(http, config)
+
+        assert (await client.verify()).valid is True
+        assert (await client.verify()).valid is True
+        assert http.get.await_count == 1
+
+        # Token changes made through the client invalidate the cache
+        http.post = AsyncMock(return_value=httpx.Response(200, json={"success": True}))
+        await client.revoke_token(1)
+        await client.verify()
+        assert http.get.await_count == 2
+
+    async def test_verify_parses_nested_token_info(self) -> None:
+        """Test that verify() decodes nested models straight from the body."""
+        from datetime import datetime
+        from unittest.mock import AsyncMock, MagicMock
+
+        import httpx
+
+        from arc_client.auth.async_manager import AsyncAuthClient
+        from arc_client.models.auth import TokenInfo
+
+        body = {
+            "valid": True,
+            "token_info": {"id": 1, "name": "t", "created_at": "2024-01-01T00:00:00Z"},
+        }
+        http = MagicMock()
+        http.get = AsyncMock(return_value=httpx.Response(200, json=body))
+        config = MagicMock()
+        config.token = "secret"
+
+        result = await AsyncAuthClient(http, config).verify()
+        assert isinstance(result.token_info, TokenInfo)
+        assert isinstance(result.token_info.created_at, datetime)
+
+
+class TestTokenHelpers:
+    """Tests for the shared token URL and error helpers."""
+
+    def test_token_url(self) -> None:
+        """Test token URL construction with and without an action suffix."""
+        from arc_client.auth.manager import _token_url
+
+        assert _token_url(42) == "/api/v1/auth/tokens/42"
+        assert _token_url(42, "/rotate") == "/api/v1/auth/tokens/42/rotate"
+
+    def test_raise_from(self) -> None:
+        """Test that failed responses map to the right exception."""
+        import pytest
+
+        from arc_client.auth.manager import _raise_from
+        from arc_client.exceptions import ArcAuthenticationError, ArcNotFoundError
+
+        _raise_from({"success": True}, 1)
+        _raise_from({}, 1)
+        with pytest.raises(ArcNotFoundError, match="Token 7 not found"):
+            _raise_from({"success": False, "error": "Token Not Found"}, 7)
+        with pytest.raises(ArcAuthenticationError, match="forbidden"):
+            _raise_from({"success": False, "error": "forbidden"}, 7)
+
+
+class TestAsyncAuthErrorWrapping:
+    """Tests for AsyncAuthClient error wrapping."""
+
+    async def test_unexpected_errors_are_wrapped(self) -> None:
+        """Test that transport errors become ArcAuthenticationError."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import pytest
+
+        from arc_client.auth.async_manager import AsyncAuthClient
+        from arc_client.exceptions import ArcAuthenticationError
+
+        http = MagicMock()
+        http.post = AsyncMock(side_effect=RuntimeError("boom"))
+        client = AsyncAuthClient(http, MagicMock())
+
+        with pytest.raises(ArcAuthenticationError, match="Failed to rotate token: boom"):
+            await client.rotate_token(1)
+
+    async def test_not_found_passes_through(self) -> None:
+        """Test that ArcNotFoundError is not re-wrapped."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import httpx
+        import pytest
+
+        from arc_client.auth.async_manager import AsyncAuthClient
+        from arc_client.exceptions import ArcNotFoundError
+
+        http = MagicMock()
+        http.get = AsyncMock(
+            return_value=httpx.Response(200, json={"success": False, "error": "not found"})
+        )
+        client = AsyncAuthClient(http, MagicMock())
+
+        with pytest.raises(ArcNotFoundError, match="Token 9 not found"):
+            await client.get_token(9)
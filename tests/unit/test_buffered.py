@@ -0,0 +1,512 @@
+"""Unit tests for buffered writers."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from arc_client.ingestion.async_buffered import AsyncBufferedWriter
+from arc_client.ingestion.buffered import BufferedWriter
+
+
+class TestBufferedWriter:
+    """Tests for BufferedWriter."""
+
+    def test_write_columns_flushes_on_batch_size(self) -> None:
+        """Test that staged chunks are flushed once batch_size is reached."""
+        client = MagicMock()
+        buffer = BufferedWriter(client, batch_size=4, flush_interval=60.0)
+
+        buffer.write_columns("cpu", {"time": [1, 2], "usage": [1.0, 2.0]})
+        client.write_columnar.assert_not_called()
+
+        buffer.write_columns("cpu", {"time": [3, 4], "usage": [3.0, 4.0]})
+        client.write_columnar.assert_called_once()
+        measurement, columns = client.write_columnar.call_args.args
+        assert measurement == "cpu"
+        assert list(columns["time"]) == [1, 2, 3, 4]
+        assert list(columns["usage"]) == [1.0, 2.0, 3.0, 4.0]
+        assert buffer.pending_count == 0
+
+    def test_write_columns_numpy_chunks(self) -> None:
+        """Test that NumPy chunks are concatenated as arrays on flush."""
+        np = pytest.importorskip("numpy")
+
+        client = MagicMock()
+        with BufferedWriter(client, batch_size=100, flush_interval=60.0) as buffer:
+            buffer.write_columns("cpu", {"time": np.arange(3), "usage": np.ones(3)})
+            buffer.write_columns("cpu", {"time": np.arange(3, 5), "usage": np.zeros(2)})
+
+        _, columns = client.write_columnar.call_args.args
+        assert isinstance(columns["time"], np.ndarray)
+        assert columns["time"].tolist() == [0, 1, 2, 3, 4]
+
+    def test_write_columns_typed_array_chunks(self) -> None:
+        """Test that array.array chunks are staged as-is and merged on flush."""
+        from array import array
+
+        client = MagicMock()
+        with BufferedWriter(client, batch_size=100, flush_interval=60.0) as buffer:
+            buffer.write_columns(
+                "cpu", {"time": array("q", [1, 2]), "usage": array("d", [1.0, 2.0])}
+            )
+            buffer.write_columns("cpu", {"time": array("q", [3]), "usage": array("d", [3.0])})
+
+        _, columns = client.write_columnar.call_args.args
+        assert columns == {"time": [1, 2, 3], "usage": [1.0, 2.0, 3.0]}
+
+    def test_sparse_columns_padded_with_none(self) -> None:
+        """Test that columns missing from some records are padded with None."""
+        client = MagicMock()
+        with BufferedWriter(client, batch_size=100, flush_interval=60.0) as buffer:
+            buffer.write({"measurement": "cpu", "timestamp": 1, "fields": {"a": 1.0}})
+            buffer.write({"measurement": "cpu", "timestamp": 2, "fields": {"b": 2.0}})
+
+        _, columns = client.write_columnar.call_args.args
+        assert columns["time"] == [1, 2]
+        assert columns["a"] == [1.0, None]
+        assert columns["b"] == [None, 2.0]
+
+    def test_row_schema_reused_across_flushes(self) -> None:
+        """Test that records are staged column-wise and keep write order."""
+        client = MagicMock()
+        buffer = BufferedWriter(client, batch_size=2, flush_interval=60.0)
+        record = {"measurement": "cpu", "fields": {"usage": 1.0}, "tags": {"host": "a"}}
+
+        buffer.write({**record, "timestamp": 1})
+        buffer.write({**record, "timestamp": 2})
+        first = client.write_columnar.call_args.args[1]
+        buffer.write({**record, "timestamp": 3})
+        buffer.write_columns("cpu", {"time": [4], "usage": [4.0], "host": ["b"]})
+
+        assert first == {"time": [1, 2], "usage": [1.0, 1.0], "host": ["a", "a"]}
+        assert buffer._rows["cpu"].schema == ("time", "usage", "host")
+        _, columns = client.write_columnar.call_args.args
+        assert columns["time"] == [3, 4]
+        assert columns["host"] == ["a", "b"]
+        # Earlier batches are not mutated by later writes
+        assert first["time"] == [1, 2]
+
+    def test_background_flushes_are_sent_on_flush(self) -> None:
+        """Test that queued flushes are sent by the worker before flush() returns."""
+        client = MagicMock()
+        buffer = BufferedWriter(client, batch_size=2, flush_interval=60.0, max_pending_flushes=1)
+
+        for start in range(0, 6, 2):
+            buffer.write_columns("cpu", {"time": [start, start + 1]})
+        buffer.flush()
+
+        assert client.write_columnar.call_count == 3
+        buffer.close()
+
+    def test_background_flushes_run_in_parallel(self) -> None:
+        """Test that up to max_pending_flushes batches are sent concurrently."""
+        import threading
+
+        started = threading.Barrier(2, timeout=5)
+        client = MagicMock()
+        client.write_columnar.side_effect = lambda *args: started.wait()
+        buffer = BufferedWriter(client, batch_size=1, flush_interval=60.0, max_pending_flushes=2)
+
+        buffer.write_columns("cpu", {"time": [1]})
+        buffer.write_columns("cpu", {"time": [2]})
+        buffer.close()
+
+        assert client.write_columnar.call_count == 2
+        assert not started.broken
+
+    def test_large_batches_split_across_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a pooled batch over _SPLIT_BYTES is sent as several row ranges."""
+        from arc_client.ingestion import buffered
+
+        monkeypatch.setattr(buffered, "_SPLIT_BYTES", 100)
+        client = MagicMock()
+        buffer = BufferedWriter(client, batch_size=1000, flush_interval=60.0, max_pending_flushes=3)
+
+        buffer.write_columns("cpu", {"time": list(range(20)), "usage": [1.0] * 20})
+        buffer.write_columns("cpu", {"time": list(range(20, 30)), "usage": [2.0] * 10})
+        buffer.close()
+
+        sent = [call.args[1] for call in client.write_columnar.call_args_list]
+        assert len(sent) == 3
+        assert sorted(t for part in sent for t in part["time"]) == list(range(30))
+        assert all(len(part["time"]) == len(part["usage"]) == 10 for part in sent)
+
+    def test_background_flush_error_is_raised(self) -> None:
+        """Test that an error from a background flush surfaces on close()."""
+        from arc_client.exceptions import ArcIngestionError
+
+        client = MagicMock()
+        client.write_columnar.side_effect = ArcIngestionError("boom")
+        buffer = BufferedWriter(client, batch_size=1, flush_interval=60.0, max_pending_flushes=2)
+
+        buffer.write_columns("cpu", {"time": [1]})
+        with pytest.raises(ArcIngestionError, match="boom"):
+            buffer.close()
+
+    def test_flushes_on_max_bytes(self) -> None:
+        """Test that wide records flush on estimated size before batch_size."""
+        client = MagicMock()
+        buffer = BufferedWriter(client, batch_size=1000, flush_interval=60.0, max_bytes=250)
+        record = {"measurement": "logs", "fields": {"msg": "x" * 100}, "timestamp": 1}
+
+        buffer.write(record)
+        client.write_columnar.assert_not_called()
+        buffer.write(record)
+        buffer.write(record)
+        client.write_columnar.assert_called_once()
+        assert buffer.pending_count == 0
+
+        buffer.write_columns("cpu", {"time": list(range(30))})
+        client.write_columnar.assert_called_with("cpu", {"time": list(range(30))})
+
+    def test_timer_thread_flushes_on_interval(self) -> None:
+        """Test that the context-manager timer thread flushes without further writes."""
+        import threading
+
+        flushed = threading.Event()
+        client = MagicMock()
+        client.write_columnar.side_effect = lambda *args: flushed.set()
+        with BufferedWriter(client, batch_size=100, flush_interval=0.05) as buffer:
+            buffer.write({"measurement": "cpu", "fields": {"usage": 1.0}})
+            assert flushed.wait(timeout=2)
+            assert buffer.pending_count == 0
+        assert buffer._timer is None
+        client.write_columnar.assert_called_once()
+
+    def test_zero_flush_interval_flushes_every_write(self) -> None:
+        """Test that flush_interval=0 starts no timer and flushes on each write."""
+        client = MagicMock()
+        with BufferedWriter(client, batch_size=10, flush_interval=0) as buffer:
+            assert buffer._timer is None
+            buffer.write({"measurement": "cpu", "timestamp": 1, "fields": {"usage": 1.0}})
+            assert buffer.pending_count == 0
+            buffer.write_columns("cpu", {"time": [2]})
+            assert buffer.pending_count == 0
+        assert client.write_columnar.call_count == 2
+
+    def test_concurrent_writers_to_different_measurements(self) -> None:
+        """Test that records from parallel producers are all sent, in order per measurement."""
+        import threading
+
+        sent: dict[str, list[int]] = {}
+        client = MagicMock()
+        client.write_columnar.side_effect = lambda m, columns: sent.setdefault(m, []).extend(
+            columns["time"]
+        )
+        buffer = BufferedWriter(client, batch_size=50, flush_interval=60.0)
+
+        def produce(measurement: str) -> None:
+            for i in range(1000):
+                buffer.write({"measurement": measurement, "timestamp": i, "fields": {"v": 1}})
+
+        threads = [threading.Thread(target=produce, args=(f"m{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        buffer.close()
+
+        assert sorted(sent) == ["m0", "m1", "m2", "m3"]
+        assert all(times == list(range(1000)) for times in sent.values())
+        assert buffer.pending_count == 0
+
+    def test_flush_all_sends_every_measurement_before_raising(self) -> None:
+        """Test that one failing measurement doesn't drop the others on flush()."""
+        from arc_client.exceptions import ArcIngestionError
+
+        def write(measurement: str, columns: dict[str, list[int]]) -> None:
+            if measurement == "bad":
+                raise ArcIngestionError("boom")
+
+        client = MagicMock()
+        client.write_columnar.side_effect = write
+        buffer = BufferedWriter(client, batch_size=100, flush_interval=60.0)
+        buffer.write_columns("bad", {"time": [1]})
+        buffer.write_columns("good", {"time": [2]})
+
+        with pytest.raises(ArcIngestionError, match="boom"):
+            buffer.flush()
+        assert sorted(c.args[0] for c in client.write_columnar.call_args_list) == ["bad", "good"]
+
+    def test_close_tears_down_when_final_flush_fails(self) -> None:
+        """Test that close() still marks the buffer closed when the final flush fails."""
+        from arc_client.exceptions import ArcIngestionError
+
+        client = MagicMock()
+        client.write_columnar.side_effect = ArcIngestionError("boom")
+        buffer = BufferedWriter(client, batch_size=100, flush_interval=60.0)
+        buffer.__enter__()
+        buffer.write_columns("cpu", {"time": [1]})
+
+        with pytest.raises(ArcIngestionError, match="boom"):
+            buffer.close()
+        assert buffer._closed
+        assert buffer._timer is None
+
+        buffer.close()
+        assert client.write_columnar.call_count == 1
+
+    def test_row_writer_stages_positional_values(self) -> None:
+        """Test that a row writer shares staging and flushing with write()."""
+        client = MagicMock()
+        buffer = BufferedWriter(client, batch_size=3, flush_interval=60.0)
+        write_cpu = buffer.row_writer("cpu", ("time", "usage", "host"))
+
+        write_cpu(1, 1.0, "a")
+        buffer.write(
+            {"measurement": "cpu", "timestamp": 2, "fields": {"usage": 2.0}, "tags": {"host": "b"}}
+        )
+        write_cpu(3, 3.0, "c")
+
+        client.write_columnar.assert_called_once_with(
+            "cpu", {"time": [1, 2, 3], "usage": [1.0, 2.0, 3.0], "host": ["a", "b", "c"]}
+        )
+        with pytest.raises(ValueError, match="Expected 3 values"):
+            write_cpu(4, 4.0)
+        with pytest.raises(ValueError, match="'time'"):
+            buffer.row_writer("cpu", ("usage",))
+
+    def test_batch_size_adapts_per_measurement(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that batch sizes follow write rate times flush latency, within bounds."""
+        import time
+        from types import SimpleNamespace
+
+        from arc_client.ingestion import buffered
+
+        # Each clock read takes 1us and each flush 10ms, whatever the machine's speed
+        now = [0.0]
+
+        def monotonic() -> float:
+            now[0] += 1e-6
+            return now[0]
+
+        def write_columnar(*args: object) -> None:
+            now[0] += 0.01
+
+        monkeypatch.setattr(
+            buffered, "time", SimpleNamespace(monotonic=monotonic, time_ns=time.time_ns)
+        )
+        client = MagicMock()
+        client.write_columnar.side_effect = write_columnar
+        buffer = BufferedWriter(client, batch_size=10, flush_interval=60.0, max_batch=1000)
+
+        for i in range(100):
+            buffer.write({"measurement": "cpu", "timestamp": i, "fields": {"v": 1.0}})
+        buffer.write({"measurement": "mem", "timestamp": 0, "fields": {"v": 1.0}})
+
+        # Fast producer against a 10ms flush: clamped to max_batch
+        assert buffer.batch_sizes == {"cpu": 1000}
+
+        fixed = BufferedWriter(MagicMock(), batch_size=10, flush_interval=60.0)
+        for i in range(30):
+            fixed.write({"measurement": "cpu", "timestamp": i, "fields": {"v": 1.0}})
+        assert fixed.batch_sizes == {}
+
+
+class TestMergeColumnar:
+    """Tests for merging staged columnar batches."""
+
+    def test_column_order_and_padding(self) -> None:
+        """Test that columns keep first-seen order and sparse gaps are None."""
+        from arc_client.ingestion.buffered import merge_columnar
+
+        merged = merge_columnar(
+            [
+                {"time": [1, 2], "usage": [1.0, 2.0]},
+                {"time": [3], "host": ["a"]},
+            ]
+        )
+
+        assert list(merged) == ["time", "usage", "host"]
+        assert merged["usage"] == [1.0, 2.0, None]
+        assert merged["host"] == [None, None, "a"]
+
+
+class TestAsyncBufferedWriter:
+    """Tests for AsyncBufferedWriter."""
+
+    async def test_write_columns_flushes_on_close(self) -> None:
+        """Test that staged chunks are flushed when the writer closes."""
+        client = MagicMock()
+        client.write_columnar = AsyncMock()
+
+        async with AsyncBufferedWriter(client, batch_size=100, flush_interval=60.0) as buffer:
+            await buffer.write_columns("cpu", {"time": [1, 2], "usage": [1.0, 2.0]})
+            await buffer.write_columns("cpu", {"time": [3], "usage": [3.0]})
+            assert buffer.pending_count == 3
+
+        client.write_columnar.assert_awaited_once()
+        measurement, columns = client.write_columnar.call_args.args
+        assert measurement == "cpu"
+        assert columns["time"] == [1, 2, 3]
+
+    async def test_batch_size_fixed_by_default(self) -> None:
+        """Test that the batch size does not adapt without bounds."""
+        client = MagicMock()
+        client.write_columnar = AsyncMock()
+
+        buffer = AsyncBufferedWriter(client, batch_size=2, flush_interval=60.0)
+        await buffer.write_columns("cpu", {"time": [1, 2], "usage": [1.0, 2.0]})
+        assert client.write_columnar.await_count == 1
+        assert buffer.batch_size == 2
+
+    async def test_batch_size_grows_on_fast_flushes(self) -> None:
+        """Test that fast flushes grow the batch size up to max_batch."""
+        client = MagicMock()
+        client.write_columnar = AsyncMock()
+
+        buffer = AsyncBufferedWriter(client, batch_size=2, flush_interval=60.0, max_batch=5)
+        for _ in range(3):
+            await buffer.write_columns("cpu", {"time": list(range(8))})
+        assert buffer.batch_size == 5
+
+    async def test_batch_size_shrinks_when_saturated(self) -> None:
+        """Test that the batch size halves once max_concurrent is reached."""
+        client = MagicMock()
+        buffer = AsyncBufferedWriter(
+            client, batch_size=8, flush_interval=60.0, min_batch=2, max_concurrent=1
+        )
+        buffer._adapt_batch_size(rtt=0.01, in_flight=1)
+        buffer._adapt_batch_size(rtt=0.01, in_flight=1)
+        buffer._adapt_batch_size(rtt=0.01, in_flight=1)
+        assert buffer.batch_size == 2
+
+    async def test_batch_size_shrinks_on_slow_flushes(self) -> None:
+        """Test that round trips slower than flush_interval halve the batch size."""
+        client = MagicMock()
+        buffer = AsyncBufferedWriter(client, batch_size=8, flush_interval=1.0, min_batch=2)
+        buffer._adapt_batch_size(rtt=2.0, in_flight=1)
+        assert buffer.batch_size == 4
+        buffer._adapt_batch_size(rtt=2.0, in_flight=1)
+        assert buffer.batch_size == 2
+
+    async def test_background_flushes_are_bounded(self) -> None:
+        """Test that writers wait once max_pending_flushes are in flight."""
+        import asyncio
+
+        release = asyncio.Event()
+        in_flight = 0
+        peak = 0
+
+        async def slow_write(measurement: str, columns: dict[str, list[int]]) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await release.wait()
+            in_flight -= 1
+
+        client = MagicMock()
+        client.write_columnar = AsyncMock(side_effect=slow_write)
+        buffer = AsyncBufferedWriter(
+            client, batch_size=1, flush_interval=60.0, max_pending_flushes=2
+        )
+
+        producer = asyncio.gather(*(buffer.write_columns("cpu", {"time": [i]}) for i in range(5)))
+        await asyncio.sleep(0.01)
+        assert peak == 2
+        assert not producer.done()
+
+        release.set()
+        await producer
+        await buffer.close()
+        assert client.write_columnar.await_count == 5
+
+    async def test_background_flush_error_is_raised(self) -> None:
+        """Test that an error from a background flush surfaces on flush()."""
+        from arc_client.exceptions import ArcIngestionError
+
+        client = MagicMock()
+        client.write_columnar = AsyncMock(side_effect=ArcIngestionError("boom"))
+        buffer = AsyncBufferedWriter(
+            client, batch_size=1, flush_interval=60.0, max_pending_flushes=2
+        )
+
+        await buffer.write_columns("cpu", {"time": [1]})
+        with pytest.raises(ArcIngestionError, match="boom"):
+            await buffer.flush()
+
+    async def test_timer_flushes_on_interval(self) -> None:
+        """Test that the context-manager timer flushes without further writes."""
+        import asyncio
+
+        client = MagicMock()
+        client.write_columnar = AsyncMock()
+        async with AsyncBufferedWriter(client, batch_size=100, flush_interval=0.05) as buffer:
+            await buffer.write({"measurement": "cpu", "fields": {"usage": 1.0}})
+            await asyncio.sleep(0.2)
+            client.write_columnar.assert_awaited_once()
+            assert buffer.pending_count == 0
+
+    async def test_zero_flush_interval_does_not_block_loop(self) -> None:
+        """Test that flush_interval=0 starts no timer and flushes on each write."""
+        import asyncio
+
+        client = MagicMock()
+        client.write_columnar = AsyncMock()
+        async with AsyncBufferedWriter(client, batch_size=10, flush_interval=0) as buffer:
+            assert buffer._timer is None
+            await asyncio.wait_for(asyncio.sleep(0.01), timeout=1)
+            await buffer.write({"measurement": "cpu", "timestamp": 1, "fields": {"usage": 1.0}})
+            assert buffer.pending_count == 0
+            await buffer.write_columns("cpu", {"time": [2]})
+            assert buffer.pending_count == 0
+        assert client.write_columnar.await_count == 2
+
+    async def test_flush_sends_measurements_concurrently(self) -> None:
+        """Test that one flush writes every measurement at the same time."""
+        import asyncio
+
+        started = asyncio.Event()
+        active = 0
+
+        async def write_columnar(measurement: str, columns: object) -> None:
+            nonlocal active
+            active += 1
+            if active == 2:
+                started.set()
+            await asyncio.wait_for(started.wait(), timeout=1)
+
+        client = MagicMock()
+        client.write_columnar = AsyncMock(side_effect=write_columnar)
+        buffer = AsyncBufferedWriter(client, batch_size=100, flush_interval=60.0)
+        await buffer.write_columns("cpu", {"time": [1]})
+        await buffer.write_columns("mem", {"time": [1]})
+
+        await buffer.flush()
+
+        assert client.write_columnar.await_count == 2
+
+    async def test_size_and_interval_flush_on_same_write_keep_records(self) -> None:
+        """Test that a size flush and an interval flush on one write both send."""
+        client = MagicMock()
+        client.write_columnar = AsyncMock()
+
+        for batch_size in (2, 4):
+            client.write_columnar.reset_mock()
+            buffer = AsyncBufferedWriter(client, batch_size=batch_size, flush_interval=0.0)
+            write_cpu = buffer.row_writer("cpu", ["time", "usage"])
+            for t in range(300):
+                await write_cpu(t, 1.0)
+            for t in range(300, 400, 2):
+                await buffer.write_columns("cpu", {"time": [t, t + 1], "usage": [1.0, 1.0]})
+            await buffer.close()
+
+            sent = [
+                t for call in client.write_columnar.call_args_list for t in call.args[1]["time"]
+            ]
+            assert sorted(sent) == list(range(400))
+
+    async def test_row_writer(self) -> None:
+        """Test that async row writers stage records and flush on close."""
+        client = MagicMock()
+        client.write_columnar = AsyncMock()
+        buffer = AsyncBufferedWriter(client, batch_size=100, flush_interval=60.0)
+        write_cpu = buffer.row_writer("cpu", ["time", "usage"])
+
+        await write_cpu(1, 1.0)
+        await write_cpu(2, 2.0)
+        await buffer.close()
+
+        client.write_columnar.assert_awaited_once_with("cpu", {"time": [1, 2], "usage": [1.0, 2.0]})
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from arc_client import ArcClient, AsyncArcClient, ClientConfig
 
+if TYPE_CHECKING:
+    from pytest_httpx import HTTPXMock
+
 
 class TestClientConfig:
     """Tests for ClientConfig."""
@@ -21,6 +26,36 @@ class TestClientConfig:
         assert config.compression is True
         assert config.ssl is False
         assert config.verify_ssl is True
+        assert config.compression_codec == "gzip"
+
+    def test_pool_limits_from_config(self) -> None:
+        """Test that pool settings are passed through to httpx.Limits."""
+        from arc_client.http.base import pool_limits
+
+        limits = pool_limits(ClientConfig(pool_max_connections=8, pool_keepalive_expiry=90.0))
+        assert limits.max_connections == 8
+        assert limits.max_keepalive_connections == 32
+        assert limits.keepalive_expiry == 90.0
+
+    def test_explicit_http2_requires_h2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that http2=True fails clearly when h2 is missing."""
+        from arc_client.http import base
+
+        monkeypatch.setattr(base, "http2_available", lambda: False)
+        assert base.use_http2(ClientConfig()) is False
+        assert base.use_http2(ClientConfig(http2=False)) is False
+        with pytest.raises(ImportError, match="arc-tsdb-client\\[http2\\]"):
+            base.use_http2(ClientConfig(http2=True))
+
+    def test_http2_versions(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that auto mode needs TLS and explicit plain-http HTTP/2 uses h2c."""
+        from arc_client.http import base
+
+        monkeypatch.setattr(base, "http2_available", lambda: True)
+        assert base.http_versions(ClientConfig()) == (True, False)
+        assert base.http_versions(ClientConfig(ssl=True)) == (True, True)
+        assert base.http_versions(ClientConfig(http2=True)) == (False, True)
+        assert base.http_versions(ClientConfig(ssl=True, http2=True)) == (True, True)
 
     def test_base_url_http(self) -> None:
         """Test base URL generation for HTTP."""
@@ -34,12 +69,91 @@ class TestClientConfig:
 
     def test_config_immutable(self) -> None:
         """Test that config is immutable."""
-        from pydantic import ValidationError
+        from dataclasses import FrozenInstanceError
 
         config = ClientConfig()
-        with pytest.raises(ValidationError):
+        with pytest.raises(FrozenInstanceError):
             config.host = "other"  # type: ignore
 
+    def test_from_dict_ignores_unknown_keys(self) -> None:
+        """Test building a config from a mapping."""
+        config = ClientConfig.from_dict({"host": "example.com", "port": 9000, "extra": 1})
+        assert config.base_url == "http://example.com:9000"
+
+
+class TestHTTPClientBase:
+    """Tests for shared request preparation."""
+
+    def test_base_headers_cached_and_not_mutated(self) -> None:
+        """Test that base headers are reused and extras don't leak into them."""
+        from arc_client.http.base import HTTPClientBase
+
+        http = HTTPClientBase(ClientConfig(token="t", database="db"))
+        plain = http._prepare_request_kwargs()
+        override = http._prepare_request_kwargs(headers={"x-arc-database": "other"})
+
+        assert plain["headers"] is http._base_headers
+        assert plain["headers"]["Authorization"] == "Bearer t"
+        assert override["headers"]["x-arc-database"] == "other"
+        assert http._base_headers["x-arc-database"] == "db"
+        assert "timeout" not in plain
+        assert http._prepare_request_kwargs(timeout=2.0)["timeout"] == 2.0
+
+    def test_shared_client_per_class_and_config(self) -> None:
+        """Test that shared() reuses one client per class and equal config."""
+        from arc_client.http.async_http import AsyncHTTPClient
+        from arc_client.http.sync_http import SyncHTTPClient
+        from arc_client.management.async_delete import AsyncDeleteClient
+        from arc_client.management.async_retention import AsyncRetentionClient
+
+        config = ClientConfig(token="t")
+        http = AsyncHTTPClient.shared(config)
+        assert AsyncHTTPClient.shared(ClientConfig(token="t")) is http
+        assert AsyncHTTPClient.shared(ClientConfig(token="other")) is not http
+        assert isinstance(SyncHTTPClient.shared(config), SyncHTTPClient)
+
+        delete = AsyncDeleteClient(AsyncHTTPClient.shared(config), config)
+        retention = AsyncRetentionClient(AsyncHTTPClient.shared(config), config)
+        assert delete._http is retention._http is http
+
+
+class TestLazyImports:
+    """Tests for deferred imports."""
+
+    def test_import_does_not_load_httpx(self) -> None:
+        """Test that importing the package defers httpx until a client needs it."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, arc_client, arc_client.ingestion, arc_client.http; "
+            "assert 'httpx' not in sys.modules; "
+            "arc_client.ingestion.WriteClient; "
+            "assert 'httpx' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_models_loaded_on_first_access(self) -> None:
+        """Test that each model module is only imported when one of its names is used."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, arc_client.models as models; "
+            "models.QueryResponse; "
+            "assert 'arc_client.models.query' in sys.modules; "
+            "assert 'arc_client.models.retention' not in sys.modules; "
+            "assert 'RetentionPolicy' in dir(models)"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown names still raise AttributeError."""
+        import arc_client.ingestion
+
+        with pytest.raises(AttributeError):
+            arc_client.ingestion.NotAThing  # noqa: B018
+
 
 class TestArcClient:
     """Tests for ArcClient."""
@@ -77,6 +191,28 @@ class TestArcClient:
         assert repr(client) == "ArcClient(host='example.com', port=9000)"
         client.close()
 
+    def test_ready_uses_head(self, httpx_mock: HTTPXMock) -> None:
+        """Test that ready() probes with HEAD and a short timeout."""
+        httpx_mock.add_response(method="HEAD", url="http://localhost:8000/ready")
+
+        with ArcClient() as client:
+            assert client.ready() is True
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.extensions["timeout"]["read"] == 2.0
+
+    def test_ready_falls_back_to_get_once(self, httpx_mock: HTTPXMock) -> None:
+        """Test that a 405 to HEAD switches ready() to GET for later probes."""
+        httpx_mock.add_response(method="HEAD", status_code=405)
+        httpx_mock.add_response(method="GET", is_reusable=True)
+
+        with ArcClient() as client:
+            assert client.ready() is True
+            assert client.ready() is True
+
+        assert [r.method for r in httpx_mock.get_requests()] == ["HEAD", "GET", "GET"]
+
 
 class TestAsyncArcClient:
     """Tests for AsyncArcClient."""
@@ -91,3 +227,106 @@ class TestAsyncArcClient:
         """Test async client string representation."""
         client = AsyncArcClient(host="example.com", port=9000)
         assert repr(client) == "AsyncArcClient(host='example.com', port=9000)"
+
+    async def test_ready_head_not_ready(self, httpx_mock: HTTPXMock) -> None:
+        """Test that a non-405 HEAD failure reports not ready without a GET."""
+        httpx_mock.add_response(method="HEAD", status_code=503)
+
+        async with AsyncArcClient() as client:
+            assert await client.ready() is False
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_async_subclients_are_lazy_and_cached(self) -> None:
+        """Test that sub-clients are created on first access and reused."""
+        from arc_client.ingestion.async_writer import AsyncWriteClient
+
+        client = AsyncArcClient()
+        write = client.write
+        assert isinstance(write, AsyncWriteClient)
+        assert client.write is write
+
+
+class TestAsyncBatch:
+    """Tests for batched management calls."""
+
+    async def test_batch_resolves_futures_in_order(self) -> None:
+        """Test that queued calls run on exit and resolve their futures."""
+        from unittest.mock import AsyncMock
+
+        import httpx
+
+        client = AsyncArcClient()
+        http = client._get_http()
+        http.get = AsyncMock(  # type: ignore[method-assign]
+            side_effect=[
+                httpx.Response(200, json={"policies": []}),
+                httpx.Response(200, json={"queries": []}),
+            ]
+        )
+
+        async with client.batch() as batch:
+            policies = batch.retention.list()
+            cqs = batch.continuous_queries.list()
+            assert len(batch) == 2
+            assert not policies.done()
+
+        assert policies.result() == []
+        assert cqs.result() == []
+        assert http.get.await_count == 2
+
+    async def test_batch_send_return_exceptions(self) -> None:
+        """Test that failures are reported per call."""
+        from arc_client.exceptions import ArcValidationError
+
+        client = AsyncArcClient()
+        batch = client.batch()
+        failed = batch.delete.delete("default", "logs", where="")
+
+        results = await batch.send(return_exceptions=True)
+
+        assert isinstance(results[0], ArcValidationError)
+        with pytest.raises(ArcValidationError):
+            failed.result()
+        with pytest.raises(ArcValidationError):
+            batch.delete.delete("default", "logs", where="")
+            await batch.send()
+
+
+class TestFastDecoders:
+    """Tests for the msgspec-backed response decoders."""
+
+    def test_decode_health(self) -> None:
+        """Test that health bodies decode to the public model."""
+        from arc_client.models._fast import decode_health
+        from arc_client.models.common import HealthResponse
+
+        health = decode_health(b'{"status": "ok", "version": "1.2.0"}')
+        assert isinstance(health, HealthResponse)
+        assert health.status == "ok"
+        assert health.uptime is None
+
+    def test_decode_verify_nested(self) -> None:
+        """Test that nested token info and datetimes are decoded."""
+        from datetime import datetime
+
+        from arc_client.models._fast import decode_verify
+        from arc_client.models.auth import TokenInfo
+
+        body = (
+            b'{"valid": true, "token_info": '
+            b'{"id": 1, "name": "t", "created_at": "2024-01-01T00:00:00Z"}}'
+        )
+        result = decode_verify(body)
+        assert isinstance(result.token_info, TokenInfo)
+        assert isinstance(result.token_info.created_at, datetime)
+
+    def test_decode_invalid_body_raises_validation_error(self) -> None:
+        """Test that invalid bodies fall back to pydantic's error."""
+        import pytest
+        from pydantic import ValidationError
+
+        from arc_client.models._fast import decode_health
+
+        with pytest.raises(ValidationError):
+            decode_health(b"{}")
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import pytest
 
-from arc_client.ingestion.compression import compress_gzip, decompress_gzip, is_gzipped
+from arc_client.ingestion.compression import (
+    compress_gzip,
+    compress_payload,
+    decompress_gzip,
+    is_gzipped,
+)
 
 
 class TestCompression:
@@ -19,6 +26,44 @@ class TestCompression:
         assert decompressed == original
         assert len(compressed) < len(original)
 
+    async def test_gzip_stream_round_trip(self) -> None:
+        """Test that streamed gzip chunks form one stream that decodes to the input."""
+        import os
+
+        from arc_client.ingestion.compression import compress_gzip_stream
+
+        original = os.urandom(200_000) + b"abc" * 100_000
+        chunks = [chunk async for chunk in compress_gzip_stream(original, chunk_size=16384)]
+
+        assert len(chunks) > 1
+        assert all(chunks)
+        assert decompress_gzip(b"".join(chunks)) == original
+
+    async def test_gzip_stream_compressed_off_the_loop(self) -> None:
+        """Test that every streamed gzip step runs in a worker thread."""
+        import os
+        import threading
+
+        from arc_client.ingestion import compression
+
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+        chunks = compression.iter_gzip
+
+        def record(*args: Any) -> Any:
+            for chunk in chunks(*args):
+                threads.append(threading.get_ident())
+                yield chunk
+
+        original = os.urandom(600_000)
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(compression, "iter_gzip", record)
+            body = [c async for c in compression.compress_gzip_stream(original)]
+
+        assert len(threads) == len(body) > 1
+        assert loop_thread not in threads
+        assert decompress_gzip(b"".join(body)) == original
+
     def test_is_gzipped_true(self) -> None:
         """Test detection of gzipped data."""
         data = compress_gzip(b"test data")
@@ -50,8 +95,88 @@ class TestCompression:
 
         assert len(level9) <= len(level0)
 
+    def test_gzip_stream_readable_by_gzip_module(self) -> None:
+        """Test that zlib-produced gzip output is a valid gzip member."""
+        import gzip
+
+        data = b"cpu,host=a usage=1.0\n" * 500
+        for level in (1, 6):
+            assert gzip.decompress(compress_gzip(data, level=level)) == data
+
+    def test_zlib_fallback_without_isal(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that gzip output is valid with and without ISA-L."""
+        import gzip
+
+        from arc_client.ingestion import compression
+
+        data = b"cpu,host=a usage=1.0\n" * 500
+        monkeypatch.setattr(compression, "_isal_zlib", None)
+        assert gzip.decompress(compression.compress_gzip(data)) == data
+
     def test_empty_data(self) -> None:
         """Test compression of empty data."""
         compressed = compress_gzip(b"")
         decompressed = decompress_gzip(compressed)
         assert decompressed == b""
+
+    def test_compress_payload_gzip(self) -> None:
+        """Test that the gzip codec produces gzip output."""
+        assert is_gzipped(compress_payload(b"test data", "gzip"))
+
+    def test_compress_payload_zstd(self) -> None:
+        """Test that the zstd codec round-trips."""
+        zstandard = pytest.importorskip("zstandard")
+
+        data = b"test data " * 1000
+        compressed = compress_payload(data, "zstd")
+        assert compressed[:4] == b"\x28\xb5\x2f\xfd"
+        assert zstandard.ZstdDecompressor().decompress(compressed) == data
+
+    def test_gzip_stream_packs_incrementally(self) -> None:
+        """Test that msgpack output written piecewise decodes as one payload."""
+        import gzip
+        import io
+
+        import msgpack
+
+        from arc_client.ingestion.compression import gzip_stream
+
+        packer = msgpack.Packer(use_bin_type=True)
+        buf = io.BytesIO()
+        with gzip_stream(buf) as out:
+            out.write(packer.pack_map_header(2))
+            out.write(packer.pack("time") + packer.pack(list(range(1000))))
+            out.write(packer.pack("host") + packer.pack(["a"] * 1000))
+
+        assert not buf.closed
+        body = msgpack.unpackb(gzip.decompress(buf.getvalue()), raw=False)
+        assert body == {"time": list(range(1000)), "host": ["a"] * 1000}
+
+    def test_looks_compressible(self) -> None:
+        """Test that only large, random-looking payloads are flagged."""
+        import os
+
+        from arc_client.ingestion.compression import _PROBE_MIN_BYTES, looks_compressible
+
+        assert looks_compressible(os.urandom(_PROBE_MIN_BYTES - 1))
+        assert not looks_compressible(os.urandom(_PROBE_MIN_BYTES))
+        assert looks_compressible(b"cpu,host=a usage=1\n" * 10_000)
+
+    def test_zstd_compressor_reused_per_level(self) -> None:
+        """Test that repeated zstd calls reuse one compressor and stay decodable."""
+        zstandard = pytest.importorskip("zstandard")
+        from arc_client.ingestion.compression import _zstd_compressor, compress_zstd, is_zstd
+
+        assert _zstd_compressor(3) is _zstd_compressor(3)
+        assert _zstd_compressor(3) is not _zstd_compressor(9)
+        for size in (10, 5000, 200):
+            data = b"abc" * size
+            compressed = compress_zstd(data)
+            assert is_zstd(compressed)
+            assert zstandard.ZstdDecompressor().decompress(compressed) == data
+        assert not is_zstd(b"\x1f\x8b\x08\x00")
+
+    def test_compress_payload_unknown_codec(self) -> None:
+        """Test that unknown codecs are rejected."""
+        with pytest.raises(ValueError, match="Unsupported compression codec"):
+            compress_payload(b"test", "brotli")
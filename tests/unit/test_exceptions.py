@@ -70,3 +70,27 @@ class TestExceptions:
         """Test ArcServerError without status code."""
         error = ArcServerError("server error")
         assert error.status_code is None
+
+
+class TestHandleResponseError:
+    """Tests for mapping HTTP error responses to exceptions."""
+
+    def test_json_error_message(self) -> None:
+        """Test that the error field of a JSON body is used as the message."""
+        import httpx
+        import pytest
+
+        from arc_client.http.base import handle_response_error
+
+        with pytest.raises(ArcNotFoundError, match="no such policy"):
+            handle_response_error(httpx.Response(404, json={"error": "no such policy"}))
+
+    def test_non_json_body_falls_back_to_text(self) -> None:
+        """Test that a non-JSON body is reported as plain text."""
+        import httpx
+        import pytest
+
+        from arc_client.http.base import handle_response_error
+
+        with pytest.raises(ArcServerError, match="Bad Gateway"):
+            handle_response_error(httpx.Response(502, text="Bad Gateway"))
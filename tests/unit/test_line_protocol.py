@@ -95,6 +95,20 @@ class TestFormatLineProtocol:
         )
         assert r"host\=name=server\,01" in line
 
+    def test_tag_sets_cached_independent_of_order(self) -> None:
+        """Test that cached tag sets still sort keys and skip empty values."""
+        from arc_client.ingestion.line_protocol import _format_tags
+
+        first = format_line_protocol("cpu", {"v": 1.0}, {"region": "us east", "host": "a"})
+        second = format_line_protocol(
+            "cpu", {"v": 1.0}, {"host": "a", "region": "us east", "x": ""}
+        )
+        assert first == second == r"cpu,host=a,region=us\ east v=1.0"
+
+        hits = _format_tags.cache_info().hits
+        format_line_protocol("cpu", {"v": 2.0}, {"region": "us east", "host": "a"})
+        assert _format_tags.cache_info().hits == hits + 1
+
     def test_empty_measurement_error(self) -> None:
         """Test that empty measurement raises error."""
         with pytest.raises(ArcValidationError, match="Measurement name cannot be empty"):
@@ -148,3 +162,48 @@ class TestFormatColumnarAsLines:
         """Test that empty columns raises error."""
         with pytest.raises(ArcValidationError, match="cannot be empty"):
             format_columnar_as_lines("cpu", {})
+
+    def test_matches_row_formatter(self) -> None:
+        """Test that missing values are skipped exactly as per-row formatting does."""
+        columns = {
+            "time": [1, None, 3],
+            "region": ["us east", None, ""],
+            "host": ["a", "b", "c"],
+            "usage": [1.5, None, None],
+            "count": [1, None, None],
+            "ok": [True, None, False],
+        }
+        lines = format_columnar_as_lines(
+            "c pu", columns, tag_columns=["region", "host"], time_unit="ms"
+        )
+
+        assert lines.split("\n") == [
+            format_line_protocol(
+                "c pu",
+                {"usage": 1.5, "count": 1, "ok": True},
+                {"region": "us east", "host": "a"},
+                1,
+                "ms",
+            ),
+            format_line_protocol("c pu", {"ok": False}, {"host": "c"}, 3, "ms"),
+        ]
+
+    def test_repeating_tag_values(self) -> None:
+        """Test that deduplicated tag columns format like unique ones."""
+        hosts = ["a b", "c", None, ""] * 100 + [1, True]
+        lines = format_columnar_as_lines(
+            "cpu", {"time": list(range(402)), "host": hosts, "v": [1.0] * 402}, ["host"]
+        ).split("\n")
+
+        assert lines[0] == r"cpu,host=a\ b v=1.0 0"
+        assert lines[2] == "cpu v=1.0 2000"
+        assert lines[-2:] == ["cpu,host=1 v=1.0 400000", "cpu,host=True v=1.0 401000"]
+
+    def test_numpy_columns(self) -> None:
+        """Test that NumPy integers are written as integer fields."""
+        np = pytest.importorskip("numpy")
+
+        lines = format_columnar_as_lines(
+            "cpu", {"time": np.array([1, 2]), "count": np.array([5, 6], dtype=np.int64)}
+        )
+        assert lines == "cpu count=5i 1000\ncpu count=6i 2000"
@@ -180,6 +180,23 @@ class TestRetentionExecution:
         assert execution.deleted_count == 5000
         assert execution.error_message is None
 
+    def test_execution_history_parsed_as_list(self) -> None:
+        """Test that a history list is validated into models in one call."""
+        from pydantic import ValidationError
+
+        from arc_client._fastjson import parse_list
+
+        rows = [
+            {"id": i, "policy_id": 1, "execution_time": "2024-01-01", "status": "ok"}
+            for i in range(3)
+        ]
+        executions = parse_list(rows, RetentionExecution)
+
+        assert [e.id for e in executions] == [0, 1, 2]
+        assert executions[0] == RetentionExecution(**rows[0])
+        with pytest.raises(ValidationError):
+            parse_list([{"id": "x"}], RetentionExecution)
+
 
 class TestContinuousQuery:
     """Tests for ContinuousQuery model."""
@@ -302,6 +319,28 @@ class TestCQExecution:
         assert execution.records_written == 50
         assert execution.error_message is None
 
+    def test_executions_decoded_from_body(self) -> None:
+        """Test that the history list is decoded straight from the response bytes."""
+        import json
+
+        from arc_client._fastjson import parse_list_field
+
+        row = {
+            "id": 1,
+            "query_id": 2,
+            "execution_id": "e",
+            "execution_time": "t",
+            "status": "completed",
+            "start_time": "s",
+            "end_time": "e",
+        }
+        body = json.dumps({"success": True, "executions": [row, {**row, "id": 2}]}).encode()
+
+        executions = parse_list_field(body, "executions", CQExecution)
+        assert [e.id for e in executions] == [1, 2]
+        assert executions[0] == CQExecution(**row)
+        assert parse_list_field(b"{}", "executions", CQExecution) == []
+
 
 class TestDeleteClientValidation:
     """Tests for DeleteClient input validation."""
@@ -7,10 +7,13 @@ import pytest
 
 from arc_client.exceptions import ArcValidationError
 from arc_client.ingestion.msgpack import (
+    arrow_to_columnar,
+    dataframe_to_columnar,
     encode_batch,
     encode_columnar,
     encode_records,
     encode_single_record,
+    records_to_columnar,
 )
 
 
@@ -46,6 +49,20 @@ class TestEncodeColumnar:
         assert "time" in decoded["columns"]
         assert len(decoded["columns"]["time"]) == 2
 
+    def test_encode_columnar_numpy_columns(self) -> None:
+        """Test that NumPy array columns are encoded as plain values."""
+        np = pytest.importorskip("numpy")
+
+        columns = {
+            "time": np.array([1, 2], dtype=np.int64),
+            "usage": np.array([45.2, 47.8]),
+        }
+        data = encode_columnar("cpu", columns, time_unit="s")
+
+        decoded = msgpack.unpackb(data, raw=False)
+        assert decoded["columns"]["time"] == [1_000_000, 2_000_000]
+        assert decoded["columns"]["usage"] == [45.2, 47.8]
+
     def test_encode_columnar_time_unit_seconds(self) -> None:
         """Test timestamp normalization from seconds."""
         columns = {
@@ -70,6 +87,35 @@ class TestEncodeColumnar:
         # Should be converted to microseconds
         assert decoded["columns"]["time"] == [1633024800000000, 1633024801000000]
 
+    def test_long_time_columns_scaled_like_short_ones(self) -> None:
+        """Test that vectorised scaling matches the per-value conversion."""
+        np = pytest.importorskip("numpy")
+
+        from arc_client.ingestion.msgpack import _scale_times
+
+        ints = [1633024800 + i for i in range(100)]
+        floats = [1633024800.25 + i for i in range(100)]
+        for values in (ints, floats):
+            scaled = _scale_times(values, 1_000_000)
+            assert isinstance(scaled, np.ndarray)
+            assert scaled.tolist() == [int(t * 1_000_000) for t in values]
+
+        assert _scale_times([1, 2], 1000) == [1000, 2000]
+        data = encode_columnar("test", {"time": np.array(ints)}, time_unit="s")
+        assert msgpack.unpackb(data)["columns"]["time"] == [t * 1_000_000 for t in ints]
+
+    def test_time_scaling_out_of_int64_range_not_wrapped(self) -> None:
+        """Test that scaling which would overflow int64 keeps exact Python ints."""
+        np = pytest.importorskip("numpy")
+
+        from arc_client.ingestion.msgpack import _scale_times
+
+        big = 2**62
+        assert _scale_times(np.array([big], dtype=np.uint64), 1000) == [big * 1000]
+        assert _scale_times(np.array([2**63], dtype=np.uint64), 1) == [2**63]
+        assert _scale_times([big] * 40, 1_000_000) == [big * 1_000_000] * 40
+        assert _scale_times(np.array([1e16]), 1000) == [int(1e16 * 1000)]
+
     def test_encode_columnar_empty_measurement(self) -> None:
         """Test that empty measurement raises error."""
         with pytest.raises(ArcValidationError, match="Measurement name cannot be empty"):
@@ -96,6 +142,132 @@ class TestEncodeColumnar:
             encode_columnar("cpu", columns, time_unit="invalid")
 
 
+class TestColumnarEncoder:
+    """Tests for the cached per-schema columnar encoder."""
+
+    def test_matches_packing_the_payload(self) -> None:
+        """Test that the specialised encoder produces the packb bytes of the payload."""
+        from arc_client.ingestion.msgpack import _columnar_encoder
+
+        wide = {f"c{i}": [i, i + 1] for i in range(20)}
+        cases = [
+            ({"time": [1, 2], "host": ["a", "b"], "usage": [1.0, 2.0]}, "us", 1),
+            ({"time": [1, 2], "usage": [1.0, 2.0]}, "s", 1_000_000),
+            ({"time": [1, 2], **wide}, "ms", 1_000),
+        ]
+        for columns, time_unit, multiplier in cases:
+            expected = {**columns, "time": [t * multiplier for t in columns["time"]]}
+            reference = msgpack.packb({"m": "cpu", "columns": expected}, use_bin_type=True)
+            encoder = _columnar_encoder("cpu", tuple(columns), time_unit)
+            assert encoder.encode(columns) == reference
+            assert b"".join(encoder.parts(columns)) == reference
+
+    def test_encoder_cached_per_schema(self) -> None:
+        """Test that one encoder is reused per schema and generates missing time."""
+        from arc_client.ingestion.msgpack import _columnar_encoder
+
+        encoder = _columnar_encoder("cpu", ("usage",), "us")
+        assert _columnar_encoder("cpu", ("usage",), "us") is encoder
+
+        decoded = msgpack.unpackb(encoder.encode({"usage": [1.0, 2.0]}), raw=False)
+        assert list(decoded["columns"]) == ["usage", "time"]
+        assert len(decoded["columns"]["time"]) == 2
+
+        generated = msgpack.unpackb(
+            _columnar_encoder("cpu", ("usage",), "s").encode({"usage": [1.0]}), raw=False
+        )
+        assert generated["columns"]["time"][0] < 10**17  # not rescaled from seconds
+
+        with pytest.raises(ArcValidationError, match="same length"):
+            _columnar_encoder("cpu", ("usage", "other"), "us").encode(
+                {"usage": [1.0], "other": [1, 2]}
+            )
+        with pytest.raises(ArcValidationError, match="Invalid time_unit"):
+            _columnar_encoder("cpu", ("time",), "ns")
+
+    def test_numpy_columns_packed_like_lists(self) -> None:
+        """Test that directly packed NumPy columns match packing their lists."""
+        np = pytest.importorskip("numpy")
+        from arc_client.ingestion.msgpack import _columnar_encoder
+
+        for size in (100, 3):
+            usage = np.linspace(0.0, 1.0, size)
+            usage[1] = np.nan
+            columns = {
+                "time": np.arange(1_633_024_800_000_000, 1_633_024_800_000_000 + size),
+                "usage": usage,
+                "load": usage.astype(np.float32),
+                "count": np.arange(size) - 50,
+                "level": np.arange(size) % 100,
+                "port": np.full(size, 8080, dtype=np.uint16),
+                "up": np.arange(size) % 3 == 0,
+            }
+            lists = {name: values.tolist() for name, values in columns.items()}
+            encoder = _columnar_encoder("cpu", tuple(columns), "us")
+            assert encoder.encode(columns) == encode_columnar("cpu", lists)
+            assert b"".join(encoder.parts(columns)) == encoder.encode(columns)
+
+    def test_float32_precision(self) -> None:
+        """Test that f32 packs float fields as float32 but leaves time untouched."""
+        np = pytest.importorskip("numpy")
+
+        time = [1_633_024_800_000_000.0 + i for i in range(100)]
+        usage = [i / 3 for i in range(100)]
+        columns = {"time": time, "usage": usage, "host": ["a"] * 100, "count": list(range(100))}
+        single = encode_columnar("cpu", columns, float_precision="f32")
+
+        decoded = msgpack.unpackb(single, raw=False)["columns"]
+        assert decoded["time"] == time
+        assert decoded["usage"] == np.array(usage, dtype=np.float32).tolist()
+        assert decoded["host"] == columns["host"] and decoded["count"] == columns["count"]
+        assert len(encode_columnar("cpu", columns)) - len(single) == 4 * 100
+
+        arrays = {**columns, "usage": np.array(usage), "count": np.arange(100)}
+        assert encode_columnar("cpu", arrays, float_precision="f32") == single
+
+        with pytest.raises(ArcValidationError, match="Invalid float_precision"):
+            encode_columnar("cpu", columns, float_precision="f16")
+
+    def test_compressed_encoding_matches_compressing_afterwards(self) -> None:
+        """Test that fused encode+compress decodes to the encode_columnar payload."""
+        import gzip
+
+        from arc_client.ingestion.msgpack import encode_columnar_compressed
+
+        columns = {"time": list(range(5000)), "host": ["a", "b"] * 2500}
+        data = encode_columnar_compressed("cpu", columns, time_unit="s")
+        assert gzip.decompress(data) == encode_columnar("cpu", columns, "s")
+
+        zstandard = pytest.importorskip("zstandard")
+        data = encode_columnar_compressed("cpu", columns, codec="zstd")
+        decoded = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        assert decoded == encode_columnar("cpu", columns)
+
+
+class TestColumnValues:
+    """Tests for column conversion dispatch."""
+
+    def test_list_passes_through_and_tuple_is_copied(self) -> None:
+        """Test that lists are returned as-is and other iterables become lists."""
+        from arc_client.ingestion.msgpack import column_values
+
+        values = [1, 2]
+        assert column_values(values) is values
+        assert column_values((1, 2)) == [1, 2]
+
+    def test_array_types_are_registered(self) -> None:
+        """Test that array converters are resolved once per type."""
+        np = pytest.importorskip("numpy")
+        import pyarrow as pa
+
+        from arc_client.ingestion.msgpack import _call_tolist, column_values
+
+        assert column_values(np.arange(3)) == [0, 1, 2]
+        assert column_values(pa.array([1.5, None])) == [1.5, None]
+        assert column_values.dispatch(np.ndarray) is _call_tolist
+        assert column_values.dispatch(type(pa.array([1.5]))) is not column_values.registry[object]
+
+
 class TestEncodeRecords:
     """Tests for encode_records function."""
 
@@ -154,6 +326,48 @@ class TestEncodeRecords:
             encode_records([{"measurement": "cpu"}])
 
 
+class TestRecordsToColumnar:
+    """Tests for records_to_columnar function."""
+
+    def test_uniform_records_transposed(self) -> None:
+        """Test that uniform records become time, tag and field columns."""
+        records = [
+            {"measurement": "cpu", "timestamp": t, "tags": {"host": h}, "fields": {"usage": u}}
+            for t, h, u in [(1, "a", 1.0), (2, "b", 2.0)]
+        ]
+        # Key order within a record does not matter
+        records[1]["fields"] = {"usage": 2.0}
+
+        assert records_to_columnar(records) == (
+            "cpu",
+            {"time": [1, 2], "host": ["a", "b"], "usage": [1.0, 2.0]},
+        )
+
+    def test_non_uniform_records_rejected(self) -> None:
+        """Test that records needing the row format return None."""
+
+        def record(**overrides: object) -> dict[str, object]:
+            return {"measurement": "cpu", "timestamp": 1, "fields": {"usage": 1.0}, **overrides}
+
+        cases = [
+            [record(), record(measurement="mem")],
+            [record(), record(timestamp=None)],
+            [record(), {"measurement": "cpu", "fields": {"usage": 1.0}}],
+            [record(), record(fields={"idle": 1.0})],
+            [record(), record(fields={"usage": 1.0, "idle": 2.0})],
+            [record(), record(tags={"host": "a"})],
+            [record(tags={"host": "a"}), record(tags={"region": "a"})],
+            [record(tags={"usage": "a"})],
+            [record(fields={"time": 1})],
+            [record(tags={"host": "a"}), record(tags=None)],
+            [record(), record(fields=None)],
+            [record(fields=[("usage", 1.0)])],
+            [],
+        ]
+        for records in cases:
+            assert records_to_columnar(records) is None
+
+
 class TestEncodeSingleRecord:
     """Tests for encode_single_record function."""
 
@@ -190,3 +404,120 @@ class TestEncodeBatch:
         """Test that empty batch raises error."""
         with pytest.raises(ArcValidationError, match="cannot be empty"):
             encode_batch([])
+
+
+class TestDataFrameToColumnar:
+    """Tests for DataFrame and Arrow conversion."""
+
+    def test_arrow_numeric_columns_stay_numpy(self) -> None:
+        """Test that null-free numeric columns are returned as arrays."""
+        np = pytest.importorskip("numpy")
+        import pyarrow as pa
+
+        table = pa.table({"time": [1, 2], "usage": [1.5, None], "host": ["a", "b"]})
+        columns = arrow_to_columnar(table)
+
+        assert isinstance(columns["time"], np.ndarray)
+        assert columns["usage"] == [1.5, None]
+        assert columns["host"] == ["a", "b"]
+
+    def test_dictionary_and_tag_columns_decoded_via_codes(self) -> None:
+        """Test that categorical and tag columns decode to one object per value."""
+        pytest.importorskip("numpy")
+        import pyarrow as pa
+
+        hosts = pa.chunked_array([pa.array(["a", None, "a"]), pa.array(["b", "a"])])
+        table = pa.table(
+            {
+                "time": [1, 2, 3, 4, 5],
+                "host": hosts.dictionary_encode(),
+                "dc": ["x", "y", "x", "x", None],
+                "code": pa.array([7, 8, 7, 7, 8]).dictionary_encode(),
+            }
+        )
+        columns = arrow_to_columnar(table, tag_columns=["dc"])
+
+        assert columns["host"] == ["a", None, "a", "b", "a"]
+        assert columns["dc"] == ["x", "y", "x", "x", None]
+        assert columns["dc"][0] is columns["dc"][2]
+        assert columns["code"] == [7, 8, 7, 7, 8]
+
+    def test_arrow_timestamps_to_microseconds(self) -> None:
+        """Test that timestamp columns are converted to integer microseconds."""
+        import pyarrow as pa
+
+        ts = pa.array([1_000_000_000, 2_000_000_000], type=pa.timestamp("ns"))
+        batch = pa.RecordBatch.from_arrays([ts], names=["ts"])
+        columns = arrow_to_columnar(batch, time_column="ts")
+
+        assert list(columns["time"]) == [1_000_000, 2_000_000]
+
+    def test_pandas_datetime_column(self) -> None:
+        """Test that pandas frames are converted through Arrow."""
+        pd = pytest.importorskip("pandas")
+
+        df = pd.DataFrame(
+            {
+                "time": pd.to_datetime([1_000_000_000, 2_000_000_000], unit="ns"),
+                "host": ["a", "b"],
+                "value": [1.0, 2.0],
+            }
+        )
+        columns = dataframe_to_columnar(df, "cpu")
+
+        data = encode_columnar("cpu", columns)
+        decoded = msgpack.unpackb(data, raw=False)
+        assert decoded["columns"]["time"] == [1_000_000, 2_000_000]
+        assert decoded["columns"]["value"] == [1.0, 2.0]
+
+    def test_pandas_nan_float_column_keeps_nan(self) -> None:
+        """Test that NaN in a pandas float column is sent as NaN, not null."""
+        import math
+
+        import numpy as np
+
+        pd = pytest.importorskip("pandas")
+
+        df = pd.DataFrame({"time": [1, 2], "value": [1.0, float("nan")]})
+        columns = dataframe_to_columnar(df, "cpu")
+        assert isinstance(columns["value"], np.ndarray)
+
+        decoded = msgpack.unpackb(encode_columnar("cpu", columns), raw=False)
+        assert decoded["columns"]["value"][0] == 1.0
+        assert math.isnan(decoded["columns"]["value"][1])
+
+    def test_missing_time_column_names_dataframe(self) -> None:
+        """Test that a pandas frame without the time column is reported as a DataFrame."""
+        pd = pytest.importorskip("pandas")
+
+        df = pd.DataFrame({"ts": [1, 2], "value": [1.0, 2.0]})
+        with pytest.raises(ArcValidationError, match="not found in DataFrame"):
+            dataframe_to_columnar(df, "cpu")
+
+    def test_pandas_mixed_object_column_falls_back(self) -> None:
+        """Test that columns Arrow cannot type are still converted."""
+        pd = pytest.importorskip("pandas")
+
+        df = pd.DataFrame({"time": [1, 2], "mixed": [1, "a"]})
+        columns = dataframe_to_columnar(df, "cpu")
+        assert columns["mixed"] == [1, "a"]
+
+    def test_pandas_fallback_datetime_units(self) -> None:
+        """Test that the row-wise fallback converts any datetime unit to microseconds."""
+        pd = pytest.importorskip("pandas")
+
+        for unit in ("ns", "us", "s"):
+            times = pd.to_datetime(["2024-01-01", "2024-01-02"]).as_unit(unit).tz_localize("UTC")
+            df = pd.DataFrame({"time": times, "mixed": [1, "a"]})
+            columns = dataframe_to_columnar(df, "cpu")
+            assert columns["mixed"] == [1, "a"]
+            assert list(columns["time"]) == [1_704_067_200_000_000, 1_704_153_600_000_000]
+
+    def test_polars_datetime_column(self) -> None:
+        """Test that polars frames are converted through Arrow."""
+        pl = pytest.importorskip("polars")
+        from datetime import datetime, timezone
+
+        df = pl.DataFrame({"time": [datetime(2024, 1, 1, tzinfo=timezone.utc)], "value": [1.0]})
+        columns = dataframe_to_columnar(df, "cpu")
+        assert list(columns["time"]) == [1_704_067_200_000_000]
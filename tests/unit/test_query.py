@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from arc_client.exceptions import ArcValidationError
 from arc_client.models.query import EstimateResponse, MeasurementInfo, QueryResponse
 
+if TYPE_CHECKING:
+    from pytest_httpx import HTTPXMock
+
 
 class TestQueryResponse:
     """Tests for QueryResponse model."""
@@ -61,6 +66,30 @@ class TestQueryResponse:
         assert response.timestamp is None
         assert response.error is None
 
+    def test_columns_data(self) -> None:
+        """Test that rows are transposed to columns once and cached."""
+        response = QueryResponse(success=True, columns=["t", "h"], data=[[1, "a"], [2, "b"]])
+
+        assert response.columns_data == {"t": [1, 2], "h": ["a", "b"]}
+        assert response.columns_data is response.columns_data
+        assert "columns_data" not in response.model_dump()
+        assert QueryResponse(success=True, columns=["t"]).columns_data == {"t": []}
+
+    def test_query_response_rows_attached_as_decoded(self) -> None:
+        """Test that the envelope is validated and rows are kept as decoded."""
+        from pydantic import ValidationError
+
+        from arc_client.query.executor import query_response
+
+        rows = [[1, "a", 1.5], [2, "b", None]]
+        response = query_response({"success": True, "columns": ["t", "h", "v"], "data": rows})
+        assert response.data is rows
+        assert "data" in response.model_fields_set
+        assert query_response({"success": False, "error": "bad"}).data == []
+
+        with pytest.raises(ValidationError):
+            query_response({"columns": ["t"], "data": rows})
+
 
 class TestEstimateResponse:
     """Tests for EstimateResponse model."""
@@ -174,6 +203,17 @@ class TestQueryClientValidation:
         with pytest.raises(ArcValidationError, match="SQL query cannot be empty"):
             client.query_arrow("")
 
+    def test_empty_sql_arrow_stream_raises_on_call(self) -> None:
+        """Test that query_arrow_stream validates SQL before it is iterated."""
+        from unittest.mock import MagicMock
+
+        from arc_client.query.executor import QueryClient
+
+        client = QueryClient(MagicMock(), MagicMock())
+
+        with pytest.raises(ArcValidationError, match="SQL query cannot be empty"):
+            client.query_arrow_stream(" ")
+
 
 class TestAsyncQueryClientValidation:
     """Tests for AsyncQueryClient input validation."""
@@ -196,6 +236,29 @@ class TestAsyncQueryClientValidation:
         with pytest.raises(ArcValidationError, match="SQL query cannot be empty"):
             await client.query("   ")
 
+    @pytest.mark.asyncio
+    async def test_json_responses_decoded(self) -> None:
+        """Test that query, estimate and list_measurements decode the raw body."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        import httpx
+
+        from arc_client.query.async_executor import AsyncQueryClient
+
+        http = MagicMock()
+        client = AsyncQueryClient(http, MagicMock())
+
+        body = {"success": True, "columns": ["t"], "data": [[1], [2]], "row_count": 2}
+        http.post = AsyncMock(return_value=httpx.Response(200, json=body))
+        assert (await client.query("SELECT 1")).data == [[1], [2]]
+
+        http.post = AsyncMock(return_value=httpx.Response(200, json={"success": True}))
+        assert (await client.estimate("SELECT 1")).warning_level == "none"
+
+        measurements = {"measurements": [{"database": "db", "measurement": "cpu"}]}
+        http.get = AsyncMock(return_value=httpx.Response(200, json=measurements))
+        assert [m.measurement for m in await client.list_measurements()] == ["cpu"]
+
     @pytest.mark.asyncio
     async def test_empty_sql_estimate_raises_error(self) -> None:
         """Test that empty SQL in estimate raises validation error."""
@@ -225,3 +288,196 @@ class TestAsyncQueryClientValidation:
 
         with pytest.raises(ArcValidationError, match="SQL query cannot be empty"):
             await client.query_arrow("")
+
+    def test_empty_sql_arrow_stream_raises_on_call(self) -> None:
+        """Test that query_arrow_stream validates SQL before it is iterated."""
+        from unittest.mock import MagicMock
+
+        from arc_client.query.async_executor import AsyncQueryClient
+
+        client = AsyncQueryClient(MagicMock(), MagicMock())
+
+        with pytest.raises(ArcValidationError, match="SQL query cannot be empty"):
+            client.query_arrow_stream(" ")
+
+
+def _arrow_stream_bytes(table: object) -> bytes:
+    """Serialize a table as an Arrow IPC stream."""
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+
+    assert isinstance(table, pa.Table)
+    sink = pa.BufferOutputStream()
+    with ipc.new_stream(sink, table.schema) as writer:
+        for batch in table.to_batches(max_chunksize=100):
+            writer.write_batch(batch)
+    return bytes(sink.getvalue().to_pybytes())
+
+
+class TestArrowStream:
+    """Tests for streaming Arrow query results."""
+
+    def test_decoder_handles_arbitrary_chunking(self) -> None:
+        """Test that batches are decoded whatever the chunk boundaries."""
+        import pyarrow as pa
+
+        from arc_client.query._ipc import ArrowStreamDecoder
+
+        hosts = pa.array(["a", "b"] * 250).dictionary_encode()
+        table = pa.table({"time": list(range(500)), "host": hosts})
+        data = _arrow_stream_bytes(table)
+
+        for chunk_size in (1, 7, 1000, len(data)):
+            decoder = ArrowStreamDecoder()
+            batches = []
+            for start in range(0, len(data), chunk_size):
+                batches.extend(decoder.feed(data[start : start + chunk_size]))
+            decoder.close()
+            assert len(batches) == 5
+            assert pa.Table.from_batches(batches).to_pylist() == table.to_pylist()
+
+    def test_decoder_rejects_truncated_stream(self) -> None:
+        """Test that a truncated stream is reported on close()."""
+        import pyarrow as pa
+
+        from arc_client.query._ipc import ArrowStreamDecoder
+
+        data = _arrow_stream_bytes(pa.table({"time": [1, 2, 3]}))
+        decoder = ArrowStreamDecoder()
+        decoder.feed(data[:-20])
+        with pytest.raises(pa.ArrowInvalid):
+            decoder.close()
+
+    async def test_query_arrow_built_from_streamed_batches(self, httpx_mock: HTTPXMock) -> None:
+        """Test that query_arrow returns the whole table from a streamed body."""
+        import pyarrow as pa
+
+        from arc_client import ArcClient, AsyncArcClient
+
+        table = pa.table({"time": list(range(250)), "host": ["a", "b"] * 125})
+        for _ in range(2):
+            httpx_mock.add_response(
+                content=_arrow_stream_bytes(table),
+                headers={"content-type": "application/vnd.apache.arrow.stream"},
+            )
+
+        with ArcClient() as client:
+            assert client.query.query_arrow("SELECT * FROM cpu").equals(table)
+        async with AsyncArcClient() as async_client:
+            result = await async_client.query.query_arrow("SELECT * FROM cpu")
+            assert result.equals(table)
+
+    def test_fifo_reads_across_messages(self) -> None:
+        """Test that reads spanning pushed messages return the joined bytes."""
+        from arc_client.query._ipc import _Fifo
+
+        fifo = _Fifo()
+        fifo.push(b"abc")
+        fifo.push(b"defg")
+        assert bytes(fifo.read(2)) == b"ab"
+        assert bytes(fifo.read(3)) == b"cde"
+        assert bytes(fifo.read()) == b"fg"
+        assert bytes(fifo.read(4)) == b""
+
+    def test_query_arrow_stream(self, httpx_mock: HTTPXMock) -> None:
+        """Test that the sync client yields batches from the response."""
+        import pyarrow as pa
+
+        from arc_client import ArcClient
+
+        table = pa.table({"time": list(range(250))})
+        httpx_mock.add_response(
+            content=_arrow_stream_bytes(table),
+            headers={"content-type": "application/vnd.apache.arrow.stream"},
+        )
+        with ArcClient() as client:
+            batches = list(client.query.query_arrow_stream("SELECT * FROM cpu"))
+        assert [b.num_rows for b in batches] == [100, 100, 50]
+
+    def test_query_polars_stream(self, httpx_mock: HTTPXMock) -> None:
+        """Test that streamed batches are assembled into a Polars DataFrame."""
+        pl = pytest.importorskip("polars")
+        import pyarrow as pa
+
+        from arc_client import ArcClient
+
+        table = pa.table({"time": list(range(250)), "host": ["a"] * 250})
+        httpx_mock.add_response(
+            content=_arrow_stream_bytes(table),
+            headers={"content-type": "application/vnd.apache.arrow.stream"},
+        )
+        with ArcClient() as client:
+            df = client.query.query_polars_stream("SELECT * FROM cpu")
+        assert isinstance(df, pl.DataFrame)
+        assert df.shape == (250, 2)
+        assert df["time"].to_list() == list(range(250))
+
+    async def test_async_query_polars_stream_empty(self, httpx_mock: HTTPXMock) -> None:
+        """Test that an empty result keeps the schema."""
+        pytest.importorskip("polars")
+        import pyarrow as pa
+
+        from arc_client import AsyncArcClient
+
+        table = pa.table({"time": pa.array([], pa.int64()), "host": pa.array([], pa.string())})
+        httpx_mock.add_response(
+            content=_arrow_stream_bytes(table),
+            headers={"content-type": "application/vnd.apache.arrow.stream"},
+        )
+        async with AsyncArcClient() as client:
+            df = await client.query.query_polars_stream("SELECT * FROM cpu")
+        assert df.columns == ["time", "host"]
+        assert df.height == 0
+
+    async def test_async_query_arrow_stream_json_error(self, httpx_mock: HTTPXMock) -> None:
+        """Test that a JSON error body is raised as ArcQueryError."""
+        from arc_client import AsyncArcClient
+        from arc_client.exceptions import ArcQueryError
+
+        httpx_mock.add_response(json={"error": "bad sql"})
+        async with AsyncArcClient() as client:
+            with pytest.raises(ArcQueryError, match="bad sql"):
+                async for _ in client.query.query_arrow_stream("SELECT nope"):
+                    pass
+
+
+class TestDatabaseHeaders:
+    """Tests for per-query request headers."""
+
+    def test_constants_shared_without_database(self) -> None:
+        """Test that the shared headers are only copied when a database is set."""
+        from arc_client.query.executor import _ARROW_HEADERS, database_headers
+
+        assert database_headers(None) is None
+        assert database_headers(None, _ARROW_HEADERS) is _ARROW_HEADERS
+        assert database_headers("db") == {"x-arc-database": "db"}
+        assert database_headers("db", _ARROW_HEADERS) == {
+            "Accept": "application/vnd.apache.arrow.stream",
+            "x-arc-database": "db",
+        }
+        assert "x-arc-database" not in _ARROW_HEADERS
+
+
+class TestTableToPandas:
+    """Tests for Arrow to pandas conversion."""
+
+    def test_numpy_backed_by_default(self) -> None:
+        """Test that default conversion keeps NumPy dtypes."""
+        pytest.importorskip("pandas")
+        import pyarrow as pa
+
+        from arc_client.query.executor import table_to_pandas
+
+        df = table_to_pandas(pa.table({"time": [1, 2], "usage": [1.5, 2.5]}))
+        assert str(df["time"].dtype) == "int64"
+        assert df["usage"].tolist() == [1.5, 2.5]
+
+    def test_arrow_dtypes(self) -> None:
+        """Test that arrow_dtypes maps columns to pd.ArrowDtype."""
+        pd = pytest.importorskip("pandas")
+        import pyarrow as pa
+
+        from arc_client.query.executor import table_to_pandas
+
+        df = table_to_pandas(pa.table({"host": ["a", "b"]}), arrow_dtypes=True)
+        assert isinstance(df["host"].dtype, pd.ArrowDtype)
@@ -0,0 +1,275 @@
+"""Unit tests for write clients."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import msgpack
+import pytest
+
+from arc_client.config import ClientConfig
+from arc_client.exceptions import ArcValidationError
+from arc_client.ingestion.async_writer import AsyncWriteClient, _shard_columns
+from arc_client.ingestion.writer import WriteClient
+
+if TYPE_CHECKING:
+    from pytest_httpx import HTTPXMock
+
+
+class TestShardColumns:
+    """Tests for columnar sharding."""
+
+    def test_rows_with_same_key_stay_together(self) -> None:
+        """Test that each key lands in exactly one shard, in original order."""
+        columns = {
+            "time": [1, 2, 3, 4, 5, 6],
+            "host": ["a", "b", "a", "c", "b", "a"],
+            "value": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        }
+        parts = _shard_columns(columns, "host", 4)
+
+        assert sum(len(part["time"]) for part in parts) == 6
+        seen: dict[str, int] = {}
+        for index, part in enumerate(parts):
+            for host in part["host"]:
+                assert seen.setdefault(host, index) == index
+            assert part["time"] == sorted(part["time"])
+
+    def test_numpy_columns(self) -> None:
+        """Test that NumPy columns are reordered and sliced as arrays."""
+        np = pytest.importorskip("numpy")
+
+        columns = {"time": np.arange(4), "host": np.array(["a", "b", "a", "b"])}
+        parts = _shard_columns(columns, "host", 2)
+
+        assert all(isinstance(part["time"], np.ndarray) for part in parts)
+        assert sorted(np.concatenate([p["time"] for p in parts]).tolist()) == [0, 1, 2, 3]
+
+    def test_missing_shard_key(self) -> None:
+        """Test that a missing shard key column is rejected."""
+        with pytest.raises(ArcValidationError, match="Shard key"):
+            _shard_columns({"time": [1]}, "host", 2)
+
+
+class TestWriteClient:
+    """Tests for WriteClient."""
+
+    def test_write_dispatches_on_data_type(self) -> None:
+        """Test that write() picks line protocol, columnar or row format."""
+        import httpx
+
+        from arc_client.ingestion.writer import WriteClient
+
+        http = MagicMock()
+        http.post = MagicMock(return_value=httpx.Response(204))
+        client = WriteClient(http, ClientConfig(compression=False))
+
+        def sent() -> tuple[str, Any]:
+            kwargs = http.post.call_args.kwargs
+            path, body = http.post.call_args.args[0], kwargs["content"]
+            return path, body if path.endswith("line-protocol") else msgpack.unpackb(body)
+
+        client.write(["cpu usage=1", "cpu usage=2"])
+        assert sent() == ("/api/v1/write/line-protocol", b"cpu usage=1\ncpu usage=2")
+
+        client.write({"time": [1], "usage": [1.0]}, measurement="cpu")
+        assert sent()[1] == {"m": "cpu", "columns": {"time": [1], "usage": [1.0]}}
+
+        records = [{"measurement": "cpu", "timestamp": t, "fields": {"usage": 1.0}} for t in (1, 2)]
+        client.write(records)
+        assert sent()[1]["columns"]["time"] == [1, 2]
+
+        records[1]["measurement"] = "mem"
+        client.write(records)
+        assert [row["m"] for row in sent()[1]] == ["cpu", "mem"]
+
+        with pytest.raises(ArcValidationError, match="measurement is required"):
+            client.write({"time": [1]})
+        with pytest.raises(ArcValidationError, match="Unsupported"):
+            client.write(42, measurement="cpu")
+
+    def test_write_point_batched(self) -> None:
+        """Test that points are batched per point_batch_size and flushed on close."""
+        import httpx
+
+        from arc_client.ingestion.writer import WriteClient
+
+        http = MagicMock()
+        http.post = MagicMock(return_value=httpx.Response(204))
+        client = WriteClient(http, ClientConfig(compression=False, point_batch_size=3))
+
+        for t in range(4):
+            client.write_point("cpu", {"usage": float(t)}, {"host": "a"}, timestamp=t)
+        assert http.post.call_count == 1
+        body = msgpack.unpackb(http.post.call_args.kwargs["content"])
+        assert body["columns"] == {"time": [0, 1, 2], "usage": [0.0, 1.0, 2.0], "host": ["a"] * 3}
+
+        client.write_point("cpu", {"usage": 9.0}, database="other")
+        assert http.post.call_args.args[0] == "/api/v1/write/line-protocol"
+
+        client.close()
+        body = msgpack.unpackb(http.post.call_args.kwargs["content"])
+        assert body["columns"]["time"] == [3]
+
+    def test_large_gzip_bodies_streamed(self, httpx_mock: HTTPXMock) -> None:
+        """Test that large gzip bodies are sent chunked and decode to the input."""
+        import gzip
+
+        from arc_client.http.sync_http import SyncHTTPClient
+        from arc_client.ingestion import writer
+        from arc_client.ingestion.writer import WriteClient
+
+        httpx_mock.add_response(status_code=204)
+        httpx_mock.add_response(status_code=204)
+        config = ClientConfig()
+        http = SyncHTTPClient(config)
+        client = WriteClient(http, config)
+
+        lines = [f"cpu,host=h{i % 7} usage={i}" for i in range(100_000)]
+        client.write_line_protocol(lines)
+        client.write_line_protocol(lines[:1000])
+        http.close()
+
+        large, small = httpx_mock.get_requests()
+        assert large.headers["Transfer-Encoding"] == "chunked"
+        assert large.headers["Content-Encoding"] == "gzip"
+        body = gzip.decompress(large.read())
+        assert len(body) >= writer._STREAM_MIN_BYTES
+        assert body.decode().split("\n") == lines
+        assert "Transfer-Encoding" not in small.headers
+        assert gzip.decompress(small.read()).decode().split("\n") == lines[:1000]
+
+
+class TestWriteCompression:
+    """Tests for request body compression on writes."""
+
+    def test_zstd_codec_writes_zstd_encoding(self) -> None:
+        """Test that the configured codec sets Content-Encoding on writes."""
+        pytest.importorskip("zstandard")
+
+        http = MagicMock()
+        http.post.return_value = httpx.Response(204)
+        client = WriteClient(http, ClientConfig(compression_codec="zstd", compression_min_bytes=0))
+        client.write_columnar("cpu", {"time": [1], "usage": [1.0]})
+
+        headers = http.post.call_args.kwargs["headers"]
+        assert headers["Content-Encoding"] == "zstd"
+
+    def test_small_payloads_sent_uncompressed(self) -> None:
+        """Test that payloads under compression_min_bytes skip compression."""
+        http = MagicMock()
+        http.post.return_value = httpx.Response(204)
+        client = WriteClient(http, ClientConfig(compression_min_bytes=64))
+
+        client.write_line_protocol("cpu usage=1")
+        assert "Content-Encoding" not in http.post.call_args.kwargs["headers"]
+
+        client.write_line_protocol("cpu usage=1\n" * 100)
+        assert http.post.call_args.kwargs["headers"]["Content-Encoding"] == "gzip"
+
+
+class TestAsyncWriteClient:
+    """Tests for AsyncWriteClient."""
+
+    async def test_write_columnar_sharded(self) -> None:
+        """Test that one request is sent per non-empty shard."""
+        import httpx
+
+        http = MagicMock()
+        http.post = AsyncMock(return_value=httpx.Response(204))
+        client = AsyncWriteClient(http, ClientConfig(compression=False))
+
+        await client.write_columnar_sharded(
+            "cpu",
+            {"time": [1, 2, 3], "host": ["a", "a", "a"], "value": [1.0, 2.0, 3.0]},
+            shard_key="host",
+        )
+
+        http.post.assert_awaited_once()
+        body = msgpack.unpackb(http.post.call_args.kwargs["content"], raw=False)
+        assert body["columns"]["time"] == [1, 2, 3]
+
+    async def test_write_point_batched(self) -> None:
+        """Test that points are buffered per point_batch_size until close."""
+        import httpx
+
+        http = MagicMock()
+        http.post = AsyncMock(return_value=httpx.Response(204))
+        client = AsyncWriteClient(http, ClientConfig(compression=False, point_batch_size=10))
+
+        await client.write_point("cpu", {"usage": 1.0}, timestamp=1)
+        await client.write_point("cpu", {"usage": 2.0}, timestamp=2)
+        http.post.assert_not_awaited()
+
+        await client.close()
+        body = msgpack.unpackb(http.post.call_args.kwargs["content"])
+        assert body["columns"] == {"time": [1, 2], "usage": [1.0, 2.0]}
+
+    async def test_transport_errors_wrapped_and_status_checked(self) -> None:
+        """Test that post failures and unexpected statuses raise ArcIngestionError."""
+        import httpx
+
+        from arc_client.exceptions import ArcIngestionError, ArcServerError
+
+        http = MagicMock()
+        client = AsyncWriteClient(http, ClientConfig(compression=False))
+
+        http.post = AsyncMock(side_effect=ArcServerError("down", status_code=503))
+        with pytest.raises(ArcIngestionError, match="Failed to write data: down"):
+            await client.write_line_protocol("cpu usage=1")
+
+        http.post = AsyncMock(return_value=httpx.Response(202, text="queued"))
+        with pytest.raises(ArcIngestionError, match="status 202"):
+            await client.write_line_protocol("cpu usage=1")
+
+    async def test_large_bodies_compressed_in_thread(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that only bodies above the offload threshold leave the loop thread."""
+        import asyncio
+        import gzip
+
+        from arc_client.ingestion import async_writer
+
+        calls: list[int] = []
+        to_thread = asyncio.to_thread
+
+        async def record(func: Any, data: bytes, *args: Any) -> Any:
+            calls.append(len(data))
+            return await to_thread(func, data, *args)
+
+        monkeypatch.setattr(async_writer.asyncio, "to_thread", record)
+        client = AsyncWriteClient(MagicMock(), ClientConfig())
+
+        small = b"x" * 2000
+        body, encoding = await client._compress(small, None)
+        assert calls == [] and encoding == "gzip"
+
+        large = b"x" * async_writer._OFFLOAD_MIN_BYTES
+        body, encoding = await client._compress(large, None)
+        assert calls == [len(large)]
+        assert gzip.decompress(body) == large
+
+    async def test_large_gzip_bodies_streamed(self, httpx_mock: HTTPXMock) -> None:
+        """Test that large gzip bodies are sent chunked and decode to the input."""
+        import gzip
+
+        from arc_client.http.async_http import AsyncHTTPClient
+        from arc_client.ingestion import async_writer
+
+        httpx_mock.add_response(status_code=204)
+        config = ClientConfig()
+        http = AsyncHTTPClient(config)
+        client = AsyncWriteClient(http, config)
+
+        lines = [f"cpu,host=h{i % 7} usage={i}" for i in range(100_000)]
+        await client.write_line_protocol(lines)
+        await http.close()
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.headers["Transfer-Encoding"] == "chunked"
+        assert request.headers["Content-Encoding"] == "gzip"
+        body = gzip.decompress(request.read())
+        assert len(body) >= async_writer._STREAM_MIN_BYTES
+        assert body.decode().split("\n") == lines